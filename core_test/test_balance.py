@@ -0,0 +1,57 @@
+'''Module to test the Monte Carlo Balance Runner; run from the top level directory'''
+import unittest
+from src.balance import (run_matchup, run_balance, build_tasks, character_classes,
+                         format_errors, MatchupStats)
+from src.encounter_helpers import possible_monsters
+from src.characters import Fighter
+from src.monsters.beast_src import Drake
+from src.monsters.elemental_src import FireElemental
+
+
+class TestBalance(unittest.TestCase):
+    '''Class to test the Balance Runner'''
+    def test_seeded_matchup(self):
+        '''The same seed reproduces the same statistics'''
+        task = (Fighter, Drake, 5, 10, "seed")
+        self.assertEqual(run_matchup(task), run_matchup(task))
+
+    def test_merge(self):
+        '''Merging adds counts for the same matchup'''
+        stats = MatchupStats("Fighter", "Drake", 5, fights=4, wins=3, win_turns=12)
+        merged = stats.merge(stats)
+        self.assertEqual(merged.fights, 8)
+        self.assertEqual(merged.wins, 6)
+        self.assertEqual(merged.time_to_kill, 4)
+        self.assertEqual(merged.win_rate, 0.75)
+
+    def test_errors_reported(self):
+        '''Fights that raise keep their first traceback, or raise when strict'''
+        task = (Fighter, FireElemental, 5, 3, "seed")
+        stats = run_matchup(task)
+        self.assertEqual(stats.errors, 3)
+        self.assertIn("Traceback", stats.first_error)
+        self.assertEqual(stats.merge(MatchupStats("Fighter", "FireElemental", 5)).first_error,
+                         stats.first_error)
+        report = format_errors({("Fighter", "FireElemental", 5): stats})
+        self.assertIn("Fighter vs FireElemental at level 5: 3 error(s)", report)
+        self.assertIn(stats.first_error, report)
+        with self.assertRaises(Exception):
+            run_matchup(task, strict=True)
+
+    def test_build_tasks(self):
+        '''Every class x monster x level matchup gets a task per chunk'''
+        tasks = build_tasks(range(1, 3), fights=75, seed=0, chunk_size=50)
+        self.assertEqual(len(tasks),
+                         2 * len(character_classes) * len(possible_monsters) * 2)
+        self.assertEqual(len({task[4] for task in tasks}), len(tasks))
+
+    def test_run_balance(self):
+        '''The pool merges all matchups into one table'''
+        table = run_balance([1], fights=2, processes=2)
+        self.assertEqual(len(table), len(character_classes) * len(possible_monsters))
+        for stats in table.values():
+            self.assertEqual(stats.fights, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
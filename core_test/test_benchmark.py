@@ -0,0 +1,88 @@
+'''Module to test the Benchmark Suite; run from the top level directory'''
+import os
+import tempfile
+import unittest
+from src.benchmark import (Case, Measurement, measure, run_suite, compare, format_report,
+                           load_baseline, load_baseline_errors, save_baseline,
+                           BASELINE_FILE, MONSTER_LEVELS)
+from src.balance import character_classes
+from src.encounter_helpers import possible_monsters
+
+
+class TestBenchmark(unittest.TestCase):
+    '''Class to test the Benchmark Cases and the Baseline Comparison'''
+    def test_measure(self):
+        '''Rates count every Unit a Call Does; Errors are Reported, not Raised'''
+        measurement = measure(Case("sum", "items", lambda: sum(range(10)), 10), 0.001, 2)
+        self.assertEqual(measurement.error, "")
+        self.assertGreater(measurement.rate, 0)
+        failing = measure(Case("fail", "items", lambda: {}["missing"]), 0.001, 2)
+        self.assertEqual(failing, Measurement("fail", "items", error="KeyError"))
+        seeds = iter(range(3))
+        lucky = measure(Case("lucky", "items", lambda: 1 // (next(seeds) % 3), checks=3),
+                        0.001, 2)
+        self.assertEqual(lucky.error, "ZeroDivisionError")
+
+    def test_suite_covers_every_case(self):
+        '''Every Pair, Class, Monster Level, Render and Round Trip is Measured'''
+        names = [measurement.name for measurement in run_suite(min_time=0, repeat=1)]
+        self.assertEqual(len(names), len(set(names)))
+        self.assertEqual(sum(name.startswith("fight.") for name in names),
+                         len(character_classes) * len(possible_monsters))
+        self.assertEqual(sum(name.startswith("monster.") for name in names),
+                         len(possible_monsters) * len(MONSTER_LEVELS))
+        for name in ("render.encounter", "render.character_sheet", "items.Wizard",
+                     "items.Wizard.batch", "persistence.codec", "persistence.save_store"):
+            self.assertIn(name, names)
+
+    def test_only_prefixes(self):
+        '''Naming Prefixes Runs just those Cases'''
+        results = run_suite(["render", "persistence"], min_time=0, repeat=1)
+        self.assertTrue(results)
+        for measurement in results:
+            self.assertTrue(measurement.name.startswith(("render.", "persistence.")))
+            self.assertEqual(measurement.error, "")
+
+    def test_compare(self):
+        '''Slowdowns past the Tolerance and Errors the Baseline does not List are Regressions'''
+        baseline = {"steady": 100.0, "slower": 100.0, "broken": 100.0}
+        measurements = [Measurement("steady", "fights", 90.0),
+                        Measurement("slower", "fights", 60.0),
+                        Measurement("broken", "fights", error="AttributeError"),
+                        Measurement("new", "fights", 5.0),
+                        Measurement("new_error", "fights", error="KeyError"),
+                        Measurement("known", "fights", error="KeyError")]
+        comparisons = compare(measurements, baseline, tolerance=0.25,
+                              known_errors={"known": "KeyError"})
+        self.assertEqual([comparison.regression for comparison in comparisons],
+                         [False, True, True, False, True, False])
+        self.assertAlmostEqual(comparisons[1].change, -0.4)
+        self.assertIsNone(comparisons[3].baseline)
+        self.assertIn("3 regression(s) and 3 error(s) in 6 case(s)",
+                      format_report(comparisons))
+
+    def test_baseline_round_trip(self):
+        '''Saving Keeps Earlier Cases and Lists Errors instead of Rates'''
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            self.assertEqual(load_baseline(path), {})
+            save_baseline([Measurement("first", "fights", 10.0),
+                           Measurement("fixed", "fights", error="KeyError")], path)
+            save_baseline([Measurement("second", "fights", 20.0),
+                           Measurement("fixed", "fights", 30.0),
+                           Measurement("first", "fights", error="KeyError")], path)
+            self.assertEqual(load_baseline(path), {"second": 20.0, "fixed": 30.0})
+            self.assertEqual(load_baseline_errors(path), {"first": "KeyError"})
+
+    def test_stored_baseline(self):
+        '''The Stored Baseline Covers every Case, Listing each one that Raises'''
+        results = run_suite(min_time=0, repeat=1)
+        rates, errors = load_baseline(BASELINE_FILE), load_baseline_errors(BASELINE_FILE)
+        self.assertEqual(set(rates) | set(errors),
+                         {measurement.name for measurement in results})
+        self.assertEqual({measurement.name: measurement.error
+                          for measurement in results if measurement.error}, errors)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+'''Module to test the Versioned Character Save Format; run from the top level directory'''
+import pickle
+import unittest
+from random import Random
+from src.characters import Fighter, Cleric, Rogue, Wizard, Ranger
+from src.character_codec import (encode_character, decode_character, SaveFormatError,
+                                 MIGRATIONS, MAGIC, SCHEMA_VERSION)
+from src.dd_data import NullPrint
+
+
+def seasoned(cls, levels=12):
+    '''A Character of cls that has Levelled and Won a few Battles'''
+    character = cls("Codec Test", Random(4))
+    character.printer = NullPrint()
+    for _ in range(levels):
+        character.gain_experience(character.experience_to_next, combat=True)
+    character.gold = 777
+    return character
+
+
+class TestCharacterCodec(unittest.TestCase):
+    '''Class to test encode_character and decode_character'''
+    def test_round_trip(self):
+        '''Every class comes back with the same sheet, skills and experience table'''
+        for cls in (Fighter, Cleric, Rogue, Wizard, Ranger):
+            character = seasoned(cls)
+            loaded = decode_character(encode_character(character))
+            self.assertIs(type(loaded), cls)
+            self.assertEqual(str(loaded), str(character))
+            self.assertEqual(loaded.get_skills_list(), character.get_skills_list())
+            self.assertEqual(loaded.damage_modifiers, character.damage_modifiers)
+            self.assertEqual(loaded.defense_modifiers, character.defense_modifiers)
+            self.assertEqual(loaded.experience_to_next, character.experience_to_next)
+            self.assertEqual(next(loaded._exp_to_next_iter), # pylint: disable=protected-access
+                             next(character._exp_to_next_iter)) # pylint: disable=protected-access
+
+    def test_skills_bound_to_loaded(self):
+        '''Rebuilt skills act on the loaded character, not the class template'''
+        loaded = decode_character(encode_character(seasoned(Fighter)))
+        loaded.printer = NullPrint()
+        for method in loaded.get_skills().values():
+            self.assertIs(method.__self__, loaded)
+        self.assertEqual(loaded.attack().actions[0][0], "Attack")
+
+    def test_smaller_than_pickle(self):
+        '''The save format is far smaller than pickling the object graph'''
+        character = seasoned(Ranger)
+        encoded = encode_character(character)
+        character.printer = None
+        self.assertLess(len(encoded) * 4, len(pickle.dumps(character)))
+
+    def test_migration_hook(self):
+        '''Bodies from older versions pass through the registered migrations'''
+        encoded = encode_character(seasoned(Rogue))
+        older = MAGIC + bytes([SCHEMA_VERSION - 1]) + encoded[len(MAGIC) + 1:]
+        calls = []
+        def migrate(body):
+            calls.append(body["class"])
+            return body
+        MIGRATIONS[SCHEMA_VERSION - 1] = migrate
+        try:
+            self.assertEqual(decode_character(older).gold, 777)
+        finally:
+            del MIGRATIONS[SCHEMA_VERSION - 1]
+        self.assertEqual(calls, ["Rogue"])
+
+    def test_rejects_foreign_data(self):
+        '''Data without the header, or from a newer version, is refused'''
+        with self.assertRaises(SaveFormatError):
+            decode_character(b"not a save")
+        encoded = encode_character(seasoned(Wizard, levels=1))
+        with self.assertRaises(SaveFormatError):
+            decode_character(MAGIC + bytes([SCHEMA_VERSION + 1]) + encoded[len(MAGIC) + 1:])
+
+
+if __name__ == "__main__":
+    unittest.main()
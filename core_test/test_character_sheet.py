@@ -0,0 +1,62 @@
+'''Module to test the Incremental Character Sheet; run from the top level directory'''
+import unittest
+from random import Random
+from src.simulation import build_character
+from src.characters import Fighter, Wizard, Ranger
+from src.characters.character_sheet import CharacterSheet
+from src.character_codec import encode_character, decode_character
+
+
+class TestCharacterSheet(unittest.TestCase):
+    '''Class to test that the Kept Sheet matches a Freshly Rendered one'''
+    def assert_current(self, character):
+        '''The Kept Sheet is what a New Sheet would Render'''
+        self.assertEqual(str(character), CharacterSheet(character).render())
+
+    def test_reused_when_unchanged(self):
+        '''Showing the Sheet again Redraws Nothing'''
+        character = build_character(Wizard, 4, rng=Random(1))
+        text = str(character)
+        self.assertEqual(character.sheet.dirty, ())
+        self.assertIs(str(character), text)
+
+    def test_sections_marked_dirty(self):
+        '''equip, gain_experience and level_up Mark the Sections they Change'''
+        character = build_character(Fighter, 3, rng=Random(2))
+        str(character)
+        character.equip(character.generate_weapon())
+        self.assertEqual(character.sheet.dirty, ("modifiers", "equipment"))
+        str(character)
+        character.gain_experience(1, combat=True)
+        self.assertEqual(character.sheet.dirty, ("experience",))
+        str(character)
+        character.gain_experience(character.experience_to_next, combat=True)
+        self.assertEqual(character.sheet.dirty,
+                         ("name", "stats", "modifiers", "equipment", "experience"))
+
+    def test_follows_every_change(self):
+        '''The Sheet stays Current through Equipment, Levels, Gold and Damage'''
+        character = build_character(Ranger, 2, rng=Random(3))
+        self.assert_current(character)
+        character.equip(character.generate_accessory())
+        self.assert_current(character)
+        character.gain_experience(character.experience_to_next, combat=True)
+        self.assert_current(character)
+        character.gold += 25
+        self.assert_current(character)
+        character.hit_points = character.hit_points - 5
+        self.assert_current(character)
+        character.take_damage(3, "Physical", "Hit for <value>")
+        self.assert_current(character)
+
+    def test_not_saved(self):
+        '''The Rendered Sheet is not Saved, a Loaded Character Renders its own'''
+        character = build_character(Fighter, 5, rng=Random(4))
+        text = str(character)
+        loaded = decode_character(encode_character(character))
+        self.assertIsNot(loaded.sheet, character.sheet)
+        self.assertEqual(str(loaded), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+'''Module to test the Combat Action Records; run from the top level directory'''
+import contextlib
+import io
+import unittest
+from random import Random
+from src.combat_action import CombatAction, NO_ACTION, NO_HEAL
+from src.simulation import build_character, build_monster
+from src.characters import Fighter
+from src.monsters.beast_src import Chimera
+
+
+class TestCombatAction(unittest.TestCase):
+    '''Class to test CombatAction Construction and the Shared Results'''
+    def test_no_output(self):
+        '''Building an Action Prints Nothing'''
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            CombatAction([("Attack", 5, "Physical", "Hit")], "")
+        self.assertEqual(output.getvalue(), "")
+
+    def test_supported_actions_kept(self):
+        '''A Sequence of Supported Actions is Kept as Given'''
+        actions = [("Attack", 5, "Physical", "Hit"), ("Heal", 3, "Holy", "")]
+        self.assertIs(CombatAction(actions, "").actions, actions)
+
+    def test_unsupported_actions_dropped(self):
+        '''Unsupported Actions are Filtered Out'''
+        action = CombatAction([("Dance", 1, "", ""), ("Attack", 5, "Physical", "Hit")],
+                              "msg", "Special")
+        self.assertEqual(list(action.actions), [("Attack", 5, "Physical", "Hit")])
+        self.assertEqual((action.message, action.special), ("msg", "Special"))
+        self.assertEqual(CombatAction([], "").special, "")
+
+    def test_slotted(self):
+        '''Actions carry no Instance Dict'''
+        with self.assertRaises(AttributeError):
+            CombatAction([], "").extra = 1
+
+    def test_shared_results(self):
+        '''Turns that do Nothing Return the Shared Instances'''
+        fighter = build_character(Fighter, 3, rng=Random(1))
+        self.assertIs(fighter.use_healing_potion()[1], NO_HEAL)
+        self.assertEqual(list(NO_HEAL.actions), [("Heal", 0, "Holy", "")])
+        self.assertEqual(list(NO_ACTION.actions), [])
+
+    def test_additional_attack_builds_new_action(self):
+        '''The Chimera's Extra Head adds to a New Action, not the one it was Given'''
+        chimera = build_monster(Chimera, 8, Random(2))
+        first = chimera.attack("Lion")
+        combined = chimera.additional_attack("Lion", first)
+        self.assertEqual(len(first.actions), 1)
+        self.assertEqual(len(combined.actions), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
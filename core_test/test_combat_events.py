@@ -0,0 +1,91 @@
+'''Module to test the Combat Event Bus; run from the top level directory'''
+import unittest
+from random import Random
+from src.combat_events import (EventBus, combat_events, TurnStarted, AttackResolved,
+                               DamageTaken, Healed, ModifierApplied)
+from src.simulation import simulate_fight, build_character, build_monster
+from src.encounter import Encounter
+from src.characters import Fighter, Cleric
+from src.monsters.beast_src import Drake
+from src.monsters.undead_src import Zombie
+
+
+class TestCombatEvents(unittest.TestCase):
+    '''Class to test that Encounters Emit Events to Runtime Subscribers'''
+    def record(self, bus, *event_types):
+        '''Subscribes a List to bus, Unsubscribed after the Test'''
+        events = []
+        self.addCleanup(bus.subscribe(events.append, *event_types))
+        return events
+
+    def test_inactive_without_subscribers(self):
+        '''A Bus is only Active while Someone Listens'''
+        bus = EventBus()
+        self.assertFalse(bus.active)
+        unsubscribe = bus.subscribe(print, Healed)
+        self.assertTrue(bus.active)
+        unsubscribe()
+        self.assertFalse(bus.active)
+
+    def test_fight_events(self):
+        '''A Simulated Fight Emits Turns, Attacks and the Damage each Took'''
+        events = self.record(combat_events)
+        result = simulate_fight(Fighter, Zombie, 6, seed=3)
+        turns = [event.turn for event in events if isinstance(event, TurnStarted)]
+        self.assertEqual(turns, list(range(1, result.turns + 1)))
+        for event in events:
+            if isinstance(event, AttackResolved):
+                self.assertEqual(event.damage, int(event.base * event.modifier))
+            if isinstance(event, DamageTaken) and not event.saved:
+                self.assertEqual(event.taken + event.resisted + event.overkill,
+                                 max(event.damage, event.taken))
+                self.assertTrue(event.overkill == 0 or not event.alive)
+        dealt = sum(event.taken for event in events
+                    if isinstance(event, DamageTaken) and event.com_num == 2)
+        self.assertEqual(dealt, sum(result.damage_dealt.values()))
+
+    def test_overkill_and_saves(self):
+        '''Killing Blows Report Overkill, and Hits Resist Death or Heroism Survive are Saves'''
+        bus = EventBus()
+        taken = self.record(bus, DamageTaken)
+        fighter = build_character(Fighter, 6, rng=Random(5))
+        zombie = build_monster(Zombie, 6, Random(6))
+        encounter = Encounter(fighter, zombie, seed=4, events=bus)
+        zombie.hit_points = 1
+        encounter.send_attacks(36, "Holy", "<value>", 1)
+        encounter.send_attacks(36, "Holy", "<value>", 1)
+        fighter.hit_points = 2
+        encounter.send_attacks(500, "Physical", "<value>", 2)
+        resisted_death, blow, heroism = taken
+        for save in (resisted_death, heroism):
+            self.assertTrue(save.alive and save.saved)
+            self.assertEqual((save.resisted, save.overkill), (0, 0))
+        self.assertFalse(blow.alive)
+        self.assertEqual((blow.taken, blow.resisted, blow.overkill), (1, 0, 35))
+
+    def test_typed_subscription(self):
+        '''Subscribers to an Event Type get only that Type'''
+        bus = EventBus()
+        heals = self.record(bus, Healed)
+        cleric = build_character(Cleric, 4, rng=Random(1))
+        encounter = Encounter(cleric, build_monster(Drake, 4, Random(2)), seed=1, events=bus)
+        encounter.next_turn(1)
+        encounter.parse_heal(("Heal", 12, "Holy", ""), 1)
+        encounter.parse_heal(("Heal", 0, "Holy", ""), 1)
+        self.assertEqual(heals, [Healed(encounter, 1, 12)])
+
+    def test_modifiers_applied(self):
+        '''Auras, Battle Cries and Hexes name who Cast them and on whom'''
+        bus = EventBus()
+        events = self.record(bus, ModifierApplied)
+        encounter = Encounter(build_character(Fighter, 2, rng=Random(3)),
+                              build_monster(Drake, 2, Random(4)), seed=2, events=bus)
+        encounter.parse_hex(("Hex", 5, "Fire", ""), 2)
+        encounter.parse_battle_cry(("Battle Cry", 10, "Physical", ""), 1)
+        self.assertEqual([(event.kind, event.com_num, event.target, event.amount)
+                          for event in events],
+                         [("Hex", 2, 1, 5), ("Battle Cry", 1, 1, 10)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+'''Module to test the Binary Combat Log and Replayer; run from the top level directory'''
+import unittest
+from random import Random
+from src.combat_log import CombatLog, CombatReplay
+from src.encounter import Encounter
+from src.simulation import Simulation, build_character, build_monster, simulate_fight
+from src.characters import Cleric, Wizard
+from src.monsters.beast_src import Drake
+from src.monsters.undead_src import Zombie
+
+
+class TestCombatLog(unittest.TestCase):
+    '''Class to test CombatLog and CombatReplay'''
+    def test_round_trip(self):
+        '''Ints of any sign and size, floats and short tuples survive encoding'''
+        character = build_character(Cleric, 1)
+        monster = build_monster(Zombie, 1)
+        log = CombatLog()
+        log.start(2 ** 64 - 1, character, monster)
+        log.turn_order(True)
+        actions = [("Attack", 12, "Physical", "hits"), ("Heal", 7.5, "Holy"),
+                   ("Hex", -300000, "Fire", "hits"), ("Escape", "", "", "")]
+        deltas = [(0, -12, 0, 0), (7.5, 0, -1, 0), (0, 0, 0, 0), (10 ** 12, 0, 0, 0)]
+        for action, delta in zip(actions, deltas):
+            log.action(1, action, delta)
+        replay = CombatReplay(bytes(log))
+        self.assertEqual(replay.seed, 2 ** 64 - 1)
+        self.assertTrue(replay.player_first)
+        events = list(replay)
+        self.assertEqual([event.action for event in events],
+                         [actions[0], ("Heal", 7.5, "Holy", ""),
+                          actions[2], ("Escape", 0, "", "")])
+        self.assertEqual(events[-1].hit_points[0],
+                         character.hit_points + 7.5 + 10 ** 12)
+
+    def test_replay_matches_fight(self):
+        '''Fast forwarding a recorded fight reaches the fight's final state'''
+        rng = Random(4)
+        character = build_character(Wizard, 15, rng=Random(rng.getrandbits(64)))
+        monster = build_monster(Drake, 15, Random(rng.getrandbits(64)))
+        log = CombatLog()
+        encounter = Encounter(character, monster, seed=99, log=log)
+        Simulation(encounter).run()
+        replay = CombatReplay(bytes(log))
+        self.assertEqual(replay.seed, 99)
+        final_1, final_2 = replay.fast_forward()
+        self.assertEqual(final_1.hit_points, character.hit_points)
+        self.assertEqual(final_2.hit_points, monster.hit_points)
+        self.assertEqual(final_1.special, character.special)
+        self.assertEqual(replay.fast_forward(0), replay.combatants)
+
+    def test_interleaved_passes(self):
+        '''Checking the turn order or starting a second pass mid replay does not move the first'''
+        log = CombatLog()
+        simulate_fight(Cleric, Zombie, 10, seed=1, log=log)
+        replay = CombatReplay(bytes(log))
+        expected = list(replay)
+        events = []
+        for event in replay:
+            events.append(event)
+            self.assertIsNotNone(replay.player_first)
+            next(iter(replay))
+        self.assertEqual(events, expected)
+
+    def test_compact(self):
+        '''Repeated actions cost a few bytes once their strings are interned'''
+        log = CombatLog()
+        simulate_fight(Cleric, Zombie, 10, seed=1, log=log)
+        events = len(list(CombatReplay(bytes(log))))
+        self.assertGreater(events, 0)
+        self.assertLess(len(log), 120 + 40 * events)
+
+    def test_bad_data(self):
+        '''Data without the magic header is rejected'''
+        with self.assertRaises(ValueError):
+            CombatReplay(b"nope")
+
+
+if __name__ == "__main__":
+    unittest.main()
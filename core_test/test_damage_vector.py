@@ -0,0 +1,52 @@
+'''Module to test the Fixed Key Damage Vector; run from the top level directory'''
+import pickle
+import unittest
+from src.dd_data import DamageVector, damage_types
+from src.characters import Rogue
+
+
+class TestDamageVector(unittest.TestCase):
+    '''Class to test DamageVector'''
+    def test_restricted_keys(self):
+        '''Restricted vectors behave like the LimitedDict tables they replace'''
+        vector = DamageVector(("Physical", "Fire"), default_value=100)
+        self.assertIn("Fire", vector)
+        self.assertNotIn("Ice", vector)
+        self.assertIsNone(vector["Ice"])
+        self.assertEqual(vector.get("Ice", 100), 100)
+        vector["Fire"] += 20
+        self.assertEqual(vector["Fire"], 120)
+        with self.assertRaises(KeyError):
+            vector["Ice"] = 5
+        self.assertEqual(vector.items(), [("Physical", 100), ("Fire", 120)])
+
+    def test_single_key(self):
+        '''A single damage type may be given as a string'''
+        vector = DamageVector("Physical", default_value=100)
+        self.assertEqual(vector.keys(), ("Physical",))
+
+    def test_vector_math(self):
+        '''Add, subtract and clamp work on every damage type at once'''
+        aura = DamageVector(default_value=100)
+        aura["Fire"] = 250
+        aura["Ice"] = -40
+        full = DamageVector(default_value=200)
+        self.assertEqual((full - aura).values(), (100, 100, 100, 240, -50, 100))
+        self.assertEqual((full - aura).clamp(10, 200).values(),
+                         (100, 100, 100, 200, 10, 100))
+        self.assertEqual((aura + aura)["Fire"], 500)
+        self.assertEqual(len(aura), len(damage_types))
+
+    def test_pickle(self):
+        '''Vectors survive the pickle based save files'''
+        vector = DamageVector(("Poison", "Holy"), default_value=100)
+        vector["Holy"] = 150
+        self.assertEqual(pickle.loads(pickle.dumps(vector)), vector)
+
+    def test_rogue_poison(self):
+        '''Rogue offensive modifiers cover Poison'''
+        self.assertIn("Poison", Rogue("Vector Test").damage_modifiers)
+
+
+if __name__ == "__main__":
+    unittest.main()
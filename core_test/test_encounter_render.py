@@ -0,0 +1,71 @@
+'''Module to test the Cached Encounter Panes; run from the top level directory'''
+import unittest
+from random import Random
+from src.simulation import build_character, build_monster
+from src.encounter import Encounter
+from src.characters import Fighter
+from src.monsters.beast_src import Drake
+from src.dd_data import NullPrint
+
+
+class TestEncounterRender(unittest.TestCase):
+    '''Class to test the Encounter render cache and version counter'''
+    def setUp(self):
+        self.character = build_character(Fighter, 5, rng=Random(1))
+        self.monster = build_monster(Drake, 5, Random(2))
+        self.encounter = Encounter(self.character, self.monster, seed=3)
+        self.encounter.printer = NullPrint()
+
+    def fresh_render(self):
+        '''Renders the same state with an empty cache'''
+        self.encounter._render_cache.clear() # pylint: disable=protected-access
+        return str(self.encounter)
+
+    def test_version_bumps(self):
+        '''Damage, Aura, Hex, Battle Cry and Identify bump the version'''
+        encounter = self.encounter
+        actions = [(encounter.parse_aura, ("Aura", 10, "Fire", "")),
+                   (encounter.parse_hex, ("Hex", 10, "Ice", "")),
+                   (encounter.parse_battle_cry, ("Battle Cry", 10, "Physical", "")),
+                   (encounter.parse_identify, ("Identify", 0, "", "")),
+                   (encounter.parse_attack, ("Attack", 5, "Physical", ""))]
+        for parse, action in actions:
+            version = encounter.version
+            parse(action, 1)
+            self.assertEqual(encounter.version, version + 1)
+
+    def test_sections_reused(self):
+        '''Unchanged sections are served from the cache'''
+        str(self.encounter)
+        cache = dict(self.encounter._render_cache) # pylint: disable=protected-access
+        str(self.encounter)
+        for section, (_, lines) in cache.items():
+            self.assertIs(self.encounter._render_cache[section][1], lines) # pylint: disable=protected-access
+
+    def test_only_dirty_sections_rebuilt(self):
+        '''Damage rebuilds only the status section; Auras only the combat modifiers'''
+        cache = self.encounter._render_cache # pylint: disable=protected-access
+        events = [(self.encounter.parse_attack, ("Attack", 5, "Physical", ""), {"status"}),
+                  (self.encounter.parse_aura, ("Aura", 10, "Fire", ""), {"combat_modifiers"})]
+        for parse, action, dirty in events:
+            str(self.encounter)
+            before = {section: lines for section, (_, lines) in cache.items()}
+            parse(action, 1)
+            str(self.encounter)
+            rebuilt = {section for section, lines in before.items()
+                       if cache[section][1] is not lines}
+            self.assertEqual(rebuilt, dirty)
+
+    def test_tracks_changes(self):
+        '''Cached output always matches a fresh render'''
+        str(self.encounter)
+        self.encounter.parse_aura(("Aura", 20, "Fire", ""), 2)
+        self.assertEqual(str(self.encounter), self.fresh_render())
+        self.encounter.parse_attack(("Attack", 15, "Physical", ""), 2)
+        self.assertEqual(str(self.encounter), self.fresh_render())
+        self.character.use_healing_potion()
+        self.assertEqual(str(self.encounter), self.fresh_render())
+
+
+if __name__ == "__main__":
+    unittest.main()
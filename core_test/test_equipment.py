@@ -0,0 +1,129 @@
+'''Module to test the Immutable Equipment Records; run from the top level directory'''
+import gc
+import pickle
+import unittest
+from src.characters.equipment import Weapon, Armor, Accessory, interned_count, intern_modifiers
+from src.characters.equipment import equipment
+from src.character_codec import encode_equipment, decode_equipment
+
+# An Axe and a Fire Quiver pickled by the Equipment classes before they were Slotted
+LEGACY_ITEMS = (
+    b'\x80\x04\x95D\x01\x00\x00\x00\x00\x00\x00]\x94(\x8c"src.characters.equipment'
+    b'.equipment\x94\x8c\x06Weapon\x94\x93\x94)\x81\x94}\x94(\x8c\x0e_dam_modifier'
+    b's\x94]\x94\x8c\x08Physical\x94K\x03\x86\x94a\x8c\x05_name\x94\x8c\x03Axe\x94'
+    b'\x8c\x0f_equipment_type\x94h\x02\x8c\x12_equipment_subtype\x94\x8c\x03Axe'
+    b'\x94\x8c\x0b_item_stats\x94K\rK\x00\x86\x94\x8c\x05_cost\x94K\n\x8c\x0c_dama'
+    b'ge_type\x94h\x08ubh\x01\x8c\tAccessory\x94\x93\x94)\x81\x94}\x94(h\x06]\x94'
+    b'\x8c\x0e_def_modifiers\x94]\x94h\n\x8c\x18Fortified Quiver of Fire\x94h\x0ch'
+    b'\x13h\r\x8c\x06Quiver\x94h\x0fK\x00K\x02\x86\x94h\x11K\r\x8c\x07element\x94'
+    b'\x8c\x04Fire\x94ube.')
+
+
+def make_quiver():
+    '''Quiver with Modifiers in both Columns and an Element'''
+    return Accessory("Quiver", "Quiver of Ice", {"Attack": 2, "Armor": 3,
+                                                 "Offensive": [("Ice", 5)],
+                                                 "Defensive": [("Fire", -4), ("Ice", -6)]},
+                     cost=40, element="Ice")
+
+
+class TestEquipment(unittest.TestCase):
+    '''Class to test Equipment Records and their Cards'''
+    def test_immutable(self):
+        '''Items cannot be Changed or given new Attributes'''
+        sword = Weapon("Sword", "Sword", 10, {"Offensive": [("Physical", 12)]}, cost=9)
+        with self.assertRaises(AttributeError):
+            sword.item_stats = (1, 1)
+        with self.assertRaises(AttributeError):
+            sword.colour = "Red"
+        self.assertIsInstance(sword.damage_modifiers, tuple)
+
+    def test_card_rendered_once(self):
+        '''Rendering leaves the Modifiers alone and Reuses the Card'''
+        plate = Armor("Heavy", "Plate", 12, {"Defensive": [("Fire", -10)]}, cost=20)
+        card = str(plate)
+        self.assertIs(str(plate), card)
+        self.assertEqual(plate.defense_modifiers, (("Fire", -10),))
+        self.assertEqual(len(card.splitlines()), 7)
+        self.assertTrue(all(len(line) == 91 for line in card.splitlines()))
+        self.assertIn("| Fire: -10", card)
+
+    def test_card_rows(self):
+        '''The Card has a Row for every Modifier past Attack and Armor'''
+        quiver = make_quiver()
+        lines = str(quiver).splitlines()
+        self.assertEqual(len(lines), 7)
+        self.assertIn("Quiver of Ice (Accessory):", lines[1])
+        self.assertIn("| Ice: 5", lines[5])
+        self.assertIn("| Ice: -6", lines[6])
+
+    def test_pickle_and_codec(self):
+        '''Pickled and Saved Items come back Equal, the Element Included'''
+        quiver = make_quiver()
+        for restored in (pickle.loads(pickle.dumps(quiver)),
+                         decode_equipment(encode_equipment(quiver))):
+            self.assertEqual(str(restored), str(quiver))
+            self.assertEqual(restored.element, "Ice")
+            self.assertEqual(restored.defense_modifiers, quiver.defense_modifiers)
+
+    def test_legacy_pickles(self):
+        '''Items Pickled with an Instance Dict are Rebuilt through the Constructor'''
+        axe, quiver = pickle.loads(LEGACY_ITEMS)
+        self.assertEqual((axe.name, axe.item_stats, axe.cost), ("Axe", (13, 0), 10))
+        self.assertEqual(axe.damage_modifiers, (("Physical", 3),))
+        self.assertEqual((quiver.element, quiver.item_stats), ("Fire", (0, 2)))
+        self.assertIs(Weapon("Axe", "Axe", 13, {"Offensive": [("Physical", 3)]}, cost=10), axe)
+        with self.assertRaises(AttributeError):
+            axe.cost = 1
+        self.assertIn("Fortified Quiver of Fire (Accessory):", str(quiver))
+
+
+class TestInterning(unittest.TestCase):
+    '''Class to test that Identical Items and Modifiers are Shared'''
+    def test_identical_items_shared(self):
+        '''Building an Item equal to a Live one Returns the Live one'''
+        self.assertIs(make_quiver(), make_quiver())
+        sword = Weapon("Sword", "Sword", 10, {"Offensive": [("Physical", 12)]}, cost=9)
+        self.assertIsNot(sword, Weapon("Sword", "Sword", 10, {"Offensive": [("Physical", 12)]},
+                                       cost=10))
+        self.assertIsNot(sword, Weapon("Axe", "Sword", 10, {"Offensive": [("Physical", 12)]},
+                                       cost=9))
+
+    def test_modifiers_shared(self):
+        '''Different Items with Equal Modifiers share the Tuples'''
+        first = Armor("Heavy", "Plate", 12, {"Defensive": [("Fire", -10), ("Ice", -5)]})
+        second = Armor("Heavy", "Plate of Fire", 14, {"Defensive": (("Fire", -10), ("Ice", -5))})
+        self.assertIs(first.defense_modifiers, second.defense_modifiers)
+        ring = Accessory("Ring", "Ring", {"Attack": 0, "Armor": 0, "Offensive": [],
+                                          "Defensive": [("Ice", -5)]})
+        self.assertIs(ring.defense_modifiers[0], first.defense_modifiers[1])
+
+    def test_modifier_tables_bounded(self):
+        '''Only the Recently Built Modifier Tuples are Kept'''
+        for number in range(equipment.MODIFIER_TUPLES_KEPT + 100):
+            intern_modifiers([("Fire", number), ("Ice", -number)])
+        cache = equipment.shared_modifiers.cache_info()
+        self.assertEqual(cache.currsize, equipment.MODIFIER_TUPLES_KEPT)
+        recent = intern_modifiers([("Fire", 7), ("Ice", -7)])
+        self.assertIs(intern_modifiers((("Fire", 7), ("Ice", -7))), recent)
+
+    def test_restored_items_shared(self):
+        '''Unpickled and Loaded Items are the Live Item'''
+        quiver = make_quiver()
+        self.assertIs(pickle.loads(pickle.dumps(quiver)), quiver)
+        self.assertIs(decode_equipment(encode_equipment(quiver)), quiver)
+
+    def test_released(self):
+        '''Items nothing Holds are not Kept Alive by the Intern Table'''
+        gc.collect()
+        before = interned_count()
+        items = [Weapon("Sword", f"Sword {number}", number, {"Offensive": []})
+                 for number in range(50)]
+        self.assertEqual(interned_count(), before + 50)
+        del items
+        gc.collect()
+        self.assertEqual(interned_count(), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+'''Module to test the Incremental Frame Renderer; run from the top level directory'''
+import io
+import unittest
+from src.dd_data.frame_renderer import FrameRenderer
+from src.screen import Screen
+
+
+class TerminalStream(io.StringIO):
+    '''StringIO that reports itself as a terminal'''
+    def isatty(self):
+        return True
+
+
+class TestFrameRenderer(unittest.TestCase):
+    '''Class to test FrameRenderer'''
+    def setUp(self):
+        self.stream = TerminalStream()
+        self.renderer = FrameRenderer(Screen(self.stream))
+
+    def drawn(self, frame):
+        '''Renders frame and returns what was written for it'''
+        self.stream.seek(0)
+        self.stream.truncate()
+        self.renderer.render(frame)
+        return self.stream.getvalue()
+
+    def test_first_frame_is_full(self):
+        '''The first frame clears the screen and draws every line'''
+        output = self.drawn("a\nb\nc")
+        self.assertTrue(output.startswith("\033[H\033[2J"))
+        self.assertIn("a\nb\nc", output)
+
+    def test_only_changed_lines(self):
+        '''Later frames address and rewrite only the lines that changed'''
+        self.drawn("a\nb\nc")
+        output = self.drawn("a\nB\nc")
+        self.assertIn("\033[2;1HB\033[K", output)
+        self.assertNotIn("\033[1;1H", output)
+        self.assertNotIn("\033[3;1H", output)
+        self.assertTrue(output.endswith("\033[4;1H\033[J"))
+
+    def test_unchanged_frame(self):
+        '''Redrawing the same frame writes no lines'''
+        self.drawn("a\nb")
+        self.assertEqual(self.renderer.render("a\nb"), 0)
+
+    def test_invalidate(self):
+        '''invalidate forces the next frame to repaint fully'''
+        self.drawn("a\nb")
+        self.renderer.invalidate()
+        self.assertEqual(self.renderer.render("a\nb"), 2)
+
+    def test_taller_than_terminal(self):
+        '''Frames that fill the Screen's terminal are always repainted in full'''
+        renderer = FrameRenderer(Screen(self.stream, rows=3))
+        renderer.render("a\nb\nc")
+        self.assertEqual(renderer.render("a\nb\nc"), 3)
+        self.assertEqual(renderer.render("a\nb"), 0)
+
+    def test_unknown_height_is_diffed(self):
+        '''A Screen whose height is unknown still gets line diffs, whatever the host tty'''
+        self.assertIsNone(Screen(self.stream).rows)
+        self.drawn("\n".join(["row"] * 60))
+        self.assertEqual(self.renderer.render("\n".join(["row"] * 60)), 0)
+
+    def test_not_a_terminal(self):
+        '''Streams that are not terminals always get the full frame'''
+        stream = io.StringIO()
+        renderer = FrameRenderer(Screen(stream))
+        renderer.render("a\nb")
+        self.assertEqual(renderer.render("a\nb"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+'''Module to test Batch Equipment Generation; run from the top level directory'''
+import unittest
+from random import Random
+from statistics import mean
+from src.characters.fighter_src import FighterEquipmentGenerator
+from src.characters.ranger_src import RangerEquipmentGenerator
+from src.characters.wizard_src import WizardEquipmentGenerator
+from src.characters.cleric_src import ClericEquipmentGenerator
+from src.characters.rogue_src import RogueEquipmentGenerator
+from src.characters.equipment import (Weapon, Armor, Accessory, ItemRecord,
+                                      to_equipment, generate_batch)
+
+generators = [FighterEquipmentGenerator, RangerEquipmentGenerator, WizardEquipmentGenerator,
+              ClericEquipmentGenerator, RogueEquipmentGenerator]
+kinds = {"Weapon": Weapon, "Armor": Armor, "Accessory": Accessory}
+
+
+class TestItemBatch(unittest.TestCase):
+    '''Class to test the batch generators against the single item generators'''
+    def test_records(self):
+        '''Every class rolls count immutable records of the asked type'''
+        for generator_class in generators:
+            generator = generator_class()
+            for kind in kinds:
+                records = generate_batch(generator, kind, 7, 50, Random(1))
+                self.assertEqual(len(records), 50)
+                for record in records:
+                    self.assertIsInstance(record, ItemRecord)
+                    self.assertEqual(record.equipment_type, kind)
+                    self.assertIsInstance(record.offensive, tuple)
+                    self.assertIsInstance(record.defensive, tuple)
+                    self.assertGreaterEqual(record.cost, 1)
+
+    def test_seeded(self):
+        '''The same seed rolls the same batch'''
+        generator = RogueEquipmentGenerator()
+        self.assertEqual(generator.generate_weapons(12, 20, Random(4)),
+                         generator.generate_weapons(12, 20, Random(4)))
+
+    def test_to_equipment(self):
+        '''Records build the Equipment the single generators return'''
+        for generator_class in generators:
+            generator = generator_class()
+            for kind, cls in kinds.items():
+                record = generate_batch(generator, kind, 5, 1, Random(2))[0]
+                item = to_equipment(record)
+                self.assertIsInstance(item, cls)
+                self.assertEqual(item.name, record.name)
+                self.assertEqual(item.item_stats, (record.attack, record.armor))
+                self.assertEqual(item.cost, record.cost)
+        quiver = to_equipment(RangerEquipmentGenerator().generate_accessories(5, 1, Random(3))[0])
+        self.assertIn(quiver.element, ["Ice", "Fire", "Lightning"])
+
+    def test_matches_single_generators(self):
+        '''Batch rolls follow the same distributions as one at a time rolls'''
+        for generator_class in generators:
+            generator = generator_class()
+            singles = {"Weapon": generator.generate_weapon, "Armor": generator.generate_armor,
+                       "Accessory": generator.generate_accessory}
+            for kind, single in singles.items():
+                rng = Random(5)
+                items = [single(10, rng) for _ in range(2000)]
+                records = generate_batch(generator, kind, 10, 2000, Random(6))
+                for field, index in (("cost", None), ("attack", 0), ("armor", 1)):
+                    expected = mean(item.cost if index is None else item.item_stats[index]
+                                    for item in items)
+                    actual = mean(getattr(record, field) for record in records)
+                    self.assertAlmostEqual(actual, expected, delta=max(1, expected * 0.05),
+                                           msg=f"{generator_class.__name__} {kind} {field}")
+
+    def test_unknown_type(self):
+        '''Unknown equipment types are rejected'''
+        with self.assertRaises(ValueError):
+            generate_batch(FighterEquipmentGenerator(), "Potion", 3, 5, Random(1))
+
+    def test_generator_key_error(self):
+        '''A KeyError raised inside a generator is not mistaken for an unknown type'''
+        class BrokenGenerator(FighterEquipmentGenerator):
+            '''Generator whose weapon table is missing an entry'''
+            def generate_weapons(self, level, count, rng):
+                '''Fails the way a missing table entry would'''
+                raise KeyError("Sword")
+        with self.assertRaises(KeyError):
+            generate_batch(BrokenGenerator(), "Weapon", 3, 5, Random(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
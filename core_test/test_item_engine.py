@@ -0,0 +1,79 @@
+'''Module to test the Table Driven Equipment Engine; run from the top level directory'''
+import unittest
+from random import Random
+from statistics import mean
+from src.characters.equipment import Weapon, Accessory
+from src.characters.equipment.item_engine import (
+    EquipmentEngine, ItemTable, StatRoll, FixedStat, RangeStat, Modifier, PrefixTable,
+    Affix, AffixTable, FixedResist, add_attack, level_bonus)
+
+
+class Training(EquipmentEngine):
+    '''A Class with nothing but Tables'''
+    tables = {
+        "Weapon": ItemTable(
+            "Weapon", ("Stick",), "{prefix} Stick{suffix}",
+            attack=StatRoll(lambda level: level, lambda average: 1, floor=1),
+            offensive=(Modifier("Physical", FixedStat(lambda level: level * 2)),),
+            prefixes=PrefixTable({0: "Sharp"}),
+            affixes=AffixTable(1, 2, {1: None,
+                                      2: Affix(" of Practice", "suffix",
+                                               add_attack(level_bonus(lambda level: 1)), 2)})),
+        "Accessory": ItemTable(
+            "Accessory", ("Ring",), "Ring of {resist}",
+            cost_roll=RangeStat(lambda level: level, lambda level: level),
+            defensive=FixedResist(("Fire",), lambda level: -level, suffix="Warmth")),
+    }
+
+
+class TestItemEngine(unittest.TestCase):
+    '''Class to test the Engine Tables and Rolls'''
+    def test_prefix_thresholds(self):
+        '''A Value gets the Name of the Largest Threshold strictly below it'''
+        prefixes = PrefixTable({20: "Great", 5: "Fine"})
+        self.assertEqual(prefixes[5], "")
+        self.assertEqual(prefixes[6], "Fine")
+        self.assertEqual(prefixes[20], "Fine")
+        self.assertEqual(prefixes[21], "Great")
+
+    def test_affix_faces(self):
+        '''Each Face holds up to the Next, Rolls below the First Face give None'''
+        first = Affix("First", "prefix", add_attack(level_bonus(lambda level: 1)))
+        affixes = AffixTable(0, 5, {2: first, 4: None})
+        self.assertEqual([affixes[roll] for roll in range(6)],
+                         [None, None, first, first, None, None])
+        self.assertTrue(set(affixes.column(100, Random(1))) <= {first, None})
+
+    def test_tables_only_class(self):
+        '''A Class made of Tables Generates Equipment'''
+        generator = Training()
+        weapon = generator.generate_weapon(10, Random(2))
+        self.assertIsInstance(weapon, Weapon)
+        self.assertIn(weapon.name, ("Sharp Stick", "Sharp Stick of Practice"))
+        ring = generator.generate_accessory(10, Random(2))
+        self.assertIsInstance(ring, Accessory)
+        self.assertEqual(ring.name, "Ring of Warmth")
+        self.assertEqual(ring.cost, 10)
+        record = generator.generate_accessories(10, 1, Random(2))[0]
+        self.assertEqual(record.defensive, (("Fire", -10),))
+
+    def test_single_matches_batch(self):
+        '''One at a time and Batch Rolls follow the same Distributions'''
+        generator = Training()
+        singles = [generator.roll_one("Weapon", 10, Random(seed)) for seed in range(1000)]
+        batch = generator.roll("Weapon", 10, 1000, Random(3))
+        for field in ("attack", "cost"):
+            self.assertAlmostEqual(mean(getattr(record, field) for record in singles),
+                                   mean(getattr(record, field) for record in batch), delta=1)
+        self.assertEqual({record.offensive for record in batch}, {(("Physical", 20),)})
+
+    def test_unknown_type(self):
+        '''Equipment Types without a Table are Rejected'''
+        with self.assertRaises(ValueError):
+            Training().generate_armor(3, Random(1))
+        with self.assertRaises(ValueError):
+            Training().roll("Potion", 3, 5, Random(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+'''Module to test the Combat Print Sinks; run from the top level directory'''
+import socket
+import threading
+import unittest
+from random import Random
+from src.simulation import build_character, build_monster
+from src.encounter import Encounter
+from src.characters import Fighter
+from src.monsters.beast_src import Drake
+from src.dd_data import MemoryPrint, NullPrint, SocketPrint
+
+
+class TestPrintSinks(unittest.TestCase):
+    '''Class to test that every Encounter Prints to its own Sink'''
+    def make_encounter(self, printer, seed=3):
+        '''Level 5 Fighter against a Drake, Printing to printer'''
+        character = build_character(Fighter, 5, rng=Random(seed))
+        monster = build_monster(Drake, 5, Random(seed + 1))
+        return Encounter(character, monster, seed=seed, printer=printer)
+
+    def test_default_is_null(self):
+        '''Encounters without a Sink discard their output'''
+        encounter = self.make_encounter(None)
+        self.assertIsInstance(encounter.printer, NullPrint)
+        self.assertIs(encounter.combatant_1.printer, encounter.printer)
+
+    def test_sink_shared_with_combatants(self):
+        '''The Sink is handed to both Combatants and Points at the Encounter'''
+        printer = MemoryPrint()
+        encounter = self.make_encounter(printer)
+        self.assertIs(encounter.combatant_1.printer, printer)
+        self.assertIs(encounter.combatant_2.printer, printer)
+        self.assertIs(printer.encounter, encounter)
+
+    def test_memory_keeps_every_message(self):
+        '''MemoryPrint keeps all messages, History only the last limit lines'''
+        printer = MemoryPrint(limit=2)
+        for number in range(5):
+            printer(f"Message {number}")
+        self.assertEqual(printer.messages, [f"Message {number}" for number in range(5)])
+        self.assertEqual(printer.get_history, ["Message 3", "Message 4"])
+
+    def test_concurrent_encounters_keep_separate_histories(self):
+        '''Encounters run on different Threads never see each other's Messages'''
+        printers = [MemoryPrint() for _ in range(4)]
+        def fight(printer, seed):
+            encounter = self.make_encounter(printer, seed)
+            for _ in range(20):
+                printer(f"Encounter {seed}")
+                encounter.combatant_1.use_healing_potion()
+        threads = [threading.Thread(target=fight, args=(printer, seed))
+                   for seed, printer in enumerate(printers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for seed, printer in enumerate(printers):
+            self.assertEqual(printer.messages,
+                             [f"Encounter {seed}",
+                              "Cannot Use Healing Potion, already at Max Health"] * 20)
+
+    def test_socket_print(self):
+        '''SocketPrint draws the Encounter Panes to its Socket'''
+        server, client = socket.socketpair()
+        try:
+            printer = SocketPrint(server)
+            encounter = self.make_encounter(printer)
+            printer("Over the wire")
+            server.shutdown(socket.SHUT_WR)
+            received = b""
+            while chunk := client.recv(65536):
+                received += chunk
+            text = received.decode("utf-8")
+            self.assertIn("Over the wire", text)
+            self.assertIn(encounter.combatant_1.name, text)
+            self.assertIn("\r\n", text)
+        finally:
+            server.close()
+            client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+'''Module to test the Hot Path Profiling Counters; run from the top level directory'''
+import os
+import subprocess
+import sys
+import threading
+import unittest
+from src import profiling
+from src.profiling import Counters, session_counters, timed, profiled
+from src.encounter import Encounter
+
+PROFILED_RUN = '''
+from src.simulation import simulate_fight
+from src.characters import Fighter
+from src.monsters.undead_src import Zombie
+from src import profiling
+simulate_fight(Fighter, Zombie, 4, seed=1)
+for name in profiling.totals.names:
+    print(name, profiling.totals.calls(name))
+'''
+
+
+class TestProfiling(unittest.TestCase):
+    '''Class to test the Counters and that Profiling Off leaves Plain Calls'''
+    @unittest.skipIf(profiling.ENABLED, "profiling is switched on for this run")
+    def test_off_is_plain_calls(self):
+        '''With Profiling Off the Hot Paths are the Functions as Written'''
+        def hot():
+            return 1
+        self.assertIs(profiled(hot), hot)
+        self.assertIs(profiled(name="hot")(hot), hot)
+        self.assertFalse(hasattr(Encounter.get_modifier, "__wrapped__"))
+
+    def test_session_counters(self):
+        '''Calls Count towards the Counters Bound to their Thread'''
+        hot = timed("test.hot", lambda value: value * 2)
+        mine = Counters()
+        other = Counters()
+        with session_counters(mine):
+            self.assertEqual(hot(2), 4)
+            thread = threading.Thread(target=lambda: [hot(1) for _ in range(3)])
+            with session_counters(other):
+                thread.start()
+                thread.join()
+            hot(3)
+        hot(4)
+        self.assertEqual(mine.calls("test.hot"), 2)
+        self.assertEqual(other.calls("test.hot"), 0)
+        self.assertGreaterEqual(profiling.totals.calls("test.hot"), 6)
+        self.assertIn("test.hot", mine.report())
+
+    def test_profiled_run(self):
+        '''DD_PROFILE=1 Counts the Encounter, Combatant and Item Hot Paths'''
+        environment = dict(os.environ, DD_PROFILE="1")
+        output = subprocess.run([sys.executable, "-c", PROFILED_RUN], env=environment,
+                                capture_output=True, text=True, check=True).stdout
+        counts = dict(line.rsplit(" ", 1) for line in output.splitlines())
+        for name in ("Encounter.get_modifier", "Encounter.parse_attack", "Zombie.take_turn",
+                     "Fighter.take_damage", "EquipmentEngine.roll_one"):
+            self.assertGreater(int(counts.get(name, 0)), 0, name)
+
+
+if __name__ == '__main__':
+    unittest.main()
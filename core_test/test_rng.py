@@ -0,0 +1,50 @@
+'''Module to test the Injectable Random Streams; run from the top level directory'''
+import unittest
+from random import Random
+from src.simulation import simulate_fight, build_character
+from src.encounter import Encounter
+from src.encounter_helpers import encounter_generator
+from src.characters import Fighter, Wizard
+from src.monsters.beast_src import Drake
+from src.monsters.undead_src import Zombie
+from src.dd_data import NullPrint
+
+
+class TestRandomStreams(unittest.TestCase):
+    '''Class to test that every roll is drawn from an injected Random'''
+    def test_seeded_fight(self):
+        '''The same seed replays the same fight'''
+        for level in (1, 10, 30):
+            self.assertEqual(simulate_fight(Wizard, Drake, level, seed=7),
+                             simulate_fight(Wizard, Drake, level, seed=7))
+
+    def test_seeded_equipment(self):
+        '''Equipment generated from the same stream is identical'''
+        first = build_character(Fighter, 20, rng=Random(3))
+        second = build_character(Fighter, 20, rng=Random(3))
+        self.assertEqual(str(first.generate_weapon()), str(second.generate_weapon()))
+        self.assertEqual(str(first.generate_armor()), str(second.generate_armor()))
+
+    def test_encounter_streams(self):
+        '''Encounters give each Combatant its own stream derived from the seed'''
+        character = build_character(Fighter, 1)
+        monster = Zombie(1)
+        encounter = Encounter(character, monster, seed=11)
+        encounter.printer = NullPrint()
+        self.assertIsNot(character.rng, monster.rng)
+        self.assertEqual(encounter.seed, 11)
+        rolls = [encounter.turn_order() for _ in range(10)]
+        replay = Encounter(character, monster, seed=11)
+        self.assertEqual(rolls, [replay.turn_order() for _ in range(10)])
+
+    def test_encounter_generator(self):
+        '''The generator draws the Monster from the given stream'''
+        character = build_character(Fighter, 1)
+        first = encounter_generator(character, Random(5))
+        second = encounter_generator(character, Random(5))
+        self.assertIs(type(first.combatant_2), type(second.combatant_2))
+        self.assertEqual(first.seed, second.seed)
+
+
+if __name__ == "__main__":
+    unittest.main()
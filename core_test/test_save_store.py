@@ -0,0 +1,118 @@
+'''Module to test the Slot Based Save Store; run from the top level directory'''
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from random import Random
+from src.save_store import SaveStore, SlotInfo
+from src.characters import Fighter, Wizard
+from src.dd_data import LimitedDict, DamageVector
+from src.encounter import Encounter
+from src.simulation import Simulation, build_monster
+from src.monsters.undead_src import Zombie
+
+# saved_games.pkl written by the game before slot files: a level 4 Fighter,
+# Wizard and Ranger in autosave, save_2 and save_3
+LEGACY_SAVES = os.path.join(os.path.dirname(__file__), "legacy_saved_games.pkl")
+
+
+class TestSaveStore(unittest.TestCase):
+    '''Class to test SaveStore slot files and the metadata index'''
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory() # pylint: disable=consider-using-with
+        self.directory = os.path.join(self.temp_dir.name, "saves")
+        self.legacy = os.path.join(self.temp_dir.name, "saved_games.pkl")
+        self.store = SaveStore(self.directory, self.legacy)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_empty_store(self):
+        '''A fresh store lists every slot as EMPTY'''
+        slots = self.store.slots()
+        self.assertEqual([value for _, value in slots.items()], ["EMPTY"] * 4)
+        self.assertIsNone(self.store.load("save_1"))
+
+    def test_round_trip(self):
+        '''Saved characters load back and are summarised in the index'''
+        fighter = Fighter("Store Test")
+        fighter.printer = None
+        self.store.save("save_2", fighter)
+        self.assertEqual(self.store.slots()["save_2"],
+                         SlotInfo("Store Test", 1, "Fighter", 0))
+        self.assertEqual(self.store.load("save_2").name, "Store Test")
+
+    def test_slots_are_independent(self):
+        '''Saving one slot leaves the other slot files untouched'''
+        wizard = Wizard("Other")
+        wizard.printer = None
+        self.store.save("save_1", wizard)
+        before = os.stat(self.store.slot_path("save_1")).st_mtime_ns
+        fighter = Fighter("Autosaved")
+        fighter.printer = None
+        self.store.save("autosave", fighter)
+        self.assertEqual(os.stat(self.store.slot_path("save_1")).st_mtime_ns, before)
+        self.assertEqual(self.store.slots()["save_1"].char_class, "Wizard")
+
+    def test_listing_skips_characters(self):
+        '''Listing slots reads only the index'''
+        fighter = Fighter("Indexed")
+        fighter.printer = None
+        self.store.save("save_3", fighter)
+        with open(self.store.slot_path("save_3"), "wb") as file:
+            file.write(b"not a pickle")
+        self.assertEqual(self.store.slots()["save_3"].name, "Indexed")
+        self.assertIsNone(self.store.load("save_3"))
+
+    def test_legacy_migration(self):
+        '''Characters in the old single save file move to slot files'''
+        fighter = Fighter("Legacy")
+        fighter.printer = None
+        saved_games = LimitedDict(("autosave", "save_1", "save_2", "save_3"))
+        saved_games["save_1"] = fighter
+        with open(self.legacy, "wb") as file:
+            pickle.dump(saved_games, file)
+        self.assertEqual(self.store.slots()["save_1"].name, "Legacy")
+        self.assertEqual(self.store.load("save_1").name, "Legacy")
+
+    def test_baseline_migration(self):
+        '''Characters Pickled by the Original Game are Upgraded and Play'''
+        shutil.copy(LEGACY_SAVES, self.legacy)
+        slots = self.store.slots()
+        self.assertEqual(slots["autosave"], SlotInfo("Brom", 4, "Fighter", 0))
+        self.assertEqual(slots["save_1"], "EMPTY")
+        self.assertEqual(slots["save_2"], SlotInfo("Ilsa", 4, "Wizard", 0))
+        self.assertEqual(self.store.legacy_errors, {})
+        ranger = self.store.load("save_3")
+        self.assertEqual((ranger.name, ranger.level), ("Tamsin", 4))
+        self.assertIsInstance(ranger.defense_modifiers, DamageVector)
+        self.assertTrue(ranger.accessory_sheet.element)
+        self.assertIn("Character Sheet for: Tamsin", str(ranger))
+        encounter = Encounter(ranger, build_monster(Zombie, 4, Random(1)), seed=1)
+        self.assertGreater(Simulation(encounter).run().turns, 0)
+
+    def test_bad_legacy_entries_reported(self):
+        '''Legacy Entries that can't be Migrated are Skipped and Named in the Menus'''
+        saved_games = LimitedDict(("autosave", "save_1", "save_2", "save_3"))
+        broken = Fighter("Broken")
+        broken.printer = None
+        broken.__dict__["_gold"] = object
+        saved_games["save_1"] = broken
+        with open(self.legacy, "wb") as file:
+            pickle.dump(saved_games, file)
+        self.assertIn("Broken could not be migrated", self.store.slots()["save_1"])
+        self.assertIsNone(self.store.load("save_1"))
+        with open(self.legacy, "wb") as file:
+            file.write(pickle.dumps(saved_games)[:-40])
+        other = SaveStore(os.path.join(self.temp_dir.name, "other"), self.legacy)
+        self.assertIn("Unreadable saved_games.pkl", other.slots()["autosave"])
+
+    def test_unknown_slot(self):
+        '''Unknown slots raise KeyError'''
+        with self.assertRaises(KeyError):
+            self.store.save("save_4", Fighter("Nowhere"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+'''Module to test the Background Save Writer; run from the top level directory'''
+import os
+import tempfile
+import threading
+import unittest
+from src.save_store import SaveStore
+from src.character_codec import SaveFormatError
+from src.save_writer import SaveWriter
+from src.characters import Fighter
+from src.dd_data import NullPrint
+
+
+class TestSaveWriter(unittest.TestCase):
+    '''Class to test SaveWriter snapshots and atomic slot writes'''
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory() # pylint: disable=consider-using-with
+        self.store = SaveStore(os.path.join(self.temp_dir.name, "saves"),
+                               os.path.join(self.temp_dir.name, "saved_games.pkl"))
+        self.writer = SaveWriter(self.store)
+        self.character = Fighter("Writer Test")
+        self.character.printer = NullPrint()
+
+    def tearDown(self):
+        self.writer.flush()
+        self.temp_dir.cleanup()
+
+    def test_background_write(self):
+        '''Submitted snapshots reach disk once flushed'''
+        self.writer.submit("autosave", self.character)
+        self.assertIsNone(self.writer.flush())
+        self.assertFalse(self.writer.busy)
+        self.assertEqual(self.store.load("autosave").name, "Writer Test")
+        self.assertIsInstance(self.character.printer, NullPrint)
+
+    def test_snapshot_is_taken_at_submit(self):
+        '''Changes after submit do not leak into the queued save'''
+        self.writer.submit("save_1", self.character)
+        self.character.gold = 12345
+        self.writer.flush()
+        self.assertNotEqual(self.store.load("save_1").gold, 12345)
+
+    def test_no_temp_files_left(self):
+        '''Atomic writes leave only the slot files and the index'''
+        for _ in range(3):
+            self.writer.submit("autosave", self.character)
+        self.writer.flush()
+        self.assertEqual(sorted(os.listdir(self.store.directory)),
+                         ["autosave.sav", "index.json"])
+
+    def test_failed_write_keeps_old_save(self):
+        '''A write that fails part way leaves the previous save readable'''
+        self.writer.submit("save_2", self.character)
+        self.writer.flush()
+        self.character.name = "Changed"
+        os.mkdir(self.store.slot_path("save_2") + ".tmp")
+        self.writer.submit("save_2", self.character)
+        self.assertIsInstance(self.writer.flush(), OSError)
+        self.assertEqual(self.store.load("save_2").name, "Writer Test")
+
+    def test_error_keeps_worker_alive(self):
+        '''Any Error a Write Raises is Reported and later Saves still Run'''
+        def broken_save(slot, data, info):
+            raise SaveFormatError(f"can't write {slot}")
+        self.store.save_snapshot = broken_save
+        self.writer.submit("save_1", self.character)
+        self.assertIsInstance(self.writer.flush(timeout=5), SaveFormatError)
+        self.assertFalse(self.writer.busy)
+        del self.store.save_snapshot
+        self.writer.submit("save_3", self.character)
+        self.assertIsNone(self.writer.flush(timeout=5))
+        self.assertEqual(self.store.load("save_3").name, "Writer Test")
+
+    def test_submit_as_worker_exits(self):
+        '''A Save Submitted just as the Worker Finds the Queue Empty is still Written'''
+        writer, character = self.writer, self.character
+        worker_blocks = []
+        submitted = threading.Event()
+        class HookedCondition(threading.Condition):
+            '''Submits save_2 right after the worker leaves its empty queue check'''
+            def __exit__(self, *exc_info):
+                super().__exit__(*exc_info)
+                if threading.current_thread().name == "save-writer":
+                    worker_blocks.append(True)
+                    # Pop, write done, then the check that finds the queue empty
+                    if len(worker_blocks) == 3:
+                        late = threading.Thread(target=writer.submit,
+                                                args=("save_2", character))
+                        late.start()
+                        late.join()
+                        submitted.set()
+        writer._condition = HookedCondition() # pylint: disable=protected-access
+        writer.submit("save_1", character)
+        self.assertTrue(submitted.wait(5))
+        self.assertIsNone(writer.flush(timeout=5))
+        self.assertEqual(self.store.load("save_2").name, "Writer Test")
+
+    def test_flush_timeout(self):
+        '''A Flush that Times Out Reports it rather than Succeeding'''
+        release = threading.Event()
+        save_snapshot = self.store.save_snapshot
+        def slow_save(slot, data, info):
+            release.wait(5)
+            save_snapshot(slot, data, info)
+        self.store.save_snapshot = slow_save
+        self.writer.submit("save_1", self.character)
+        self.assertIsInstance(self.writer.flush(timeout=0.05), TimeoutError)
+        release.set()
+        self.assertIsNone(self.writer.flush(timeout=5))
+        self.assertEqual(self.store.load("save_1").name, "Writer Test")
+
+
+if __name__ == "__main__":
+    unittest.main()
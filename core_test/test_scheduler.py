@@ -0,0 +1,90 @@
+'''Module to test the Iterative Menu Scheduler; run from the top level directory'''
+import cmd
+import inspect
+import unittest
+from src.menus.scheduler import MenuScheduler
+
+
+class LoopMenu(cmd.Cmd):
+    '''Menu that Reopens itself, as the Dungeon does after each Battle'''
+    def __init__(self, scheduler, log, depth=0):
+        super().__init__()
+        self.scheduler = scheduler
+        self.log = log
+        self.depth = depth
+
+    def do_down(self, arg): # pylint: disable=unused-argument
+        '''Opens a Child whose Close Reopens another Child'''
+        self.log.append(len(inspect.stack()))
+        return self.scheduler.open(LoopMenu(self.scheduler, self.log, self.depth + 1),
+                                   self.reopen)
+
+    def reopen(self):
+        '''Continuation that Keeps Going'''
+        self.log.append("closed")
+        return False
+
+    def do_up(self, arg): # pylint: disable=unused-argument
+        '''Closes this Menu'''
+        return True
+
+    def do_both(self, arg): # pylint: disable=unused-argument
+        '''Closes this Menu and asks the Opener to Close'''
+        self.scheduler.open(LoopMenu(self.scheduler, self.log), lambda: True)
+        return None
+
+
+class ClosedMenu(cmd.Cmd):
+    '''Menu that is Finished before it Reads Input'''
+    def preloop(self):
+        return True
+
+
+def script(*lines):
+    '''read_line that Replays lines'''
+    queue = list(lines)
+    return lambda prompt: queue.pop(0)
+
+
+class TestMenuScheduler(unittest.TestCase):
+    '''Class to test MenuScheduler'''
+    def test_stack_stays_flat(self):
+        '''Opening and closing many submenus never deepens the Python stack'''
+        log = []
+        scheduler = MenuScheduler(script(*(["down", "up"] * 200 + ["up"])))
+        scheduler.run(LoopMenu(scheduler, log))
+        depths = [entry for entry in log if entry != "closed"]
+        self.assertEqual(len(depths), 200)
+        self.assertEqual(len(set(depths)), 1)
+        self.assertEqual(log.count("closed"), 200)
+        self.assertEqual(scheduler.depth, 0)
+
+    def test_continuation_closes_opener(self):
+        '''A True from on_close closes the menu that opened the child'''
+        log = []
+        scheduler = MenuScheduler(script("down", "both", "up", "up"))
+        scheduler.run(LoopMenu(scheduler, log))
+        self.assertEqual(log.count("closed"), 1)
+        self.assertEqual(scheduler.depth, 0)
+        self.assertFalse(scheduler.running)
+
+    def test_preloop_close(self):
+        '''A menu whose preloop returns True closes without reading input'''
+        scheduler = MenuScheduler(script())
+        result = scheduler.open(ClosedMenu(), lambda: "done")
+        self.assertEqual(result, "done")
+        self.assertEqual(scheduler.depth, 0)
+
+    def test_eof(self):
+        '''End of input is sent to the menu as EOF'''
+        def read_line(prompt):
+            raise EOFError
+        scheduler = MenuScheduler(read_line)
+        menu = LoopMenu(scheduler, [])
+        menu.do_EOF = lambda arg: True
+        scheduler.run(menu)
+        self.assertEqual(scheduler.depth, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+'''Module to test the In Process Screen Layer; run from the top level directory'''
+import io
+import sys
+import unittest
+from unittest.mock import patch
+from src.screen import Screen, NullScreen, CLEAR_SCREEN, get_screen, set_screen
+from src.menu_helpers import clear, screen_frame
+
+
+class CountingStream(io.StringIO):
+    '''StringIO that counts write calls'''
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+class TestScreen(unittest.TestCase):
+    '''Class to test Screen, NullScreen and the menu helpers'''
+    def setUp(self):
+        self.stream = CountingStream()
+        self.previous = set_screen(Screen(self.stream))
+
+    def tearDown(self):
+        set_screen(self.previous)
+
+    def test_clear(self):
+        '''clear writes the escape sequence instead of forking a shell'''
+        clear()
+        self.assertEqual(self.stream.getvalue(), CLEAR_SCREEN)
+
+    def test_frame_is_one_write(self):
+        '''Everything printed in a frame reaches the stream in one write'''
+        with screen_frame():
+            print("line 1")
+            print("line 2")
+            self.assertEqual(self.stream.writes, 0)
+        self.assertEqual(self.stream.writes, 1)
+        self.assertEqual(self.stream.getvalue(), CLEAR_SCREEN + "line 1\nline 2\n")
+
+    def test_null_screen(self):
+        '''The null sink swallows frames and clears'''
+        set_screen(NullScreen())
+        with screen_frame():
+            print("hidden")
+        clear()
+        self.assertFalse(get_screen().isatty())
+        self.assertEqual(self.stream.getvalue(), "")
+
+    def test_legacy_console(self):
+        '''A console without virtual terminal mode is cleared with cls, other streams keep ANSI'''
+        with patch("src.screen.ANSI_CONSOLE", False), patch("src.screen.os.system") as system:
+            console = Screen(sys.__stdout__)
+            self.assertFalse(console.isatty())
+            with console.frame():
+                pass
+            system.assert_called_once_with("cls")
+            clear()
+            system.assert_called_once_with("cls")
+        self.assertEqual(self.stream.getvalue(), CLEAR_SCREEN)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+'''Module to test the Multi Session Game Server; run from the top level directory'''
+import asyncio
+import gc
+import socket
+import sys
+import tempfile
+import threading
+import unittest
+from src import console
+from src.server import GameServer, SessionOutput, SessionClosed
+from src.characters import Character, Fighter
+from src.dd_data import NullPrint
+from src.load_game import save, load_saves
+
+
+async def read_until(reader, text, timeout=5):
+    '''Reads from a Client Connection until text has Arrived'''
+    received = b""
+    while text.encode() not in received:
+        received += await asyncio.wait_for(reader.read(4096), timeout)
+    return received.decode()
+
+
+async def connect(server, player):
+    '''Opens a Client Connection and Signs in as player'''
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+    await read_until(reader, "Player Name >")
+    writer.write(f"{player}\n".encode())
+    return reader, writer
+
+
+class TestGameServer(unittest.TestCase):
+    '''Class to test GameServer sessions'''
+    def setUp(self):
+        self.stdin, self.stdout = sys.stdin, sys.stdout
+        self.temp_dir = tempfile.TemporaryDirectory() # pylint: disable=consider-using-with
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        console.uninstall()
+        self.assertIs(sys.stdout, self.stdout)
+        self.assertIs(sys.stdin, self.stdin)
+
+    def test_concurrent_sessions(self):
+        '''Sessions get their own menus, and exiting ends only that connection'''
+        async def scenario():
+            server = GameServer(port=0, save_directory=self.temp_dir.name)
+            await server.start()
+            clients = [await connect(server, f"player-{number}") for number in range(20)]
+            for reader, _ in clients:
+                await read_until(reader, "Main Menu >")
+            self.assertEqual(len(server.sessions), 20)
+            (reader_1, writer_1), (reader_2, writer_2) = clients[:2]
+            writer_1.write(b"new\n")
+            writer_2.write(b"exit\n")
+            new_game = await read_until(reader_1, "New Game >")
+            self.assertIn("Choose Your Class", new_game)
+            self.assertEqual(await asyncio.wait_for(reader_2.read(), 5), b"")
+            for _, writer in clients:
+                writer.close()
+            await server.stop()
+            for session in list(server.sessions):
+                session.join(5)
+            return new_game
+        asyncio.run(scenario())
+
+    def test_players_have_own_saves(self):
+        '''Each Player Saves to their own Slots, and a Name Plays in one Session at once'''
+        async def scenario():
+            server = GameServer(port=0, save_directory=self.temp_dir.name)
+            await server.start()
+            reader_1, writer_1 = await connect(server, "Alice")
+            await read_until(reader_1, "Main Menu >")
+            reader_2, writer_2 = await connect(server, "alice")
+            await read_until(reader_2, "alice is already playing")
+            writer_2.write(b"Bob\n")
+            await read_until(reader_2, "Main Menu >")
+            alice, bob = sorted(server.sessions, key=lambda session: session.player)
+            fighter = Fighter("Alices Hero")
+            fighter.printer = NullPrint()
+            save(fighter, "autosave", alice.adventure.saves)
+            self.assertEqual(load_saves(alice.adventure.saves)["autosave"].name, "Alices Hero")
+            self.assertEqual(load_saves(bob.adventure.saves)["autosave"], "EMPTY")
+            self.assertNotEqual(alice.adventure.saves.store.directory,
+                                bob.adventure.saves.store.directory)
+            for writer in (writer_1, writer_2):
+                writer.close()
+            await server.stop()
+            for session in (alice, bob):
+                session.join(5)
+            self.assertTrue(server.claim_player("Alice"))
+        asyncio.run(scenario())
+
+    def test_disconnect_autosaves(self):
+        '''A Client that Drops is Autosaved, Fleeing a Fight only with a Scroll of Escape'''
+        async def scenario():
+            server = GameServer(port=0, save_directory=self.temp_dir.name)
+            await server.start()
+            heroes = {"Town": (False, 0), "Fleeing": (True, 1), "Trapped": (True, 0)}
+            clients = {}
+            for player in heroes:
+                clients[player] = await connect(server, player)
+                await read_until(clients[player][0], "Main Menu >")
+            sessions = {session.player: session for session in server.sessions}
+            for player, (fighting, scrolls) in heroes.items():
+                hero = Fighter(f"{player} Hero")
+                hero.printer = NullPrint()
+                hero.scroll_of_escape = scrolls
+                sessions[player].adventure.character = hero
+                sessions[player].adventure.active_encounter = fighting
+            for _, writer in clients.values():
+                writer.close()
+            for session in sessions.values():
+                await asyncio.get_running_loop().run_in_executor(None, session.join, 5)
+            await server.stop()
+            saves = {player: load_saves(session.adventure.saves)["autosave"]
+                     for player, session in sessions.items()}
+            self.assertEqual(saves["Town"].name, "Town Hero")
+            self.assertEqual(saves["Fleeing"].name, "Fleeing Hero")
+            self.assertEqual(sessions["Fleeing"].adventure.character.scroll_of_escape, 0)
+            self.assertEqual(saves["Trapped"], "EMPTY")
+        asyncio.run(scenario())
+
+    def test_output_backpressure(self):
+        '''Output to a Client that Stops Reading is Bounded, then the Session is Closed'''
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        client, server_side = socket.socketpair()
+        async def open_writer():
+            return (await asyncio.open_connection(sock=server_side))[1]
+        writer = asyncio.run_coroutine_threadsafe(open_writer(), loop).result(5)
+        output = SessionOutput(loop, writer, high_water=4096, drain_timeout=0.5)
+        with self.assertRaises(SessionClosed):
+            for _ in range(100000):
+                output.write("x" * 1024)
+        async def buffered():
+            return writer.transport.get_write_buffer_size()
+        self.assertLess(asyncio.run_coroutine_threadsafe(buffered(), loop).result(5),
+                        256 * 1024)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+        loop.close()
+        client.close()
+
+    def test_active_characters(self):
+        '''Players' Characters with one Name are Tracked Apart and Dropped when Done'''
+        first, second = Fighter("Same Name"), Fighter("Same Name")
+        self.assertIn(first, Character.active_characters)
+        self.assertIn(second, Character.active_characters)
+        del first, second
+        gc.collect()
+        self.assertNotIn("Same Name", [character.name
+                                       for character in Character.active_characters])
+
+
+if __name__ == "__main__":
+    unittest.main()
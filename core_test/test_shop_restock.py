@@ -0,0 +1,71 @@
+'''Module to test the Background Shop Restock; run from the top level directory'''
+import unittest
+from random import Random
+from src.adventure import Adventure
+from src.simulation import build_character
+from src.characters import Fighter, Wizard
+from src.dd_data import NullPrint
+
+
+class TestShopRestock(unittest.TestCase):
+    '''Class to test that the Shop Stock is Prefetched and Collected'''
+    def make_adventure(self, char_class=Fighter, level=3, seed=7):
+        '''Seeded Adventure with a Character at level'''
+        adventure = Adventure(printer=NullPrint())
+        adventure.seed(seed)
+        adventure.character = build_character(char_class, level, rng=Random(seed))
+        return adventure
+
+    def names(self, adventure):
+        '''Names of the Items in the Shop, None for Bought ones'''
+        return {kind: item.name if item is not None else None
+                for kind, item in adventure.shop_inventory.items()}
+
+    def test_stocked_for_character(self):
+        '''The Shop holds one Item of each Type the Character can use'''
+        adventure = self.make_adventure(Wizard)
+        self.assertTrue(adventure.shop_stale)
+        inventory = adventure.shop_inventory
+        self.assertFalse(adventure.shop_stale)
+        self.assertEqual({kind: item.equipment_type for kind, item in inventory.items()},
+                         {"Weapon": "Weapon", "Armor": "Armor", "Accessory": "Accessory"})
+
+    def test_stock_kept_until_stale(self):
+        '''Opening the Shop again keeps the Stock and what was Bought'''
+        adventure = self.make_adventure()
+        first = self.names(adventure)
+        adventure.bought_item("Armor")
+        first["Armor"] = None
+        self.assertEqual(self.names(adventure), first)
+
+    def test_restocks_after_level_up(self):
+        '''A Level Up makes the Stock Stale and Prefetches the Next'''
+        adventure = self.make_adventure()
+        self.assertIsNotNone(adventure.shop_inventory)
+        character = adventure.character
+        character.gain_experience(character.experience_to_next
+                                  - character.experience_points, combat=True)
+        self.assertTrue(adventure.shop_stale)
+        adventure.prefetch_shop()
+        weapon = adventure.shop_inventory["Weapon"]
+        self.assertIsNotNone(weapon)
+        self.assertFalse(adventure.shop_stale)
+
+    def test_restocks_after_fresh_shop(self):
+        '''Returning to Town Restocks, even Bought Items'''
+        adventure = self.make_adventure()
+        adventure.bought_item("Weapon")
+        adventure.fresh_shop()
+        self.assertIsNotNone(adventure.shop_inventory["Weapon"])
+
+    def test_seeded_stock(self):
+        '''Seeded Adventures Stock the same Items, however long the Prefetch took'''
+        waited = self.make_adventure(seed=11)
+        waited.prefetch_shop()
+        for _ in range(3):
+            waited.character.generate_weapon()
+        self.assertEqual(self.names(waited), self.names(self.make_adventure(seed=11)))
+
+
+if __name__ == '__main__':
+    unittest.main()
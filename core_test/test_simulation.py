@@ -0,0 +1,61 @@
+'''Module to test the Headless Combat Simulator; run from the top level directory'''
+import unittest
+from src.simulation import (simulate_fight, build_character, FightResult,
+                            SkillPolicy, OffensiveSkillPolicy)
+from src.characters import Fighter, Ranger, Wizard
+from src.monsters.undead_src import Zombie
+from src.monsters.beast_src import Drake
+from src.dd_data import NullPrint
+
+
+class TestSimulation(unittest.TestCase):
+    '''Class to test simulate_fight'''
+    def test_result(self):
+        '''A fight returns a structured result'''
+        result = simulate_fight(Fighter, Zombie, 5)
+        self.assertIsInstance(result, FightResult)
+        self.assertEqual(result.character, "Fighter")
+        self.assertEqual(result.monster, "Zombie")
+        self.assertEqual(result.level, 5)
+        self.assertIn(result.winner, ("Character", "Monster", ""))
+        self.assertGreater(result.turns, 0)
+
+    def test_fight_ends(self):
+        '''Fights end in a win, a loss, an escape or the turn limit'''
+        for _ in range(20):
+            result = simulate_fight(Ranger, Drake, 10, max_turns=50)
+            self.assertLessEqual(result.turns, 50)
+            if result.winner:
+                self.assertFalse(result.escaped)
+
+    def test_skill_policies(self):
+        '''The Default Policy Uses Skills, Buffs only once a Fight; the Base Policy Never'''
+        class Recording(OffensiveSkillPolicy):
+            '''Offensive Policy that keeps every Skill Action it Chose'''
+            def __init__(self):
+                super().__init__()
+                self.chosen = []
+            def choose(self, character, monster):
+                actions = super().choose(character, monster)
+                if actions:
+                    self.chosen.extend(actions)
+                return actions
+        wizard = Recording()
+        simulate_fight(Wizard, Drake, 5, seed=1, skill_policy=wizard)
+        self.assertIn("Attack", [action[0] for action in wizard.chosen])
+        fighter = Recording()
+        simulate_fight(Fighter, Zombie, 12, seed=2, skill_policy=fighter)
+        self.assertIn("Fortify", fighter._spent) # pylint: disable=protected-access
+        self.assertEqual([action[0] for action in fighter.chosen].count("Aura"), 4)
+        self.assertIsNone(SkillPolicy().choose(build_character(Wizard, 5), None))
+
+    def test_build_character(self):
+        '''Characters are built at level, healed and silenced'''
+        character = build_character(Fighter, 12)
+        self.assertEqual(character.level, 12)
+        self.assertEqual(character.hit_points, character.max_hit_points)
+        self.assertIsInstance(character.printer, NullPrint)
+
+
+if __name__ == "__main__":
+    unittest.main()
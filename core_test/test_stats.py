@@ -0,0 +1,40 @@
+'''Module to test Closed Form Stats Leveling; run from the top level directory'''
+import unittest
+from random import Random
+from src.stats import Stats
+from src.monsters.beast_src import Drake
+from src.monsters.golem_src import StoneGolem
+
+
+class TestStats(unittest.TestCase):
+    '''Class to test Stats.at_level and Monster.set_level'''
+    structure = {"Hit Points": (40, 9), "Strength": (12, 3), "Agility": (8, 2),
+                 "Intelligence": (5, 1), "Special": (3, 4)}
+
+    def test_at_level(self):
+        '''at_level matches levelling up one level at a time'''
+        for level in (1, 2, 17, 50):
+            stepped = Stats(self.structure)
+            for _ in range(level - 1):
+                stepped.level_up()
+            direct = Stats.at_level(self.structure, level)
+            self.assertEqual(str(direct), str(stepped))
+            self.assertEqual(direct.max_hit_points, stepped.max_hit_points)
+            self.assertEqual(direct.special, stepped.special)
+            self.assertEqual(direct.hp_growth, 9)
+
+    def test_monster_levels(self):
+        '''Monsters built at a level match one levelled step by step'''
+        for monster_class in (Drake, StoneGolem):
+            direct = monster_class(40, Random(1))
+            stepped = monster_class(1, Random(1))
+            while stepped.level < 40:
+                stepped.level_up()
+            self.assertEqual(direct.level, 40)
+            self.assertEqual(direct.max_hit_points, stepped.max_hit_points)
+            self.assertEqual(direct.attack_power, stepped.attack_power)
+            self.assertEqual(direct.defense_power, stepped.defense_power)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,16 @@
 '''Main for Dungeon Dudes Game'''
+import argparse
+import atexit
+import os
 import sys
 import platform
-from src import MainMenu, save
+if "--profile" in sys.argv[1:]:
+    # Profiling wraps the hot paths as src is imported, so it is switched on first
+    os.environ["DD_PROFILE"] = "1"
+# pylint: disable=wrong-import-position
+from src import MainMenu, save, profiling
 from src.adventure import Adventure
+from src.server import run_server, DEFAULT_HOST, DEFAULT_PORT
 
 if platform.system() == "Windows":
     import ctypes
@@ -23,16 +31,32 @@ def set_green_text():
     else:
         raise UnsupportedOSError("Unsupported OS")
 
+def parse_args() -> argparse.Namespace:
+    '''Command Line Options, the game runs locally unless --serve is given'''
+    parser = argparse.ArgumentParser(description="Dungeon Dudes")
+    parser.add_argument("--serve", action="store_true",
+                        help="host many players over a TCP line protocol")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on")
+    parser.add_argument("--profile", action="store_true",
+                        help="count calls and time spent on the hot paths, same as DD_PROFILE=1")
+    return parser.parse_args()
+
 if __name__ == "__main__":
+    options = parse_args()
+    if profiling.ENABLED:
+        atexit.register(lambda: print(profiling.totals.report("Dungeon Dudes Profile")))
+    if options.serve:
+        run_server(options.host, options.port)
+        sys.exit()
     set_green_text()
     adventure = Adventure()
     try:
-        MainMenu(adventure).cmdloop()
+        adventure.scheduler.run(MainMenu(adventure))
     except KeyboardInterrupt:
         if adventure.character is None:
             print("Game Exited - Play Again Soon!")
         else:
-            adventure.character.printer = None
             if not adventure.active_encounter:
                 print(save(adventure.character))
             else:
@@ -1,18 +1,47 @@
 '''
 Session Management Module for Dungeon Dudes
 Sessions are named Adventures per the project theme
+
+The Shop is restocked in the background: as soon as a level up or a return
+to town makes the stock stale, the next stock is rolled on a worker thread,
+so opening the Shop only collects it.  The seed for a stock is drawn from the
+Character's Random Stream on the calling thread, so the stock is the same
+whether it was prefetched or rolled when the Shop opened.
 '''
-from src import singleton
+from concurrent.futures import Future, ThreadPoolExecutor
+from random import Random
+from typing import Dict, Optional
 from src.characters import Character
+from src.characters.equipment import Equipment
+from src.characters.equipment.item_engine import EquipmentEngine
+from src.dd_data import PrintSink, CombatPrint
+from src.menus.scheduler import MenuScheduler
+from src.save_writer import SaveWriter
+from src.load_game import save_writer
+
+_restocker : ThreadPoolExecutor = ThreadPoolExecutor(max_workers=2,
+                                                   thread_name_prefix="shop-restock")
+
+def roll_stock(generator : EquipmentEngine, level : int, seed : int) -> Dict[str, Equipment]:
+    '''Rolls one Item of each Equipment Type for the Shop'''
+    rng : Random = Random(seed)
+    return {"Weapon": generator.generate_weapon(level, rng),
+            "Armor": generator.generate_armor(level, rng),
+            "Accessory": generator.generate_accessory(level, rng)}
 
-@singleton
 class Adventure:
-    '''Session Manager for the Current Game'''
-    def __init__(self):
+    '''Session Manager for one Player's Game, the server runs one per connection'''
+    def __init__(self, printer : PrintSink = None, saves : SaveWriter = None):
         self._character : Character = None
+        self._printer : PrintSink = printer if printer is not None else CombatPrint()
+        self._saves : SaveWriter = saves if saves is not None else save_writer
+        self._rng : Random = Random()
+        self._scheduler : MenuScheduler = MenuScheduler()
         self._active_encounter : bool = False
         self._restock_shop : bool = True
         self._restock_level : int = 1
+        self._pending_stock : Optional[Future] = None
+        self._pending_level : int = 0
         self._shop_inventory : dict = {"Weapon": None,
                                        "Armor": None,
                                        "Accessory": None}
@@ -25,10 +54,39 @@ class Adventure:
     @character.setter
     def character(self, character: Character):
         if isinstance(character, Character):
+            character.rng = Random(self._rng.getrandbits(64))
             self._character = character
+            self.discard_prefetch()
+            self.fresh_shop()
         else:
             print("Not a valid Character for this Adventure!")
 
+    @property
+    def printer(self) -> PrintSink:
+        '''Getter for the Sink this Adventure's Encounters Print to'''
+        return self._printer
+
+    @property
+    def saves(self) -> SaveWriter:
+        '''Getter for the Writer of this Player's Save Slots'''
+        return self._saves
+
+    @property
+    def scheduler(self) -> MenuScheduler:
+        '''Getter for the Scheduler that Runs this Adventure's Menus'''
+        return self._scheduler
+
+    @property
+    def rng(self) -> Random:
+        '''Getter for the Adventure's Random Stream, Encounters derive from it'''
+        return self._rng
+
+    def seed(self, seed : int):
+        '''Reseeds the Adventure so every following Encounter is reproducible'''
+        self._rng.seed(seed)
+        if self._character is not None:
+            self._character.rng = Random(self._rng.getrandbits(64))
+
     @property
     def active_encounter(self) -> bool:
         '''Returns if Adventure is Currently Executing Combat'''
@@ -42,22 +100,53 @@ class Adventure:
     @property
     def shop_inventory(self):
         '''Getter for shop inventory, restocks if needed'''
-        if self._restock_shop or (self._restock_level != self._character.level):
+        if self.shop_stale:
             self.stock_shop()
         return self._shop_inventory
 
     def fresh_shop(self):
-        '''Setter for restocking the shop flag'''
+        '''Setter for restocking the shop flag, starts rolling the new Stock'''
         self._restock_shop = True
+        self.prefetch_shop()
+
+    @property
+    def shop_stale(self) -> bool:
+        '''True when the Shop will Restock the Next time it Opens'''
+        return self._restock_shop or (self._restock_level != self._character.level)
+
+    def prefetch_shop(self):
+        '''Starts Rolling the Next Stock in the Background if the Current one is Stale'''
+        if self._character is None or not self.shop_stale:
+            return
+        level : int = self._character.level
+        if self._pending_stock is not None:
+            if self._pending_level == level:
+                return
+            self.discard_prefetch()
+        self._pending_level = level
+        self._pending_stock = _restocker.submit(
+            roll_stock, self._character.equipment_generator, level,
+            self._character.rng.getrandbits(64))
+
+    def discard_prefetch(self):
+        '''Drops a Stock being Rolled in the Background'''
+        if self._pending_stock is not None:
+            self._pending_stock.cancel()
+            self._pending_stock = None
 
     def bought_item(self, item_type : str):
         '''Empty bought item from inventory'''
         self._shop_inventory[item_type] = None
 
     def stock_shop(self):
-        '''Restocks the Shop and Sets the Level the Shop was Last Stocked at'''
-        self._shop_inventory["Weapon"] = self._character.generate_weapon()
-        self._shop_inventory["Armor"] = self._character.generate_armor()
-        self._shop_inventory["Accessory"] = self._character.generate_accessory()
+        '''
+        Restocks the Shop and Sets the Level the Shop was Last Stocked at,
+        collecting the Prefetched Stock when one was Rolled for this Level
+        '''
+        self._restock_shop = True
+        self.prefetch_shop()
+        pending : Future = self._pending_stock
+        self._pending_stock = None
+        self._shop_inventory.update(pending.result())
         self._restock_shop = False
-        self._restock_level = self._character.level
+        self._restock_level = self._pending_level
@@ -0,0 +1,178 @@
+'''
+Monte Carlo Balance Runner for Dungeon Dudes
+Fans every Character class x Monster x level matchup out over a process pool
+Run from the top level directory: python -m src.balance --fights 100
+A fight that raises is counted as an error and the first traceback of each
+matchup is printed under the table; --strict stops at the first one instead.
+The simulated player follows a SkillPolicy, named in the report: by default
+a simple offensive one, so rates approximate rather than reproduce real play.
+'''
+import argparse
+import traceback
+from functools import partial
+from multiprocessing import Pool
+from random import Random
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Type
+from .characters import Character, Fighter, Rogue, Wizard, Cleric, Ranger
+from .monsters import Monster
+from .encounter_helpers import possible_monsters
+from .simulation import simulate_fight, SkillPolicy, OffensiveSkillPolicy
+from .menu_helpers import format_line, line_brackets
+
+character_classes : list = [Fighter, Rogue, Wizard, Cleric, Ranger]
+skill_policies : Dict[str, Type[SkillPolicy]] = {"skills": OffensiveSkillPolicy,
+                                                 "attack": SkillPolicy}
+
+class MatchupStats(NamedTuple):
+    '''Aggregated Fight Results for one Character x Monster x Level Matchup'''
+    character: str
+    monster: str
+    level: int
+    fights: int = 0
+    wins: int = 0
+    losses: int = 0
+    escapes: int = 0
+    errors: int = 0
+    win_turns: int = 0
+    loss_turns: int = 0
+    first_error: str = ""
+
+    @property
+    def win_rate(self) -> float:
+        '''Share of completed fights won by the Character'''
+        completed = self.fights - self.errors
+        return self.wins / completed if completed else 0.0
+
+    @property
+    def time_to_kill(self) -> float:
+        '''Mean turns the Character needed to defeat the Monster'''
+        return self.win_turns / self.wins if self.wins else 0.0
+
+    @property
+    def time_to_die(self) -> float:
+        '''Mean turns the Monster needed to defeat the Character'''
+        return self.loss_turns / self.losses if self.losses else 0.0
+
+    def merge(self, other: 'MatchupStats') -> 'MatchupStats':
+        '''Combines the counts of two results for the same Matchup, Keeping the first Error'''
+        return self._replace(first_error=self.first_error or other.first_error,
+                             **{field: getattr(self, field) + getattr(other, field)
+                                for field in self._fields[3:-1]})
+
+Task = Tuple[Type[Character], Type[Monster], int, int, str]
+
+def task_seed(seed: int, char_class: Type[Character],
+              monster_class: Type[Monster], level: int, chunk: int) -> str:
+    '''Seed for one task, independent of which worker runs it'''
+    return f"{seed}:{char_class.__name__}:{monster_class.__name__}:{level}:{chunk}"
+
+def run_matchup(task: Task, strict: bool = False,
+                policy: Type[SkillPolicy] = OffensiveSkillPolicy) -> MatchupStats:
+    '''
+    Worker: runs fights for a single Matchup on its own seeded stream, the
+    Character playing each with a new policy; fights that raise are counted
+    and the first traceback kept, or re-raised when strict
+    '''
+    char_class, monster_class, level, fights, seed = task
+    rng = Random(seed)
+    stats = MatchupStats(char_class.__name__, monster_class.__name__, level)
+    wins = losses = escapes = errors = win_turns = loss_turns = 0
+    first_error = ""
+    for _ in range(fights):
+        try:
+            result = simulate_fight(char_class, monster_class, level,
+                                    seed=rng.getrandbits(64), skill_policy=policy())
+        except Exception: # pylint: disable=broad-except
+            if strict:
+                raise
+            errors += 1
+            first_error = first_error or traceback.format_exc()
+            continue
+        if result.winner == "Character":
+            wins += 1
+            win_turns += result.turns
+        elif result.winner == "Monster":
+            losses += 1
+            loss_turns += result.turns
+        elif result.escaped:
+            escapes += 1
+    return stats._replace(fights=fights, wins=wins, losses=losses, escapes=escapes,
+                          errors=errors, win_turns=win_turns, loss_turns=loss_turns,
+                          first_error=first_error)
+
+def build_tasks(levels: Iterable[int], fights: int, seed: int,
+                chunk_size: int = 50) -> List[Task]:
+    '''Splits the full Matchup matrix into independently seeded tasks'''
+    tasks : List[Task] = []
+    for level in levels:
+        for char_class in character_classes:
+            for monster_class in possible_monsters:
+                for chunk, start in enumerate(range(0, fights, chunk_size)):
+                    tasks.append((char_class, monster_class, level,
+                                  min(chunk_size, fights - start),
+                                  task_seed(seed, char_class, monster_class,
+                                            level, chunk)))
+    return tasks
+
+def run_balance(levels: Iterable[int] = range(1, 51), fights: int = 100,
+                seed: int = 0, processes: int = None, chunk_size: int = 50,
+                strict: bool = False, policy: Type[SkillPolicy] = OffensiveSkillPolicy
+                ) -> Dict[Tuple[str, str, int], MatchupStats]:
+    '''Runs the Matchup matrix over a process pool and merges the results'''
+    tasks : List[Task] = build_tasks(levels, fights, seed, chunk_size)
+    table : Dict[Tuple[str, str, int], MatchupStats] = {}
+    with Pool(processes) as pool:
+        for stats in pool.imap_unordered(partial(run_matchup, strict=strict, policy=policy), tasks):
+            key = (stats.character, stats.monster, stats.level)
+            table[key] = table[key].merge(stats) if key in table else stats
+    return table
+
+def format_table(table: Dict[Tuple[str, str, int], MatchupStats],
+                 policy: Type[SkillPolicy] = OffensiveSkillPolicy) -> str:
+    '''Formats the merged results as a fixed width table, noting the policy played'''
+    header = (f"{'Class':9}{'Monster':16}{'Level':>6}{'Fights':>8}{'Win %':>8}"
+              f"{'TTK':>7}{'TTD':>7}{'Escapes':>9}{'Errors':>8}")
+    lines = [format_line, line_brackets(header), format_line]
+    for key in sorted(table, key=lambda key: (key[2], key[0], key[1])):
+        stats = table[key]
+        lines.append(line_brackets(
+            f"{stats.character:9}{stats.monster:16}{stats.level:>6}{stats.fights:>8}"
+            f"{stats.win_rate * 100:>8.1f}{stats.time_to_kill:>7.1f}"
+            f"{stats.time_to_die:>7.1f}{stats.escapes:>9}{stats.errors:>8}"))
+    lines.append(format_line)
+    lines.append(f"Simulated player: {policy.description}; rates approximate real play")
+    return "\n".join(lines)
+
+def format_errors(table: Dict[Tuple[str, str, int], MatchupStats]) -> str:
+    '''Formats the Error count and first Traceback of every Matchup that had Errors'''
+    reports : List[str] = []
+    for key in sorted(table, key=lambda key: (key[2], key[0], key[1])):
+        stats = table[key]
+        if stats.errors:
+            reports.append(f"{stats.character} vs {stats.monster} at level {stats.level}: "
+                           f"{stats.errors} error(s), first:\n{stats.first_error}")
+    return "\n".join(reports)
+
+def parse_levels(levels: str) -> range:
+    '''Parses a level band such as 1-50 or 25'''
+    first, _, last = levels.partition("-")
+    return range(int(first), int(last or first) + 1)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dungeon Dudes Balance Runner")
+    parser.add_argument("--levels", default="1-50", help="level band, e.g. 1-50")
+    parser.add_argument("--fights", type=int, default=100, help="fights per matchup")
+    parser.add_argument("--seed", type=int, default=0, help="base seed")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes")
+    parser.add_argument("--strict", action="store_true",
+                        help="re-raise the first fight that raises")
+    parser.add_argument("--policy", choices=sorted(skill_policies), default="skills",
+                        help="how the simulated player uses Skills")
+    args = parser.parse_args()
+    results = run_balance(parse_levels(args.levels), args.fights, args.seed,
+                          args.processes, strict=args.strict,
+                          policy=skill_policies[args.policy])
+    print(format_table(results, skill_policies[args.policy]))
+    errors = format_errors(results)
+    if errors:
+        print(errors)
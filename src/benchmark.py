@@ -0,0 +1,269 @@
+'''
+Benchmark Suite for Dungeon Dudes
+Times the hot paths on fixed seed fixtures: fights per class x Monster pair,
+Encounter and character sheet rendering, item generation per class, Monster
+construction at levels 1, 25 and 50, and save/load round trips.  Results are
+compared with a stored baseline and any case slower by more than the
+tolerance is reported as a regression.
+Run from the top level directory: python -m src.benchmark
+Record a new baseline with: python -m src.benchmark --save-baseline
+
+Each case is timed as the best of several repeats, each long enough to run
+for min_time seconds, so a single slow repeat does not count as a
+regression.  Before timing, each case is checked once per fixture seed, so a
+fight that only passes on some seeds counts as raising.  A case that raises
+is listed under errors in the baseline instead of getting a rate; any error
+the baseline does not list is a regression.  Baselines are only comparable on
+the machine that recorded them.
+'''
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+from itertools import cycle
+from random import Random
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+from .characters import Character, Fighter
+from .monsters.undead_src import Zombie
+from .encounter import Encounter
+from .encounter_helpers import possible_monsters
+from .balance import character_classes
+from .simulation import simulate_fight, build_character, build_monster
+from .character_codec import encode_character, decode_character
+from .save_store import SaveStore
+from .menu_helpers import format_line, line_brackets
+
+BASELINE_FILE : str = "src/dd_data/benchmark_baseline.json"
+FIGHT_LEVEL : int = 5
+FIGHT_SEEDS : range = range(64)
+FIXTURE_LEVEL : int = 10
+MONSTER_LEVELS : tuple = (1, 25, 50)
+BATCH_SIZE : int = 30
+
+class Case(NamedTuple):
+    '''A Named Operation, how many Units one Call of it Does and how many Calls Cover its Seeds'''
+    name: str
+    unit: str
+    operation: Callable[[], object]
+    units: int = 1
+    checks: int = 1
+
+class Measurement(NamedTuple):
+    '''Best Rate Measured for a Case, or the Error it Raised'''
+    name: str
+    unit: str
+    rate: float = 0.0
+    error: str = ""
+
+class Comparison(NamedTuple):
+    '''A Measurement against its Baseline Rate'''
+    measurement: Measurement
+    baseline: Optional[float]
+    change: Optional[float]
+    regression: bool
+
+def fight_cases() -> Iterator[Case]:
+    '''Fights per Second for every Character class x Monster pair'''
+    for char_class in character_classes:
+        for monster_class in possible_monsters:
+            seeds : Iterator[int] = cycle(FIGHT_SEEDS)
+            yield Case(f"fight.{char_class.__name__}.{monster_class.__name__}", "fights",
+                       lambda char_class=char_class, monster_class=monster_class, seeds=seeds:
+                       simulate_fight(char_class, monster_class, FIGHT_LEVEL,
+                                      seed=next(seeds)), checks=len(FIGHT_SEEDS))
+
+def render_cases() -> Iterator[Case]:
+    '''Encounter Panes and the Character Sheet, Redrawn and Cached'''
+    encounter = Encounter(build_character(Fighter, FIXTURE_LEVEL, rng=Random(1)),
+                          build_monster(Zombie, FIXTURE_LEVEL, Random(2)), seed=3)
+    def redraw_encounter() -> str:
+        encounter.bump_version()
+        return str(encounter)
+    yield Case("render.encounter", "renders", redraw_encounter)
+    yield Case("render.encounter.cached", "renders", encounter.__str__)
+    sheet = build_character(Fighter, FIXTURE_LEVEL, rng=Random(4)).sheet
+    def redraw_sheet() -> str:
+        sheet.invalidate()
+        return sheet.render()
+    yield Case("render.character_sheet", "renders", redraw_sheet)
+    yield Case("render.character_sheet.cached", "renders", sheet.render)
+
+def item_cases() -> Iterator[Case]:
+    '''Items per Second from each Class Generator, one at a Time and in Batches'''
+    for char_class in character_classes:
+        generator = build_character(char_class, 1, rng=Random(5)).equipment_generator
+        rng = Random(6)
+        def one_of_each(generator=generator, rng=rng) -> tuple:
+            return (generator.generate_weapon(FIXTURE_LEVEL, rng),
+                    generator.generate_armor(FIXTURE_LEVEL, rng),
+                    generator.generate_accessory(FIXTURE_LEVEL, rng))
+        yield Case(f"items.{char_class.__name__}", "items", one_of_each, 3)
+        yield Case(f"items.{char_class.__name__}.batch", "items",
+                   lambda generator=generator, rng=rng:
+                   generator.generate_weapons(FIXTURE_LEVEL, BATCH_SIZE, rng), BATCH_SIZE)
+
+def monster_cases() -> Iterator[Case]:
+    '''Monster Construction at each of MONSTER_LEVELS'''
+    for monster_class in possible_monsters:
+        for level in MONSTER_LEVELS:
+            rng = Random(level)
+            yield Case(f"monster.{monster_class.__name__}.{level}", "monsters",
+                       lambda monster_class=monster_class, level=level, rng=rng:
+                       build_monster(monster_class, level, rng))
+
+def persistence_cases(directory : str) -> Iterator[Case]:
+    '''Encode/Decode in Memory and Save/Load through a SaveStore in directory'''
+    character : Character = build_character(Fighter, FIXTURE_LEVEL, rng=Random(7))
+    yield Case("persistence.codec", "round trips",
+               lambda: decode_character(encode_character(character)))
+    store = SaveStore(os.path.join(directory, "saves"), os.path.join(directory, "legacy.pkl"))
+    def save_load() -> Optional[Character]:
+        store.save("save_1", character)
+        return store.load("save_1")
+    yield Case("persistence.save_store", "round trips", save_load)
+
+def benchmark_cases(directory : str) -> Iterator[Case]:
+    '''Every Case in the Suite, Persistence Writing under directory'''
+    yield from fight_cases()
+    yield from render_cases()
+    yield from item_cases()
+    yield from monster_cases()
+    yield from persistence_cases(directory)
+
+def measure(case : Case, min_time : float = 0.05, repeat : int = 5) -> Measurement:
+    '''Best Units per Second over repeat Runs of at least min_time Seconds'''
+    try:
+        for _ in range(case.checks):
+            case.operation()
+        number : int = 1
+        while True:
+            elapsed : float = time_calls(case.operation, number)
+            if elapsed >= min_time:
+                break
+            number *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+        best : float = elapsed
+        for _ in range(repeat - 1):
+            best = min(best, time_calls(case.operation, number))
+    except Exception as error:  # pylint: disable=broad-except
+        return Measurement(case.name, case.unit, error=type(error).__name__)
+    return Measurement(case.name, case.unit, number * case.units / best)
+
+def time_calls(operation : Callable[[], object], number : int) -> float:
+    '''Seconds taken to Call operation number Times, with the Collector Off as timeit does'''
+    collecting : bool = gc.isenabled()
+    gc.disable()
+    try:
+        start : float = perf_counter()
+        for _ in range(number):
+            operation()
+        return perf_counter() - start
+    finally:
+        if collecting:
+            gc.enable()
+
+def run_suite(only : List[str] = None, min_time : float = 0.05,
+              repeat : int = 5) -> List[Measurement]:
+    '''Measures every Case whose Name Starts with one of only, all when only is Empty'''
+    prefixes : tuple = tuple(only or ())
+    with tempfile.TemporaryDirectory() as directory:
+        return [measure(case, min_time, repeat) for case in benchmark_cases(directory)
+                if not prefixes or case.name.startswith(prefixes)]
+
+def read_baseline(path : str) -> dict:
+    '''The Baseline File's Contents, Empty if no Baseline has been Saved'''
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+def load_baseline(path : str = BASELINE_FILE) -> Dict[str, float]:
+    '''Baseline Rates by Case Name'''
+    return read_baseline(path).get("rates", {})
+
+def load_baseline_errors(path : str = BASELINE_FILE) -> Dict[str, str]:
+    '''Errors the Baseline Recorded by Case Name'''
+    return read_baseline(path).get("errors", {})
+
+def save_baseline(measurements : List[Measurement], path : str = BASELINE_FILE):
+    '''Stores the Rates and Errors that were Measured, Keeping Baseline Cases not Run this Time'''
+    rates : Dict[str, float] = load_baseline(path)
+    errors : Dict[str, str] = load_baseline_errors(path)
+    for measurement in measurements:
+        if measurement.error:
+            rates.pop(measurement.name, None)
+            errors[measurement.name] = measurement.error
+        else:
+            errors.pop(measurement.name, None)
+            rates[measurement.name] = round(measurement.rate, 3)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                   "rates": dict(sorted(rates.items())),
+                   "errors": dict(sorted(errors.items()))}, file, indent=1)
+        file.write("\n")
+
+def compare(measurements : List[Measurement], baseline : Dict[str, float],
+            tolerance : float = 0.25, known_errors : Dict[str, str] = None) -> List[Comparison]:
+    '''Flags Cases Slower than baseline by more than tolerance, or Failing when not known_errors'''
+    known_errors = known_errors or {}
+    comparisons : List[Comparison] = []
+    for measurement in measurements:
+        rate : Optional[float] = baseline.get(measurement.name)
+        if measurement.error:
+            comparisons.append(Comparison(measurement, rate, None,
+                                          measurement.name not in known_errors))
+        elif rate is None:
+            comparisons.append(Comparison(measurement, None, None, False))
+        else:
+            change : float = measurement.rate / rate - 1
+            comparisons.append(Comparison(measurement, rate, change, change < -tolerance))
+    return comparisons
+
+def format_report(comparisons : List[Comparison]) -> str:
+    '''Formats the Comparisons as a fixed width table'''
+    header = f"{'Case':32}{'Rate':>12}{'Unit':>16}{'Baseline':>12}{'Change':>9}"
+    lines = [format_line, line_brackets(header), format_line]
+    for measurement, baseline, change, regression in comparisons:
+        rate : str = measurement.error or f"{measurement.rate:.1f}"
+        base : str = "" if baseline is None else f"{baseline:.1f}"
+        delta : str = "" if change is None else f"{change * 100:+.1f}%"
+        lines.append(line_brackets(
+            f"{measurement.name[:32]:32}{rate[:12]:>12}{measurement.unit + '/s':>16}"
+            f"{base:>12}{delta:>9}{flag(measurement, regression):6}"))
+    lines.append(format_line)
+    regressions : int = sum(comparison.regression for comparison in comparisons)
+    errors : int = sum(bool(comparison.measurement.error) for comparison in comparisons)
+    lines.append(f"{regressions} regression(s) and {errors} error(s) in "
+                 f"{len(comparisons)} case(s)")
+    return "\n".join(lines)
+
+def flag(measurement : Measurement, regression : bool) -> str:
+    '''Marks a Regression as FAIL when the Case Raised and SLOW when it did not'''
+    if not regression:
+        return ""
+    return "  FAIL" if measurement.error else "  SLOW"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dungeon Dudes Benchmark Suite")
+    parser.add_argument("only", nargs="*", help="case name prefixes, e.g. fight.Wizard render")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store this run's rates as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="slowdown fraction reported as a regression")
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="seconds each timed repeat runs for")
+    parser.add_argument("--repeat", type=int, default=5, help="timed repeats per case")
+    args = parser.parse_args()
+    results = run_suite(args.only, args.min_time, args.repeat)
+    report = compare(results, load_baseline(args.baseline), args.tolerance,
+                     load_baseline_errors(args.baseline))
+    print(format_report(report))
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+    elif any(comparison.regression for comparison in report):
+        sys.exit(1)
@@ -0,0 +1,209 @@
+'''
+Versioned Character Save Format for Dungeon Dudes
+Only the state that defines a Character is written: its class, the values
+changed by play, its Stats, modifier tables and equipment.  Skills, the
+equipment generator, the experience table and the printer are derived from
+the class and rebuilt on load from a per class template.
+
+Layout: MAGIC, one byte schema version, then compact JSON.  Tuples, Stats,
+DamageVectors and Equipment are written as small tagged lists so they come
+back as the same types.  Older versions pass through MIGRATIONS in order.
+'''
+import copy
+import json
+from functools import lru_cache
+from random import Random
+from types import MethodType
+from typing import Callable, Dict, List, Tuple
+from .characters import Character, Fighter, Cleric, Rogue, Wizard, Ranger
+from .characters.equipment import Equipment, Weapon, Armor, Accessory
+from .dd_data import DamageVector, LimitedDict, NullPrint
+from .dd_data.damage_vector import damage_index
+from .stats import Stats
+
+MAGIC : bytes = b"DDCS"
+SCHEMA_VERSION : int = 1
+
+CHARACTER_CLASSES : Dict[str, type] = {cls.__name__: cls for cls in
+                                       (Fighter, Cleric, Rogue, Wizard, Ranger)}
+# Rebuilt from the class template on load, never written
+DERIVED_FIELDS : Tuple[str, ...] = ("_rng", "damage_types", "skills_dict", "passive_skills",
+                                    "printer", "_equipment_generator",
+                                    "_item_compatibility", "_exp_to_next_iter", "_sheet",
+                                    "deaths_cheated")
+# Written positionally, every other instance attribute goes in the "state" table
+CORE_FIELDS : Tuple[str, ...] = ("_name", "_level", "_experience_points", "_exp_to_next",
+                                 "_gold", "_hit_points", "_special", "_battles_won",
+                                 "_healing_potion", "_scroll_of_escape",
+                                 "_attack_power", "_defense_power", "_stats",
+                                 "_dam_modifiers", "_def_modifiers",
+                                 "_weapon", "_armor", "_accessory")
+
+MIGRATIONS : Dict[int, Callable[[dict], dict]] = {}
+
+class SaveFormatError(ValueError):
+    '''Raised for Data that is not a Character Save this Version can Read'''
+
+def migration(from_version : int):
+    '''Registers a Function that Upgrades a Decoded Body from from_version to the Next'''
+    def register(function : Callable[[dict], dict]) -> Callable[[dict], dict]:
+        MIGRATIONS[from_version] = function
+        return function
+    return register
+
+def encode_value(value):
+    '''Converts a Field Value into JSON Types, Tagging the Ones JSON can't Hold'''
+    if isinstance(value, tuple):
+        return ["t", [encode_value(item) for item in value]]
+    if isinstance(value, list):
+        return ["l", [encode_value(item) for item in value]]
+    if isinstance(value, dict):
+        return ["d", [[encode_value(key), encode_value(item)] for key, item in value.items()]]
+    if isinstance(value, DamageVector):
+        return ["v", value.active, list(value.values())]
+    if isinstance(value, Stats):
+        return ["s", [list(pair) for pair in value.structure().values()]]
+    if isinstance(value, Equipment):
+        return ["e", encode_equipment(value)]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise SaveFormatError(f"Can't save a {type(value).__name__}")
+
+def decode_value(value):
+    '''Inverse of encode_value'''
+    if not isinstance(value, list):
+        return value
+    tag : str = value[0]
+    if tag == "t":
+        return tuple(decode_value(item) for item in value[1])
+    if tag == "l":
+        return [decode_value(item) for item in value[1]]
+    if tag == "d":
+        return {decode_value(key): decode_value(item) for key, item in value[1]}
+    if tag == "v":
+        return DamageVector.from_values(value[2], value[1])
+    if tag == "s":
+        return Stats(dict(zip(("Hit Points", "Strength", "Agility", "Intelligence",
+                               "Special"), (tuple(pair) for pair in value[1]))))
+    if tag == "e":
+        return decode_equipment(value[1])
+    raise SaveFormatError(f"Unknown value tag {tag}")
+
+def encode_equipment(item : Equipment) -> list:
+    '''Equipment as [type, subtype, name, attack, armor, cost, ...modifiers, element]'''
+    attack, armor = item.item_stats
+    fields : list = [item.equipment_type, item.subtype, item.name, attack, armor, item.cost]
+    if isinstance(item, Weapon):
+        fields += [item.damage_type, encode_value(item.damage_modifiers)]
+    elif isinstance(item, Armor):
+        fields += [encode_value(item.defense_modifiers)]
+    elif isinstance(item, Accessory):
+        fields += [encode_value(item.damage_modifiers), encode_value(item.defense_modifiers)]
+        if item.element:
+            fields.append(item.element)
+    return fields
+
+def decode_equipment(fields : list) -> Equipment:
+    '''Inverse of encode_equipment'''
+    equipment_type, subtype, name, attack, armor, cost = fields[:6]
+    if equipment_type == "Weapon":
+        return Weapon(subtype, name, attack, {"Offensive": decode_value(fields[7])},
+                      armor=armor, dmg_type=fields[6], cost=cost)
+    if equipment_type == "Armor":
+        return Armor(subtype, name, armor, {"Defensive": decode_value(fields[6])},
+                     attack=attack, cost=cost)
+    if equipment_type == "Accessory":
+        return Accessory(subtype, name, {"Attack": attack, "Armor": armor,
+                                         "Offensive": decode_value(fields[6]),
+                                         "Defensive": decode_value(fields[7])}, cost=cost,
+                         element=fields[8] if len(fields) > 8 else "")
+    return Equipment((equipment_type, subtype), name, attack=attack, armor=armor, cost=cost)
+
+@lru_cache(maxsize=None)
+def class_template(char_class : str) -> Tuple[Character, List[int]]:
+    '''A Level 1 Character of a Class and its Full Experience Table, built Once'''
+    try:
+        cls : type = CHARACTER_CLASSES[char_class]
+    except KeyError as error:
+        raise SaveFormatError(f"Unknown character class {char_class}") from error
+    template : Character = cls("Template", Random(0))
+    Character.active_characters.discard(template)
+    exp_table : List[int] = ([template.experience_to_next]
+                             + list(copy.copy(template._exp_to_next_iter))) # pylint: disable=protected-access
+    return template, exp_table
+
+def rebind(value, template : Character, character : Character):
+    '''Copies Skill Tables, Moving Methods Bound to the Template onto character'''
+    if isinstance(value, MethodType) and value.__self__ is template:
+        return MethodType(value.__func__, character)
+    if isinstance(value, dict):
+        return {key: rebind(item, template, character) for key, item in value.items()}
+    if isinstance(value, list):
+        return [rebind(item, template, character) for item in value]
+    return value
+
+def encode_character(character : Character) -> bytes:
+    '''Encodes the Defining State of a Character'''
+    return encode_fields(character.char_class, vars(character))
+
+def encode_fields(char_class : str, fields : dict) -> bytes:
+    '''Encodes the Instance Attributes of a Character of char_class'''
+    state : dict = {key: encode_value(value) for key, value in fields.items()
+                    if key not in DERIVED_FIELDS and key not in CORE_FIELDS}
+    body : dict = {"class": char_class,
+                   "core": [encode_value(fields[key]) for key in CORE_FIELDS],
+                   "state": state}
+    return (MAGIC + bytes([SCHEMA_VERSION])
+            + json.dumps(body, separators=(",", ":")).encode("utf-8"))
+
+def read_body(data : bytes) -> dict:
+    '''Checks the Header and Migrates the Body up to SCHEMA_VERSION'''
+    if data[:len(MAGIC)] != MAGIC or len(data) <= len(MAGIC):
+        raise SaveFormatError("Not a Dungeon Dudes character save")
+    version : int = data[len(MAGIC)]
+    if version > SCHEMA_VERSION:
+        raise SaveFormatError(f"Save version {version} is newer than this game")
+    try:
+        body : dict = json.loads(data[len(MAGIC) + 1:].decode("utf-8"))
+    except ValueError as error:
+        raise SaveFormatError(f"Corrupt character save: {error}") from error
+    while version < SCHEMA_VERSION:
+        body = MIGRATIONS[version](body)
+        version += 1
+    return body
+
+def decode_character(data : bytes) -> Character:
+    '''Rebuilds a Character from encode_character Output'''
+    body : dict = read_body(data)
+    template, exp_table = class_template(body["class"])
+    character : Character = type(template).__new__(type(template))
+    fields : dict = vars(character)
+    fields.update(zip(CORE_FIELDS, (decode_value(value) for value in body["core"])))
+    fields.update({key: decode_value(value) for key, value in body["state"].items()})
+    fields["_rng"] = Random()
+    fields["damage_types"] = template.damage_types
+    fields["skills_dict"] = rebind(template.skills_dict, template, character)
+    fields["passive_skills"] = rebind(template.passive_skills, template, character)
+    fields["printer"] = NullPrint()
+    fields["_equipment_generator"] = type(template._equipment_generator)() # pylint: disable=protected-access
+    fields["_item_compatibility"] = list(template.item_compatibility)
+    fields["_exp_to_next_iter"] = iter(exp_table[character.level:])
+    return character
+
+def upgrade_value(value):
+    '''Converts a Value Pickled by the old Single File Saves into the Type now Used'''
+    if isinstance(value, LimitedDict) and all(key in damage_index for key, _ in value.items()):
+        vector : DamageVector = DamageVector(tuple(key for key, _ in value.items()))
+        for key, amount in value.items():
+            vector[key] = amount
+        return vector
+    return value
+
+def upgrade_legacy(character : Character) -> Character:
+    '''Rebuilds a Character Unpickled from the old saved_games.pkl in the Current Layout'''
+    fields : dict = {key: upgrade_value(value) for key, value in vars(character).items()}
+    return decode_character(encode_fields(character.char_class, fields))
+
+def is_encoded(data : bytes) -> bool:
+    '''True if data Starts with the Character Save Header'''
+    return data[:len(MAGIC)] == MAGIC
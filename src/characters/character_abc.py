@@ -1,16 +1,19 @@
 '''Character Class for Dungeon Dudes'''
 from abc import abstractmethod
-from typing import Dict, Tuple
+from typing import Tuple
 import sys
+from weakref import WeakSet
 from ..combatant_abc import Combatant
-from ..combat_action import CombatAction
+from ..combat_action import CombatAction, NO_HEAL
 from .equipment import Equipment, Weapon, Armor, Accessory, can_equip
-from .character_sheet import character_sheet
-from ..dd_data import CombatPrint
+from .equipment.item_engine import EquipmentEngine
+from .character_sheet import character_sheet, CharacterSheet
 
 class Character(Combatant):
     '''Abstract Base Class for Characters'''
-    active_characters : Dict[str, 'Character'] = {}
+    # Every Character alive in the process; weak, so finished games drop out, and
+    # not keyed by name, which players on one server share
+    active_characters : WeakSet = WeakSet()
     def __init__(self, name : str, char_type : str, stat_structure: dict,
                 item_compatibility : list):
         super().__init__(name, char_type, stat_structure)
@@ -24,7 +27,7 @@ class Character(Combatant):
         self.equip(self.generate_weapon())
         self.equip(self.generate_armor())
         self.equip(self.generate_accessory())
-        Character.active_characters[self.name] : [str, 'Character'] = self
+        Character.active_characters.add(self)
 
     @property
     def name(self) -> str:
@@ -138,14 +141,16 @@ class Character(Combatant):
     def gain_experience(self, amount : int, combat : bool = False):
         '''Gains experience and checks for level up'''
         self._experience_points += amount
+        self.sheet_changed("experience")
         while self._experience_points >= self._exp_to_next:
             self.level_up(combat=combat)
 
     def level_up(self, combat=False):
         '''Level up a Character'''
         super().level_up()
+        self.sheet_changed()
         if combat:
-            printer = CombatPrint()
+            printer = self.printer
             printer(f"{self.name} the {self.char_class} has reached level {self.level}!")
         else:
             print(f"{self.name} the {self.char_class} has reached level {self.level}!")
@@ -169,15 +174,18 @@ class Character(Combatant):
                 self._armor = equipment
             elif equipment.equipment_type == "Accessory":
                 self._accessory = equipment
+            self.sheet_changed("modifiers", "equipment")
         else:
             print(f"Cannot Equip {equipment.equipment_type} type {equipment.subtype}")
 
     def character_death(self, combat=False):
         '''Character Death Message'''
         if combat:
-            printer = CombatPrint()
+            printer = self.printer
             printer(f"You have died."
               f" The Epic Adventure of {self.name} comes to an end.")
+            if not printer.interactive:
+                return
             input("Play again soon!  Press Enter to exit... ")
             sys.exit()
         print(f"You have died.\n"
@@ -187,7 +195,7 @@ class Character(Combatant):
 
     def use_healing_potion(self) -> Tuple[bool, CombatAction]:
         '''Uses a Healing Potion and Returns the Current Combat Action'''
-        printer = CombatPrint()
+        printer = self.printer
         success = True
         if self.hit_points == self.max_hit_points:
             printer("Cannot Use Healing Potion, already at Max Health")
@@ -196,7 +204,7 @@ class Character(Combatant):
             printer("Cannot Use Healing Potion, No Healing Potions Left")
             success = False
         if not success:
-            return success, CombatAction([("Heal", 0, "Holy", "")], "")
+            return success, NO_HEAL
         current = self.hit_points
         heal_amount = int(self.max_hit_points * 0.45)
         self.hit_points += heal_amount
@@ -208,6 +216,11 @@ class Character(Combatant):
     def att_def_adjust(self, item: 'Equipment'):
         '''Attack and Defense Power Adjustment from gear'''
 
+    @property
+    def equipment_generator(self) -> EquipmentEngine:
+        '''Returns the Generator that Rolls Equipment for the Class'''
+        return self._equipment_generator
+
     @abstractmethod
     def generate_weapon(self) -> Weapon:
         '''Generates a suitable Weapon Equipment Item for your Class and Level'''
@@ -220,6 +233,20 @@ class Character(Combatant):
     def generate_accessory(self) -> Accessory:
         '''Generates a suitable Accessory Equipment Item for your Class and Level'''
 
+    @property
+    def sheet(self) -> CharacterSheet:
+        '''Returns the Character Sheet, Built the First time it is Shown'''
+        sheet : CharacterSheet = getattr(self, "_sheet", None)
+        if sheet is None:
+            sheet = self._sheet = CharacterSheet(self)
+        return sheet
+
+    def sheet_changed(self, *sections : str):
+        '''Marks Sections of the Character Sheet Dirty, every Section when none are Named'''
+        sheet : CharacterSheet = getattr(self, "_sheet", None)
+        if sheet is not None:
+            sheet.invalidate(*sections)
+
     def __str__(self):
         '''Prints the Character Sheet for the Character'''
         char_sheet = character_sheet(self)
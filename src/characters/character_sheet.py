@@ -1,5 +1,12 @@
-'''Character Sheet Generator'''
-from typing import TYPE_CHECKING
+'''
+Character Sheet Generator
+Every Character keeps a CharacterSheet holding its rendered sections.  equip,
+level_up, gain_experience and renaming mark the sections they change dirty,
+and only dirty sections are rendered again.  Hit Points, Special and Gold are
+also changed directly by the combat code of every class, so the stats section
+compares the values it shows instead of waiting to be told.
+'''
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Set, Tuple
 from ..menu_helpers import format_line
 
 if TYPE_CHECKING:
@@ -18,33 +25,7 @@ def pipe_wrapper(func):
 
 def character_sheet(character: 'Character'):
     '''Creates Character Sheet in Human Readable Format'''
-
-    stats_lines = format_stats(character)
-    stats_1, stats_2, stats_3, stats_4 = stats_lines
-
-    character_sheet_lines = [
-        format_line,
-        name_line(character),
-        format_line,
-        stats_section_headers(),
-        format_line,
-        stats_1,
-        stats_2,
-        stats_3,
-        stats_4,
-        format_line,
-        modifiers_section_headers(),
-        format_line,
-        "\n".join(modifier_lines(character)),
-        str(character.weapon_sheet),
-        str(character.armor_sheet),
-        str(character.accessory_sheet),
-        format_line,
-        experience_display(character),
-        format_line
-
-    ]
-    return "\n".join(character_sheet_lines)
+    return character.sheet.render()
 
 @pipe_wrapper
 def name_line(character :'Character') -> str:
@@ -60,9 +41,9 @@ def modifiers_section_headers() -> str:
 
 def modifier_lines(character: 'Character') -> str:
     '''Formats All Modifier and learned skill information'''
-    skills_list : list = character.get_skills_list()
     dam_types : tuple = character.damage_types
-    skills_list.extend([''] * (len(dam_types)-(len(skills_list))))
+    skills_list : list = character.get_skills_list()
+    skills_list = skills_list + [''] * (len(dam_types) - len(skills_list))
     dam_modifiers : dict = character.damage_modifiers
     def_modifiers : dict = character.defense_modifiers
     modifiers = []
@@ -113,3 +94,75 @@ def format_stats(character :'Character'):
                   "".join([combat_4, stats_4, equipment_4])]
 
     return stat_lines
+
+def stats_key(character: 'Character') -> tuple:
+    '''Every Value the Stats Section Shows'''
+    return (character.hit_points, character.max_hit_points, character.special,
+            character.max_special, character.strength, character.agility,
+            character.intelligence, character.attack_power, character.defense_power,
+            character.battles_won, character.gold, character.weapon, character.armor,
+            character.accessory)
+
+def equipment_cards(character: 'Character') -> str:
+    '''The Cards of the Equipped Items'''
+    return "\n".join([str(character.weapon_sheet), str(character.armor_sheet),
+                      str(character.accessory_sheet)])
+
+SECTIONS : Dict[str, Callable[['Character'], str]] = {
+    "name": name_line,
+    "stats": lambda character: "\n".join(format_stats(character)),
+    "modifiers": lambda character: "\n".join(modifier_lines(character)),
+    "equipment": equipment_cards,
+    "experience": experience_display,
+}
+
+class CharacterSheet:
+    '''Rendered Sections of one Character's Sheet, only Dirty ones are Rendered again'''
+    __slots__ = ("_character", "_sections", "_dirty", "_stats_key", "_text")
+
+    def __init__(self, character: 'Character'):
+        self._character : 'Character' = character
+        self._sections : Dict[str, str] = dict.fromkeys(SECTIONS, "")
+        self._dirty : Set[str] = set(SECTIONS)
+        self._stats_key : Optional[tuple] = None
+        self._text : str = ""
+
+    @property
+    def dirty(self) -> Tuple[str, ...]:
+        '''Sections the Next render will Redraw'''
+        return tuple(section for section in SECTIONS if section in self._dirty)
+
+    def invalidate(self, *sections: str):
+        '''Marks Sections Dirty, every Section when none are Named'''
+        self._dirty.update(sections or SECTIONS)
+
+    def render(self) -> str:
+        '''The Whole Sheet, Redrawing only the Dirty Sections'''
+        character = self._character
+        key : tuple = stats_key(character)
+        if key != self._stats_key:
+            self._stats_key = key
+            self._dirty.add("stats")
+        if not self._dirty:
+            return self._text
+        for section in self._dirty:
+            self._sections[section] = SECTIONS[section](character)
+        self._dirty.clear()
+        sections = self._sections
+        self._text = "\n".join([
+            format_line,
+            sections["name"],
+            format_line,
+            stats_section_headers(),
+            format_line,
+            sections["stats"],
+            format_line,
+            modifiers_section_headers(),
+            format_line,
+            sections["modifiers"],
+            sections["equipment"],
+            format_line,
+            sections["experience"],
+            format_line
+        ])
+        return self._text
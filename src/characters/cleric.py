@@ -1,11 +1,11 @@
 from typing import Dict, Tuple, List
-from random import gauss, randint
+from random import Random
 from math import floor
 from .character_abc import Character
 from ..combatant_abc import Combatant
 from .equipment import Equipment, Weapon, Armor, Accessory
-from ..dd_data import LimitedDict, damage_types, CombatPrint
-from ..combat_action import CombatAction
+from ..dd_data import DamageVector, damage_types, NullPrint
+from ..combat_action import CombatAction, NO_HEAL
 from .cleric_src import ClericEquipmentGenerator
 
 
@@ -18,7 +18,8 @@ class Cleric(Character):
                                                    "Special": (50, 15)}
     item_compatibility: list = ["Mace", "Flail", "Heavy", "Holy Symbol"]
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, rng: Random = None):
+        self.rng = rng
         self.damage_types = damage_types
         self.skills_dict: Dict[int, List[str, function]] = {
             1:  ["Heal", self.heal],
@@ -55,12 +56,12 @@ class Cleric(Character):
             25: ["Improved Healing", improved_healing]
         }
 
-        self.printer = CombatPrint()
+        self.printer = NullPrint()
         self._weapon: Weapon = None
         self._armor: Armor = None
         self._accessory: Accessory = None
-        self._def_modifiers = LimitedDict(self.damage_types, default_value=100)
-        self._dam_modifiers = LimitedDict("Physical", default_value=100)
+        self._def_modifiers = DamageVector(self.damage_types, default_value=100)
+        self._dam_modifiers = DamageVector("Physical", default_value=100)
 
         self._equipment_generator = ClericEquipmentGenerator()
         super().__init__(name, "Cleric", self.stats_structure,
@@ -148,7 +149,7 @@ class Cleric(Character):
     def modify_damage(self, damage) -> int:
         '''Adds Variance to Damage Events'''
         std_dev_percent: float = 0.12
-        modified: int = max(floor(gauss(damage,
+        modified: int = max(floor(self.rng.gauss(damage,
                                         (std_dev_percent * damage))), 1)
 
         return modified
@@ -219,11 +220,11 @@ class Cleric(Character):
                                            improved_healing_atk], "")
             else:
                 self.printer("Heal Failed: Already at Full Health!")
-                return False, CombatAction([("Heal", 0, "Holy", "")], "")
+                return False, NO_HEAL
 
         else:
             self.printer("Heal Failed: Not Enough Mana Remaining")
-            return False, CombatAction([("Heal", 0, "Holy", "")], "")
+            return False, NO_HEAL
 
     def radiance(self) -> [bool, CombatAction]:
         '''Deal Holy damage to all enemies for Intelligence + AtkPower'''
@@ -246,7 +247,7 @@ class Cleric(Character):
 
         else:
             self.printer("Radiance Failed: Not Enough Mana Remaining")
-            return False, CombatAction([("Heal", 0, "Holy", "")], "")
+            return False, NO_HEAL
 
     def prayer(self) -> [bool, CombatAction]:
         '''Protects self with incantation, raise defense modifier to'''
@@ -266,7 +267,7 @@ class Cleric(Character):
 
         else:
             self.printer("Prayer Failed: Not Enough Mana Remaining")
-            return False, CombatAction([("Heal", 0, "Holy", "")], "")
+            return False, NO_HEAL
 
     def avenger(self) -> [bool, CombatAction]:
         '''(Once per Battle) Increase Holy Damage Modifier by 30'''
@@ -287,10 +288,10 @@ class Cleric(Character):
             else:
                 self.printer("Avenger Failed: Can only use ",
                              "Avenger once per Battle")
-                return False, CombatAction([("Heal", 0, "Holy", "")], "")
+                return False, NO_HEAL
         else:
             self.printer("Avenger Failed: Not Enough Mana Remaining")
-            return False, CombatAction([("Heal", 0, "Holy", "")], "")
+            return False, NO_HEAL
 
     def greater_heal(self) -> [bool, CombatAction]:
         """Heal for 70% of Max HP, Reduce next incoming Damage Event by 50%"""
@@ -322,10 +323,10 @@ class Cleric(Character):
                                            improved_healing_atk], "")
             else:
                 self.printer("Greater Heal Failed: Already at Full Health!")
-                return False, CombatAction([("Heal", 0, "Holy", "")], "")
+                return False, NO_HEAL
         else:
             self.printer("Greater Heal Failed: Not Enough Mana Remaining")
-            return False, CombatAction([("Heal", 0, "Holy", "")], "")
+            return False, NO_HEAL
 
     def level_up(self, combat=False):
         ''' Handles the Events that occur at every Level Up'''
@@ -414,12 +415,12 @@ class Cleric(Character):
             return "None"
 
     @property
-    def damage_modifiers(self) -> LimitedDict:
+    def damage_modifiers(self) -> DamageVector:
         '''Getter for Damage Modifiers'''
         return self._dam_modifiers
 
     @property
-    def defense_modifiers(self) -> LimitedDict:
+    def defense_modifiers(self) -> DamageVector:
         '''Getter for Defense Modifiers'''
         return self._def_modifiers
 
@@ -507,12 +508,12 @@ class Cleric(Character):
 
     def generate_weapon(self) -> Weapon:
         '''Generates a suitable Weapon Equipment Item based on level'''
-        return self._equipment_generator.generate_weapon(self._level)
+        return self._equipment_generator.generate_weapon(self._level, self.rng)
 
     def generate_armor(self) -> Armor:
         '''Generates a suitable Armor Equipment Item based on level'''
-        return self._equipment_generator.generate_armor(self._level)
+        return self._equipment_generator.generate_armor(self._level, self.rng)
 
     def generate_accessory(self) -> Accessory:
         '''Generates a suitable Armor Equipment Item based on level'''
-        return self._equipment_generator.generate_accessory(self._level)
+        return self._equipment_generator.generate_accessory(self._level, self.rng)
@@ -1 +1,3 @@
-from .equipment import Equipment, Weapon, Armor, Accessory, can_equip
\ No newline at end of file
+from .equipment import (Equipment, Weapon, Armor, Accessory, can_equip, intern_modifiers,
+                        interned_count)
+from .item_batch import ItemRecord, to_equipment, generate_batch
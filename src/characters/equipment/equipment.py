@@ -1,23 +1,118 @@
-'''Character Equipment management for Dungeon Dudes'''
-from typing import Tuple, List
-from collections import defaultdict
+'''
+Character Equipment management for Dungeon Dudes
+Equipment is an immutable slotted record: rolled once, never changed, so the
+91 column item card shown in the Shop and on the Character Sheet is rendered
+the first time it is asked for and reused after that.
+
+Equipment is also a flyweight.  Building an item identical to one still alive
+anywhere in the process (a character, a shop, another server session) returns
+the live one, so identical items are the same object and compare by identity.
+Modifier pairs are interned too; there are only so many damage types and
+values, so that table stays small.  Whole modifier tuples are many more, so
+only the most recently built are kept for sharing.
+'''
+import sys
+import threading
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from weakref import WeakValueDictionary
 from ...menu_helpers import line_brackets
 
+Modifiers = Tuple[Tuple[str, int], ...]
+
+_interned : WeakValueDictionary = WeakValueDictionary()
+_intern_lock : threading.Lock = threading.Lock()
+_modifier_pairs : Dict[Tuple[str, int], Tuple[str, int]] = {}
+MODIFIER_TUPLES_KEPT : int = 4096
+
+@lru_cache(maxsize=MODIFIER_TUPLES_KEPT)
+def shared_modifiers(pairs : Modifiers) -> Modifiers:
+    '''The First Tuple Built equal to pairs, while it is among the Recently Used'''
+    return pairs
+
+def intern_modifiers(modifiers) -> Modifiers:
+    '''A Shared Tuple of the Shared (damage type, value) Pairs equal to modifiers'''
+    pairs : Modifiers = tuple(_modifier_pairs.setdefault((sys.intern(damage_type), value),
+                                                         (damage_type, value))
+                              for damage_type, value in modifiers)
+    return shared_modifiers(pairs)
+
+def interned_count() -> int:
+    '''Number of Distinct Items Alive'''
+    return len(_interned)
+
+class Interned(type):
+    '''Metaclass that Returns the Live Item Equal to a Newly Built one, if any'''
+    def __call__(cls, *args, **kwargs):
+        item = super().__call__(*args, **kwargs)
+        key : tuple = item.key
+        with _intern_lock:
+            shared = _interned.get(key)
+            if shared is None:
+                _interned[key] = shared = item
+        return shared
+
 def can_equip(item_compatibility : list, item_type : str) -> bool:
     '''Returns if Item can be Equipped by Class'''
     if item_type in item_compatibility:
         return True
     return False
 
-class Equipment:
+def format_modifier(modifiers : Modifiers, row : int) -> str:
+    '''One Row of a Modifier Column of an Item Card, blank past the Last Modifier'''
+    if row >= len(modifiers):
+        return " "
+    damage_type, value = modifiers[row]
+    return f"{damage_type}: {value}"
+
+class Equipment(metaclass=Interned):
     '''Equipment class for Dungeon Dudes'''
+    __slots__ = ("_name", "_equipment_type", "_equipment_subtype", "_item_stats", "_cost",
+                 "_card", "__weakref__")
+
     def __init__(self, equipment_type : Tuple, name: str, attack : int = 0,
                  armor : int = 0, cost : int = 0):
-        self._name : str = name
-        self._equipment_type : str = equipment_type[0]
-        self._equipment_subtype : str = equipment_type[1]
-        self.item_stats = (attack, armor)
-        self._cost = cost
+        self._set("_name", sys.intern(name))
+        self._set("_equipment_type", sys.intern(equipment_type[0]))
+        self._set("_equipment_subtype", sys.intern(equipment_type[1]))
+        self._set("_item_stats", (attack, armor))
+        self._set("_cost", cost)
+        self._set("_card", None)
+
+    def _set(self, attribute : str, value):
+        '''Sets a Slot while the Item is Built'''
+        object.__setattr__(self, attribute, value)
+
+    def __setattr__(self, attribute : str, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, attribute : str):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @property
+    def key(self) -> tuple:
+        '''Everything that Tells Items Apart, Equal Keys share one Item'''
+        return (type(self), self._equipment_type, self._equipment_subtype, self._name,
+                self._item_stats, self._cost)
+
+    def __reduce__(self):
+        '''Pickled Items are Rebuilt, so Unpickling Returns the Shared Item'''
+        attack, armor = self._item_stats
+        return (type(self), ((self._equipment_type, self._equipment_subtype), self._name,
+                             attack, armor, self._cost))
+
+    def __setstate__(self, state : dict):
+        '''Rebuilds an Item Pickled before Equipment was Slotted from its old __dict__'''
+        attack, armor = state["_item_stats"]
+        self.__init__(*self.legacy_arguments(state, attack, armor))
+        with _intern_lock:
+            _interned.setdefault(self.key, self)
+
+    @staticmethod
+    def legacy_arguments(state : dict, attack : int, armor : int) -> tuple:
+        '''Constructor Arguments for an Item from its old __dict__'''
+        return ((state["_equipment_type"], state["_equipment_subtype"]), state["_name"],
+                attack, armor, state.get("_cost", 0))
 
     @property
     def name(self) -> str:
@@ -39,24 +134,80 @@ class Equipment:
         '''Getter for Equipment Item Stats'''
         return self._item_stats
 
-    @item_stats.setter
-    def item_stats(self, att_arm : Tuple[int, int]):
-        attack, armor = att_arm
-        self._item_stats = (attack, armor)
-
     @property
     def cost(self):
         '''Getter for Equipment Value'''
         return self._cost
 
+    @property
+    def damage_columns(self) -> Modifiers:
+        '''Modifiers Shown in the Damage Column of the Card'''
+        return ()
+
+    @property
+    def defense_columns(self) -> Modifiers:
+        '''Modifiers Shown in the Defense Column of the Card'''
+        return ()
+
+    @property
+    def card(self) -> str:
+        '''The Item Card, Rendered Once'''
+        card : Optional[str] = self._card
+        if card is None:
+            card = self.render_card()
+            self._set("_card", card)
+        return card
+
+    def render_card(self) -> str:
+        '''Renders the 91 Column Item Card'''
+        format_line = "*"*91
+        lines :list = [format_line]
+        column_2 : Modifiers = self.damage_columns
+        column_3 : Modifiers = self.defense_columns
+        title_1a = f"{f'{self.name} ({self.equipment_type}):':55}"
+        title_1b = f"{f'Price: {self.cost} Gold ':>33}"
+        lines.append(line_brackets(f'{title_1a}{title_1b}'))
+        lines.append(format_line)
+        lines.append(line_brackets(
+            f'{"Attack and Armor: ":26}{"| Damage Modifiers: ":31}{"| Defense Modifiers: ":31}'))
+        lines.append(format_line)
+        rows : int = max(2, len(column_2), len(column_3))
+        for i in range(rows):
+            stat : str = f"{('Attack', 'Armor')[i]}: {self.item_stats[i]}" if i < 2 else ""
+            lines.append(line_brackets(
+                f"{stat:26}{f'| {format_modifier(column_2, i)}':31}"
+                f"| {format_modifier(column_3, i)}"))
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.card
+
 class Weapon(Equipment):
     '''Weapon Equipment Type'''
+    __slots__ = ("_dam_modifiers", "_damage_type")
+
     def __init__(self, equipment_type : str, name: str, attack : int, special: dict,
                  armor : int = 0, dmg_type : str = "Physical", cost=0):
-        self._dam_modifiers : List[Tuple[str, int]] = special["Offensive"]
         super().__init__(("Weapon", equipment_type), name, attack=attack,
                          armor=armor, cost=cost)
-        self._damage_type : str = dmg_type
+        self._set("_dam_modifiers", intern_modifiers(special["Offensive"]))
+        self._set("_damage_type", sys.intern(dmg_type))
+
+    @property
+    def key(self) -> tuple:
+        return super().key + (self._dam_modifiers, self._damage_type)
+
+    def __reduce__(self):
+        attack, armor = self._item_stats
+        return (Weapon, (self._equipment_subtype, self._name, attack,
+                         {"Offensive": self._dam_modifiers}, armor, self._damage_type,
+                         self._cost))
+
+    @staticmethod
+    def legacy_arguments(state : dict, attack : int, armor : int) -> tuple:
+        return (state["_equipment_subtype"], state["_name"], attack,
+                {"Offensive": state["_dam_modifiers"]}, armor,
+                state.get("_damage_type", "Physical"), state.get("_cost", 0))
 
     @property
     def damage_type(self):
@@ -64,133 +215,96 @@ class Weapon(Equipment):
         return self._damage_type
 
     @property
-    def damage_modifiers(self) -> List[Tuple[str, int]]:
+    def damage_modifiers(self) -> Modifiers:
         '''Getter for attack modifiers'''
         return self._dam_modifiers
 
-    def __str__(self):
-        format_line = "*"*91
-        lines :list = [format_line]
-        column_1 : list = ["Attack", "Armor"]
-        column_2 : list = self._dam_modifiers
-        title_1a = f"{f'{self.name} (Weapon):':55}"
-        title_1b = f"{f'Price: {self.cost} Gold ':>33}"
-        lines.append(line_brackets(f'{title_1a}{title_1b}'))
-        lines.append(format_line)
-        lines.append(line_brackets(
-            f'{"Attack and Armor: ":26}{"| Damage Modifiers: ":31}{"| Defense Modifiers: ":31}'))
-        lines.append(format_line)
-        rows : int = max(len(column_1), len(column_2))
-        column_1.extend([""] * (rows - len(column_1)))
-        column_2.extend([("","")] * (rows - len(column_2)))
-
-        for i, dam_type in enumerate(column_1):
-            col_2 = column_2[i]
-            col_2 = f"{col_2[0]}{':' if col_2[0] else ''} {col_2[1]}"
-            if i < 2:
-                lines.append(line_brackets(
-                    f"{f'{dam_type}: {self.item_stats[i]}':26}"+
-                    f"{f'| {col_2}':31}{f'| '}"
-                ))
-            else:
-                lines.append(line_brackets(
-                    f"{f'':26}{f'| {col_2}':31}{f'| '}"
-                ))
-        return "\n".join(lines)
+    @property
+    def damage_columns(self) -> Modifiers:
+        return self._dam_modifiers
 
 class Armor(Equipment):
     '''Armor Equipment Type'''
+    __slots__ = ("_def_modifiers",)
+
     def __init__(self, equipment_type : str, name: str, armor : int,
                  special: dict, attack : int = 0, cost : int = 0):
-        self._def_modifiers : List[Tuple[str, int]] = special["Defensive"]
         super().__init__(("Armor", equipment_type), name, attack=attack,
                          armor=armor, cost=cost)
+        self._set("_def_modifiers", intern_modifiers(special["Defensive"]))
+
+    @property
+    def key(self) -> tuple:
+        return super().key + (self._def_modifiers,)
+
+    def __reduce__(self):
+        attack, armor = self._item_stats
+        return (Armor, (self._equipment_subtype, self._name, armor,
+                        {"Defensive": self._def_modifiers}, attack, self._cost))
+
+    @staticmethod
+    def legacy_arguments(state : dict, attack : int, armor : int) -> tuple:
+        return (state["_equipment_subtype"], state["_name"], armor,
+                {"Defensive": state["_def_modifiers"]}, attack, state.get("_cost", 0))
 
     @property
-    def defense_modifiers(self) -> List[Tuple[str, int]]:
+    def defense_modifiers(self) -> Modifiers:
         '''Getter for Defense Modifiers'''
         return self._def_modifiers
 
-    def __str__(self):
-        format_line = "*"*91
-        lines :list = [format_line]
-        column_1 : list = ["Attack", "Armor"]
-        column_3 : list = self._def_modifiers
-        title_1a = f"{f'{self.name} (Armor):':55}"
-        title_1b = f"{f'Price: {self.cost} Gold ':>33}"
-        lines.append(line_brackets(f'{title_1a}{title_1b}'))
-        lines.append(format_line)
-        lines.append(line_brackets(
-            f'{"Attack and Armor: ":26}{"| Damage Modifiers: ":31}{"| Defense Modifiers: ":31}'))
-        lines.append(format_line)
-        rows : int = max(len(column_1), len(column_3))
-        column_1.extend([""] * (rows - len(column_1)))
-        column_3.extend([("", "")] * (rows - len(column_3)))
-
-        for i, dam_type in enumerate(column_1):
-            col_3 = column_3[i]
-            col_3 = f"{col_3[0]}{':' if col_3[0] else ''} {col_3[1]}"
-            if i < 2:
-                lines.append(line_brackets(
-                    f"{f'{dam_type}: {self.item_stats[i]}':26}"+
-                    f"{f'| ':31}{f'| {col_3}'}"
-                ))
-            else:
-                lines.append(line_brackets(
-                    f"{f'':26}{f'| ':31}{f'| {col_3}'}"
-                ))
-        return "\n".join(lines)
+    @property
+    def defense_columns(self) -> Modifiers:
+        return self._def_modifiers
 
 class Accessory(Equipment):
-    '''Accessory Equipment'''
-    def __init__(self, equipment_type : str, name: str, special: dict, cost : int = 0):
-        attack : int = special["Attack"]
-        armor : int = special["Armor"]
-        self._dam_modifiers : List[Tuple[str, int]] = special["Offensive"]
-        self._def_modifiers : List[Tuple[str, int]] = special["Defensive"]
-        super().__init__(("Accessory", equipment_type), name, attack=attack,
-                         armor=armor, cost=cost)
+    '''Accessory Equipment, element is the Damage Type a Quiver gives Arrows'''
+    __slots__ = ("_dam_modifiers", "_def_modifiers", "_element")
+
+    def __init__(self, equipment_type : str, name: str, special: dict, cost : int = 0,
+                 element : str = ""):
+        super().__init__(("Accessory", equipment_type), name, attack=special["Attack"],
+                         armor=special["Armor"], cost=cost)
+        self._set("_dam_modifiers", intern_modifiers(special["Offensive"]))
+        self._set("_def_modifiers", intern_modifiers(special["Defensive"]))
+        self._set("_element", sys.intern(element))
+
+    @property
+    def key(self) -> tuple:
+        return super().key + (self._dam_modifiers, self._def_modifiers, self._element)
+
+    def __reduce__(self):
+        attack, armor = self._item_stats
+        return (Accessory, (self._equipment_subtype, self._name,
+                            {"Attack": attack, "Armor": armor,
+                             "Offensive": self._dam_modifiers,
+                             "Defensive": self._def_modifiers}, self._cost, self._element))
+
+    @staticmethod
+    def legacy_arguments(state : dict, attack : int, armor : int) -> tuple:
+        return (state["_equipment_subtype"], state["_name"],
+                {"Attack": attack, "Armor": armor, "Offensive": state["_dam_modifiers"],
+                 "Defensive": state["_def_modifiers"]}, state.get("_cost", 0),
+                state.get("element", ""))
 
     @property
-    def damage_modifiers(self) -> List[Tuple[str, int]]:
+    def element(self) -> str:
+        '''Getter for the Accessory's Element, empty for most Accessories'''
+        return self._element
+
+    @property
+    def damage_modifiers(self) -> Modifiers:
         '''Getter for damage modifiers'''
         return self._dam_modifiers
 
     @property
-    def defense_modifiers(self) -> List[Tuple[str, int]]:
+    def defense_modifiers(self) -> Modifiers:
         '''Getter for Defense Modifiers'''
         return self._def_modifiers
 
-    def __str__(self):
-        format_line = "*"*91
-        lines :list = [format_line]
-        column_1 : list = ["Attack", "Armor"]
-        column_2 : list = self._dam_modifiers
-        column_3 : list = self._def_modifiers
-        title_1a = f"{f'{self.name} (Accessory):':55}"
-        title_1b = f"{f'Price: {self.cost} Gold ':>33}"
-        lines.append(line_brackets(f'{title_1a}{title_1b}'))
-        lines.append(format_line)
-        lines.append(line_brackets(
-            f'{"Attack and Armor: ":26}{"| Damage Modifiers: ":31}{"| Defense Modifiers: ":31}'))
-        lines.append(format_line)
-        rows : int = max(len(column_1), len(column_2), len(column_3))
-        column_1.extend([""] * (rows - len(column_1)))
-        column_2.extend([("","")] * (rows - len(column_2)))
-        column_3.extend([("", "")] * (rows - len(column_3)))
-
-        for i, dam_type in enumerate(column_1):
-            col_2 = column_2[i]
-            col_3 = column_3[i]
-            col_2 = f"{col_2[0]}{':' if col_2[0] else ''} {col_2[1]}"
-            col_3 = f"{col_3[0]}{':' if col_3[0] else ''} {col_3[1]}"
-            if i < 2:
-                lines.append(line_brackets(
-                    f"{f'{dam_type}: {self.item_stats[i]}':26}"+
-                    f"{f'| {col_2}':31}{f'| {col_3}'}"
-                ))
-            else:
-                lines.append(line_brackets(
-                    f"{f'':26}{f'| {col_2}':31}{f'| {col_3}'}"
-                ))
-        return "\n".join(lines)
+    @property
+    def damage_columns(self) -> Modifiers:
+        return self._dam_modifiers
+
+    @property
+    def defense_columns(self) -> Modifiers:
+        return self._def_modifiers
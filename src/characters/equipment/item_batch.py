@@ -0,0 +1,81 @@
+'''
+Batch Equipment Generation for Dungeon Dudes
+Loot tables, shop pre-rolls and economy simulations roll thousands of items
+at a time.  The generators draw every random value an item needs as a whole
+column up front, rng.choices(k=count) for choices and integer ranges, then
+assemble compact ItemRecord tuples in one pass with no Equipment objects in
+between.  to_equipment turns a record into the Weapon, Armor or Accessory
+the single item generators would have built.
+'''
+from random import Random
+from typing import List, NamedTuple, Sequence, Tuple
+from .equipment import Equipment, Weapon, Armor, Accessory
+
+Modifiers = Tuple[Tuple[str, int], ...]
+
+class ItemRecord(NamedTuple):
+    '''Compact Rolled Item, every Field an Immutable Value'''
+    equipment_type: str
+    subtype: str
+    name: str
+    attack: int
+    armor: int
+    cost: int
+    offensive: Modifiers = ()
+    defensive: Modifiers = ()
+    damage_type: str = "Physical"
+    element: str = ""
+
+def to_equipment(record : ItemRecord) -> Equipment:
+    '''Builds the Equipment Object a Record Describes'''
+    if record.equipment_type == "Weapon":
+        return Weapon(record.subtype, record.name, record.attack,
+                      special={"Offensive": record.offensive},
+                      armor=record.armor, dmg_type=record.damage_type, cost=record.cost)
+    if record.equipment_type == "Armor":
+        return Armor(record.subtype, record.name, record.armor,
+                     special={"Defensive": record.defensive},
+                     attack=record.attack, cost=record.cost)
+    return Accessory(record.subtype, record.name,
+                     {"Attack": record.attack, "Armor": record.armor,
+                      "Offensive": record.offensive,
+                      "Defensive": record.defensive}, cost=record.cost, element=record.element)
+
+def generate_batch(generator, equipment_type : str, level : int, count : int,
+                   rng : Random) -> List[ItemRecord]:
+    '''Rolls count Weapons, Armors or Accessories for level with a Class Generator'''
+    batch = {"Weapon": generator.generate_weapons,
+             "Armor": generator.generate_armors,
+             "Accessory": generator.generate_accessories}
+    try:
+        generate = batch[equipment_type]
+    except KeyError as error:
+        raise ValueError(f"Unknown equipment type {equipment_type}") from error
+    return generate(level, count, rng)
+
+def gauss_column(mu : float, sigma : float, count : int, rng : Random) -> List[float]:
+    '''count Draws from rng.gauss'''
+    gauss = rng.gauss
+    return [gauss(mu, sigma) for _ in range(count)]
+
+def randint_column(low : int, high : int, count : int, rng : Random) -> List[int]:
+    '''count Draws from rng.randint(low, high) in a Single Call'''
+    if low > high:
+        raise ValueError(f"empty range for randint_column ({low}, {high + 1})")
+    return rng.choices(range(low, high + 1), k=count)
+
+def choice_column(options : Sequence, count : int, rng : Random) -> list:
+    '''count Draws from rng.choice(options) in a Single Call'''
+    return rng.choices(options, k=count)
+
+def value_mod_column(avg : int, std : float, count : int, rng : Random,
+                     whole_mods : bool = False) -> Tuple[List[int], List[float]]:
+    '''
+    Batch generate_value_mod: the rolled values and their cost modifiers,
+    whole_mods truncates the modifiers as the Rogue Generator does
+    '''
+    raw : List[float] = gauss_column(avg, std, count, rng)
+    values : List[int] = [int(value) for value in raw]
+    if whole_mods:
+        return values, [int(value / avg) for value in values]
+    return values, [value / avg for value in raw]
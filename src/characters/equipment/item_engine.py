@@ -0,0 +1,503 @@
+'''
+Table Driven Equipment Generation for Dungeon Dudes
+Every class generator is an EquipmentEngine with one ItemTable per equipment
+type.  A table lists the components of an item: the stat rolls, damage and
+defense modifiers, a threshold PrefixTable and an AffixTable of rolled
+prefixes or suffixes with the effect each has.  The engine rolls the
+components of one item, or every component as a column for a batch (see
+item_batch), and both paths assemble ItemRecords the same way.
+
+Threshold and affix lookups bisect thresholds sorted once when the table is
+built, and the level dependent terms of each stat and cost formula are
+cached per level.  A new class needs only a set of tables.
+'''
+from bisect import bisect_left, bisect_right
+from math import ceil
+from random import Random
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+from ...profiling import profiled
+from .equipment import Weapon, Armor, Accessory
+from .item_batch import (ItemRecord, Modifiers, to_equipment, randint_column,
+                         choice_column, value_mod_column)
+
+Formula = Callable[[int], float]
+Bonus = Callable[[int, Random], int]
+ELEMENT : str = "{element}"
+
+class StatRoll:
+    '''
+    Gaussian Stat as generate_value_mod rolled it: the value, an offset and
+    floor applied after, and the cost modifier value / average
+    '''
+    def __init__(self, average : Formula, spread : Callable[[float], float],
+                 offset : int = 0, floor : Optional[int] = None, whole_mods : bool = False):
+        self._average : Formula = average
+        self._spread : Callable[[float], float] = spread
+        self._offset : int = offset
+        self._floor : Optional[int] = floor
+        self._whole_mods : bool = whole_mods
+        self._terms : Dict[int, Tuple[float, float]] = {}
+
+    def terms(self, level : int) -> Tuple[float, float]:
+        '''Average and Standard Deviation at level, worked out Once per Level'''
+        terms = self._terms.get(level)
+        if terms is None:
+            average : float = self._average(level)
+            terms = self._terms[level] = (average, self._spread(average))
+        return terms
+
+    def roll(self, level : int, rng : Random) -> Tuple[int, float]:
+        '''One Value and its Cost Modifier'''
+        average, spread = self.terms(level)
+        raw : float = rng.gauss(average, spread)
+        value : int = int(raw)
+        cost_mod : float = int(value / average) if self._whole_mods else raw / average
+        value += self._offset
+        if self._floor is not None and value < self._floor:
+            value = self._floor
+        return value, cost_mod
+
+    def column(self, level : int, count : int, rng : Random) -> Tuple[List[int], List[float]]:
+        '''count Values and their Cost Modifiers'''
+        average, spread = self.terms(level)
+        values, cost_mods = value_mod_column(average, spread, count, rng, self._whole_mods)
+        offset, floor = self._offset, self._floor
+        if offset:
+            values = [value + offset for value in values]
+        if floor is not None:
+            values = [max(floor, value) for value in values]
+        return values, cost_mods
+
+class FixedStat:
+    '''Stat Given by a Formula of the Level, it does not Change the Cost'''
+    def __init__(self, formula : Formula):
+        self._formula : Formula = formula
+        self._values : Dict[int, int] = {}
+
+    def value(self, level : int) -> int:
+        '''The Value at level, worked out Once per Level'''
+        value = self._values.get(level)
+        if value is None:
+            value = self._values[level] = self._formula(level)
+        return value
+
+    def roll(self, level : int, rng : Random) -> Tuple[int, float]: # pylint: disable=unused-argument
+        '''The Value at level, Cost Modifier of 1'''
+        return self.value(level), 1
+
+    def column(self, level : int, count : int, rng : Random) -> Tuple[List[int], List[float]]: # pylint: disable=unused-argument
+        '''count Copies of the Value, Cost Modifiers of 1'''
+        return [self.value(level)] * count, [1] * count
+
+class RangeStat:
+    '''Stat Rolled Uniformly between two Formulas of the Level, as randint does'''
+    def __init__(self, low : Formula, high : Formula):
+        self._low : Formula = low
+        self._high : Formula = high
+        self._ranges : Dict[int, range] = {}
+
+    def range(self, level : int) -> range:
+        '''The Values Possible at level, worked out Once per Level'''
+        values = self._ranges.get(level)
+        if values is None:
+            values = self._ranges[level] = range(self._low(level), self._high(level) + 1)
+            if not values:
+                raise ValueError(f"empty range for RangeStat at level {level}")
+        return values
+
+    def roll(self, level : int, rng : Random) -> Tuple[int, float]:
+        '''One Value, Cost Modifier of 1'''
+        return rng.choice(self.range(level)), 1
+
+    def column(self, level : int, count : int, rng : Random) -> Tuple[List[int], List[float]]:
+        '''count Values, Cost Modifiers of 1'''
+        return rng.choices(self.range(level), k=count), [1] * count
+
+Stat = Union[StatRoll, FixedStat, RangeStat]
+
+class Modifier(NamedTuple):
+    '''Damage Modifier on a Weapon or Accessory, by Subtype when damage_type is a Dict'''
+    damage_type: Union[str, Dict[str, str]]
+    stat: Stat
+    min_level: int = 0
+
+class PrefixTable:
+    '''Names keyed by Threshold, a Value gets the Name of the Largest Threshold below it'''
+    def __init__(self, names : Dict[int, str]):
+        self._thresholds : List[int] = sorted(names)
+        self._names : List[str] = [names[threshold] for threshold in self._thresholds]
+
+    def __getitem__(self, value : int) -> str:
+        index : int = bisect_left(self._thresholds, value)
+        return self._names[index - 1] if index else ""
+
+class Affix(NamedTuple):
+    '''Rolled Prefix or Suffix: its Name, the Effect it has and its Cost Modifier'''
+    name: str
+    position: str
+    effect: Callable[['ItemDraft', int, Random], Optional[int]]
+    cost_mod: float = 1
+
+class AffixTable:
+    '''Die from low to high, each Face's Affix holds up to the Next Face, None for none'''
+    def __init__(self, low : int, high : int, affixes : Dict[int, Optional[Affix]]):
+        self._low : int = low
+        self._high : int = high
+        self._faces : List[int] = sorted(affixes)
+        self._affixes : List[Optional[Affix]] = [affixes[face] for face in self._faces]
+        self._die : List[Optional[Affix]] = [self[roll] for roll in range(low, high + 1)]
+
+    def __getitem__(self, roll : int) -> Optional[Affix]:
+        index : int = bisect_right(self._faces, roll)
+        return self._affixes[index - 1] if index else None
+
+    def roll(self, rng : Random) -> Optional[Affix]:
+        '''One Rolled Affix, None where the Roll gives none'''
+        return rng.choice(self._die)
+
+    def column(self, count : int, rng : Random) -> List[Optional[Affix]]:
+        '''count Rolled Affixes, None where the Roll gives none'''
+        return rng.choices(self._die, k=count)
+
+class ItemDraft:
+    '''Mutable Item being Assembled, Affix Effects Change it'''
+    __slots__ = ("element", "attack", "armor", "offensive", "defensive", "exclude")
+
+    def __init__(self, element : str, attack : int, armor : int, offensive : list,
+                 defensive : list, exclude : tuple):
+        self.element : str = element
+        self.attack : int = attack
+        self.armor : int = armor
+        self.offensive : List[Tuple[str, int]] = offensive
+        self.defensive : List[Tuple[str, int]] = defensive
+        self.exclude : tuple = exclude
+
+# Resistances: a column of (defense modifiers, suffix name, damage types Resistant excludes)
+class SplitResist:
+    '''Two Resistances from a Suffix Mapping Sharing 20 + 2 * level, as Penalties'''
+    def __init__(self, mapping : Dict[tuple, str]):
+        self._pairs : list = list(mapping.items())
+
+    def roll(self, level : int, rng : Random) -> Tuple[Modifiers, str, tuple]:
+        '''One Rolled Pair'''
+        amount : int = 20 + (level * 2)
+        modifiers, suffix = rng.choice(self._pairs)
+        split : int = rng.randint(0, amount)
+        return ((modifiers[0], -split), (modifiers[1], split - amount)), suffix, modifiers
+
+    def column(self, level : int, count : int, rng : Random) -> List[Tuple[Modifiers, str, tuple]]:
+        '''count Rolled Pairs'''
+        amount : int = 20 + (level * 2)
+        pairs : list = choice_column(self._pairs, count, rng)
+        splits : List[int] = randint_column(0, amount, count, rng)
+        return [(((modifiers[0], -split), (modifiers[1], split - amount)), suffix, modifiers)
+                for (modifiers, suffix), split in zip(pairs, splits)]
+
+class TripleSplitResist:
+    '''A Suffix Pair and a Third Resistance Sharing 30 + 3 * level'''
+    def __init__(self, mapping : Dict[tuple, str], resistances : Sequence[str]):
+        self._pairs : list = list(mapping.items())
+        self._resistances : Sequence[str] = resistances
+        self._thirds : Dict[tuple, List[str]] = {
+            modifiers: [resist for resist in resistances if resist not in modifiers]
+            for modifiers in mapping}
+
+    def roll(self, level : int, rng : Random,
+             first : Optional[int] = None, pair : Optional[tuple] = None) -> Tuple[Modifiers, str, tuple]:
+        '''One Rolled Triple, the Batch passes in its Pair and First Share'''
+        amount : int = 30 + (level * 3)
+        modifiers, suffix = rng.choice(self._pairs) if pair is None else pair
+        if first is None:
+            first = rng.randint(1, amount - 2)
+        second : int = rng.randint(1, amount - 1 - first)
+        third : str = rng.choice(self._thirds[modifiers])
+        return (((modifiers[0], first), (modifiers[1], second),
+                 (third, amount - first - second)), suffix, modifiers)
+
+    def column(self, level : int, count : int, rng : Random) -> List[Tuple[Modifiers, str, tuple]]:
+        '''count Rolled Triples'''
+        amount : int = 30 + (level * 3)
+        pairs : list = choice_column(self._pairs, count, rng)
+        firsts : List[int] = randint_column(1, amount - 2, count, rng)
+        return [self.roll(level, rng, first, pair) for pair, first in zip(pairs, firsts)]
+
+class FixedResist:
+    '''The same Resistances on every Item, Resistant excludes a Random Suffix Pair'''
+    def __init__(self, damage_types : Sequence[str], amount : Formula,
+                 mapping : Optional[Dict[tuple, str]] = None, suffix : str = ""):
+        self._damage_types : Sequence[str] = damage_types
+        self._amount : Formula = amount
+        self._pairs : list = list(mapping) if mapping else [()]
+        self._suffix : str = suffix
+
+    def roll(self, level : int, rng : Random) -> Tuple[Modifiers, str, tuple]:
+        '''One Row of the Fixed Resistances'''
+        amount : int = self._amount(level)
+        return (tuple((damage_type, amount) for damage_type in self._damage_types),
+                self._suffix, rng.choice(self._pairs))
+
+    def column(self, level : int, count : int, rng : Random) -> List[Tuple[Modifiers, str, tuple]]:
+        '''count Rows of the Fixed Resistances'''
+        amount : int = self._amount(level)
+        modifiers : Modifiers = tuple((damage_type, amount) for damage_type in self._damage_types)
+        return [(modifiers, self._suffix, pair)
+                for pair in choice_column(self._pairs, count, rng)]
+
+class RandomResist:
+    '''picks Resistances of amount, each Drawn from damage_types, named for the Last'''
+    def __init__(self, damage_types : Sequence[str], picks : int, amount : Formula):
+        self._damage_types : Sequence[str] = damage_types
+        self._picks : int = picks
+        self._amount : Formula = amount
+
+    def roll(self, level : int, rng : Random) -> Tuple[Modifiers, str, tuple]:
+        '''One Row of Rolled Resistances'''
+        amount : int = self._amount(level)
+        row : list = [rng.choice(self._damage_types) for _ in range(self._picks)]
+        return tuple((damage_type, amount) for damage_type in row), row[-1], ()
+
+    def column(self, level : int, count : int, rng : Random) -> List[Tuple[Modifiers, str, tuple]]:
+        '''count Rows of Rolled Resistances'''
+        amount : int = self._amount(level)
+        picks : list = [choice_column(self._damage_types, count, rng) for _ in range(self._picks)]
+        return [(tuple((damage_type, amount) for damage_type in row), row[-1], ())
+                for row in zip(*picks)]
+
+Resist = Union[SplitResist, TripleSplitResist, FixedResist, RandomResist]
+
+class ItemTable(NamedTuple):
+    '''Everything the Engine needs to Roll one Equipment Type for a Class'''
+    equipment_type: str
+    subtypes: Tuple[str, ...]
+    name: str
+    base_cost: Formula = lambda level: level
+    cost_roll: Optional[RangeStat] = None
+    elements: Tuple[str, ...] = ()
+    attack: Optional[Stat] = None
+    armor: Optional[Stat] = None
+    cost_stats: Tuple[StatRoll, ...] = ()
+    offensive: Tuple[Modifier, ...] = ()
+    defensive: Optional[Resist] = None
+    prefixes: Optional[PrefixTable] = None
+    affixes: Optional[AffixTable] = None
+    damage_type: str = "Physical"
+
+# Bonuses and Affix Effects
+def gauss_bonus(divisor : int = 2, minimum : Optional[int] = None) -> Bonus:
+    '''ceil(gauss(level / divisor, level / 5)), at least minimum'''
+    def bonus(level : int, rng : Random) -> int:
+        value : int = ceil(rng.gauss(level / divisor, level / 5))
+        return value if minimum is None else max(minimum, value)
+    return bonus
+
+def level_bonus(formula : Formula) -> Bonus:
+    '''A Bonus Given by a Formula of the Level'''
+    return lambda level, rng: formula(level)
+
+def add_attack(bonus : Bonus):
+    '''Affix Effect Raising Attack'''
+    def effect(draft : ItemDraft, level : int, rng : Random) -> int:
+        value : int = bonus(level, rng)
+        draft.attack += value
+        return value
+    return effect
+
+def add_armor(bonus : Bonus):
+    '''Affix Effect Raising Armor'''
+    def effect(draft : ItemDraft, level : int, rng : Random) -> int:
+        value : int = bonus(level, rng)
+        draft.armor += value
+        return value
+    return effect
+
+def add_offense(damage_types : Sequence[str], bonus : Bonus):
+    '''Affix Effect Adding a Damage Modifier of one of damage_types, ELEMENT for the Item's'''
+    def effect(draft : ItemDraft, level : int, rng : Random) -> int:
+        damage_type : str = rng.choice(damage_types) if len(damage_types) > 1 else damage_types[0]
+        value : int = bonus(level, rng)
+        draft.offensive.append((draft.element if damage_type == ELEMENT else damage_type, value))
+        return value
+    return effect
+
+def add_resist(damage_types : Sequence[str], bonus : Bonus):
+    '''Affix Effect Adding a Resistance the Item doesn't have from its Suffix'''
+    def effect(draft : ItemDraft, level : int, rng : Random) -> int:
+        choices : list = [damage_type for damage_type in damage_types
+                          if damage_type not in draft.exclude]
+        value : int = bonus(level, rng)
+        draft.defensive.append((choices[0] if len(choices) == 1 else rng.choice(choices), value))
+        return value
+    return effect
+
+def boost_offense(bonus : Bonus):
+    '''Affix Effect Raising the First Damage Modifier'''
+    def effect(draft : ItemDraft, level : int, rng : Random) -> int:
+        value : int = bonus(level, rng)
+        damage_type, amount = draft.offensive[0]
+        draft.offensive[0] = (damage_type, amount + value)
+        return value
+    return effect
+
+def boost_defense(bonus : Bonus):
+    '''Affix Effect Raising the First Resistance'''
+    def effect(draft : ItemDraft, level : int, rng : Random) -> int:
+        value : int = bonus(level, rng)
+        damage_type, amount = draft.defensive[0]
+        draft.defensive[0] = (damage_type, amount + value)
+        return value
+    return effect
+
+NO_RESIST : Tuple[Modifiers, str, tuple] = ((), "", ())
+
+class LevelTerms(NamedTuple):
+    '''What a Table Needs at one Level, Worked out Once'''
+    table: ItemTable
+    base_cost: float
+    modifiers: Tuple[Modifier, ...]
+
+class EquipmentEngine:
+    '''Rolls Equipment from a Class's ItemTables, one at a time or in Batches'''
+    tables : Dict[str, ItemTable] = {}
+
+    def __init__(self):
+        self._terms : Dict[Tuple[str, int], LevelTerms] = {}
+
+    def __getstate__(self) -> dict:
+        '''The Cached Terms hold the Tables, they are Worked out again after Loading'''
+        return {}
+
+    def __setstate__(self, state : dict):
+        self._terms = {}
+
+    def level_terms(self, equipment_type : str, level : int) -> LevelTerms:
+        '''The Table, Base Cost and Damage Modifiers for an Equipment Type at level'''
+        terms : Optional[LevelTerms] = self._terms.get((equipment_type, level))
+        if terms is None:
+            try:
+                table : ItemTable = self.tables[equipment_type]
+            except KeyError as error:
+                raise ValueError(f"Unknown equipment type {equipment_type}") from error
+            terms = self._terms[(equipment_type, level)] = LevelTerms(
+                table, table.base_cost(level),
+                tuple(modifier for modifier in table.offensive if level >= modifier.min_level))
+        return terms
+
+    @profiled
+    def roll_one(self, equipment_type : str, level : int, rng : Random) -> ItemRecord:
+        '''Rolls a Single Item of an Equipment Type for level'''
+        terms : LevelTerms = self.level_terms(equipment_type, level)
+        table : ItemTable = terms.table
+        subtype : str = rng.choice(table.subtypes)
+        element : str = rng.choice(table.elements) if table.elements else ""
+        attack, attack_mod = table.attack.roll(level, rng) if table.attack else (0, 1)
+        armor, armor_mod = table.armor.roll(level, rng) if table.armor else (0, 1)
+        cost_mods : list = [attack_mod, armor_mod]
+        cost_mods += [stat.roll(level, rng)[1] for stat in table.cost_stats]
+        values : list = []
+        for modifier in terms.modifiers:
+            value, cost_mod = modifier.stat.roll(level, rng)
+            values.append(value)
+            cost_mods.append(cost_mod)
+        return self.assemble(
+            terms, level, rng, (subtype, element, attack, armor, values, cost_mods,
+                                table.defensive.roll(level, rng) if table.defensive
+                                else NO_RESIST,
+                                table.affixes.roll(rng) if table.affixes else None,
+                                table.cost_roll.roll(level, rng)[0] if table.cost_roll
+                                else None))
+
+    @profiled
+    def roll(self, equipment_type : str, level : int, count : int,
+             rng : Random) -> List[ItemRecord]:
+        '''Rolls count Items of an Equipment Type for level, one Column per Component'''
+        terms : LevelTerms = self.level_terms(equipment_type, level)
+        table : ItemTable = terms.table
+        ones : List[float] = [1] * count
+        subtypes : list = choice_column(table.subtypes, count, rng)
+        elements : list = (choice_column(table.elements, count, rng) if table.elements
+                           else [""] * count)
+        attacks, attack_mods = (table.attack.column(level, count, rng) if table.attack
+                                else ([0] * count, ones))
+        armors, armor_mods = (table.armor.column(level, count, rng) if table.armor
+                              else ([0] * count, ones))
+        cost_mod_columns : list = [attack_mods, armor_mods]
+        cost_mod_columns += [stat.column(level, count, rng)[1] for stat in table.cost_stats]
+        value_columns : list = []
+        for modifier in terms.modifiers:
+            values, cost_mods = modifier.stat.column(level, count, rng)
+            value_columns.append(values)
+            cost_mod_columns.append(cost_mods)
+        resists : list = (table.defensive.column(level, count, rng) if table.defensive
+                          else [NO_RESIST] * count)
+        affixes : list = (table.affixes.column(count, rng) if table.affixes
+                          else [None] * count)
+        costs : list = (table.cost_roll.column(level, count, rng)[0] if table.cost_roll
+                        else [None] * count)
+        return [self.assemble(terms, level, rng, rolls)
+                for rolls in zip(subtypes, elements, attacks, armors,
+                                 zip(*value_columns) if value_columns else [()] * count,
+                                 zip(*cost_mod_columns), resists, affixes, costs)]
+
+    @staticmethod
+    def assemble(terms : LevelTerms, level : int, rng : Random, rolls : tuple) -> ItemRecord:
+        '''
+        Builds the Record from one Item's Rolls: subtype, element, attack, armor,
+        damage modifier values, cost modifiers, resistances, affix and rolled cost
+        '''
+        subtype, element, attack, armor, values, cost_mods, resist, affix, cost = rolls
+        table : ItemTable = terms.table
+        defensive, resist_name, exclude = resist
+        offensive : list = []
+        for modifier, value in zip(terms.modifiers, values):
+            damage_type = modifier.damage_type
+            if damage_type.__class__ is dict:
+                damage_type = damage_type[subtype]
+            offensive.append((element if damage_type == ELEMENT else damage_type, value))
+        prefix : str = table.prefixes[offensive[0][1]] if table.prefixes else ""
+        suffix : str = ""
+        affix_mod : float = 1
+        if affix is not None:
+            draft = ItemDraft(element, attack, armor, offensive, list(defensive), exclude)
+            affix_name : str = affix.name.format(bonus=affix.effect(draft, level, rng),
+                                                 element=element)
+            if affix.position == "prefix":
+                prefix = affix_name
+            else:
+                suffix = affix_name
+            affix_mod = affix.cost_mod
+            attack, armor, defensive = draft.attack, draft.armor, draft.defensive
+        if cost is None:
+            cost = terms.base_cost
+            for mod in cost_mods:
+                cost *= mod
+            cost = ceil(cost * affix_mod)
+        return ItemRecord(table.equipment_type, subtype,
+                          table.name.format(prefix=prefix, subtype=subtype, suffix=suffix,
+                                            element=element, resist=resist_name).strip(),
+                          attack, armor, max(cost, 1), tuple(offensive), tuple(defensive),
+                          element if table.damage_type == ELEMENT else table.damage_type,
+                          element)
+
+    def generate_weapon(self, level : int, rng : Random) -> Weapon:
+        '''Generates a Weapon Object Appropriate for the Class at level'''
+        return to_equipment(self.roll_one("Weapon", level, rng))
+
+    def generate_armor(self, level : int, rng : Random) -> Armor:
+        '''Generates an Armor Object Appropriate for the Class at level'''
+        return to_equipment(self.roll_one("Armor", level, rng))
+
+    def generate_accessory(self, level : int, rng : Random) -> Accessory:
+        '''Generates an Accessory Object Appropriate for the Class at level'''
+        return to_equipment(self.roll_one("Accessory", level, rng))
+
+    def generate_weapons(self, level : int, count : int, rng : Random) -> List[ItemRecord]:
+        '''Rolls count Weapons for level in one Batch'''
+        return self.roll("Weapon", level, count, rng)
+
+    def generate_armors(self, level : int, count : int, rng : Random) -> List[ItemRecord]:
+        '''Rolls count Armors for level in one Batch'''
+        return self.roll("Armor", level, count, rng)
+
+    def generate_accessories(self, level : int, count : int, rng : Random) -> List[ItemRecord]:
+        '''Rolls count Accessories for level in one Batch'''
+        return self.roll("Accessory", level, count, rng)
@@ -1,11 +1,11 @@
 '''Module for the Dungeon Dudes Fighter Class'''
 from typing import Dict, Tuple, List
-from random import gauss, randint
+from random import Random
 from math import floor
 from .character_abc import Character
 from ..combatant_abc import Combatant
 from .equipment import Equipment, Weapon, Armor, Accessory
-from ..dd_data import LimitedDict, damage_types, CombatPrint
+from ..dd_data import DamageVector, damage_types, NullPrint
 from ..combat_action import CombatAction
 from .fighter_src import FighterEquipmentGenerator
 
@@ -14,7 +14,8 @@ class Fighter(Character):
     stats_structure : Dict[str, Tuple[int]]= {"Hit Points": (100, 25), "Strength": (13, 2),
                         "Agility" : (10, 1), "Intelligence" : (5, 0), "Special": (1,0)}
     item_compatibility : list = ["Sword", "Axe", "Mace", "Heavy", "Shield"]
-    def __init__(self, name : str):
+    def __init__(self, name : str, rng: Random = None):
+        self.rng = rng
         self.damage_types = damage_types
 
         self.skills_dict : Dict[int, List[str, 'function']]= {
@@ -34,12 +35,12 @@ class Fighter(Character):
            8 : ["Second Wind", second_wind],
            20: ["Improved Critical Strikes", improved_critical]
         }
-        self.printer = CombatPrint()
+        self.printer = NullPrint()
         self._weapon : Weapon = None
         self._armor : Armor = None
         self._accessory : Accessory = None
-        self._def_modifiers = LimitedDict(self.damage_types, default_value=100)
-        self._dam_modifiers = LimitedDict("Physical", default_value=100)
+        self._def_modifiers = DamageVector(self.damage_types, default_value=100)
+        self._dam_modifiers = DamageVector("Physical", default_value=100)
         self._equipment_generator = FighterEquipmentGenerator()
         super().__init__(name, "Fighter", self.stats_structure, self.item_compatibility)
         self._exp_to_next_iter = iter([(40 * i ** 2) for i in range(1, 50)])
@@ -112,12 +113,12 @@ class Fighter(Character):
     def modify_damage(self, damage, auto_crit = False) -> int:
         '''Adds Variance to Damage Events and Calculates Critical Chance'''
         std_dev_percent : int = 0.08
-        modified : int = max(floor(gauss(damage, (std_dev_percent * damage))), 1)
+        modified : int = max(floor(self.rng.gauss(damage, (std_dev_percent * damage))), 1)
         if auto_crit:
             self.printer("Critical Hit!")
             return modified * self._critical_modifier
         elif self._critical_modifier != 1:
-            if randint(1,10) == 10:
+            if self.rng.randint(1,10) == 10:
                 self.printer("Critical Hit!")
                 return modified * self._critical_modifier
 
@@ -265,17 +266,18 @@ class Fighter(Character):
             return "None"
 
     @property
-    def damage_modifiers(self) -> LimitedDict:
+    def damage_modifiers(self) -> DamageVector:
         '''Getter for Damage Modifiers'''
         return self._dam_modifiers
 
     @property
-    def defense_modifiers(self) -> LimitedDict:
+    def defense_modifiers(self) -> DamageVector:
         '''Getter for Defense Modifiers'''
         return self._def_modifiers
 
     def trigger_heroism(self, damage: int):
         '''Triggers Heroism to Prevent Character Death'''
+        self.cheat_death()
         self._special -= 1
         self._hit_points = self.max_hit_points // 4
         self.printer(f"Incoming Damage {damage} greater than current Hit Points: {self.hit_points}")
@@ -337,12 +339,12 @@ class Fighter(Character):
 
     def generate_weapon(self) -> Weapon:
         '''Generates a suitable Weapon Equipment Item based on level'''
-        return self._equipment_generator.generate_weapon(self._level)
+        return self._equipment_generator.generate_weapon(self._level, self.rng)
 
     def generate_armor(self) -> Armor:
         '''Generates a suitable Armor Equipment Item based on level'''
-        return self._equipment_generator.generate_armor(self._level)
+        return self._equipment_generator.generate_armor(self._level, self.rng)
 
     def generate_accessory(self) -> Accessory:
         '''Generates a suitable Armor Equipment Item based on level'''
-        return self._equipment_generator.generate_accessory(self._level)
+        return self._equipment_generator.generate_accessory(self._level, self.rng)
@@ -1,12 +1,12 @@
 '''Module for the Dungeon Dudes Ranger Class'''
 from typing import Dict, Tuple, List
-from random import gauss, choice
+from random import Random
 from math import floor
 from .character_abc import Character
 from ..combatant_abc import Combatant
 from .equipment import Equipment, Weapon, Armor, Accessory
-from ..dd_data import LimitedDict, damage_types, CombatPrint
-from ..combat_action import CombatAction
+from ..dd_data import DamageVector, damage_types, NullPrint
+from ..combat_action import CombatAction, NO_ACTION
 from .ranger_src import RangerEquipmentGenerator
 
 
@@ -19,7 +19,8 @@ class Ranger(Character):
                                               "Special": (2, 0)}
     item_compatibility: list = ["Bow", "Light", "Quiver"]
 
-    def __init__(self, name):
+    def __init__(self, name, rng: Random = None):
+        self.rng = rng
         self.damage_types = damage_types
 
         self.skills_dict: Dict[int, List[str, 'function']] = {
@@ -51,12 +52,12 @@ class Ranger(Character):
             20: [["Lucky Strike", lucky_strike]],
             25: [["Improved Animal Companion 2", improved_animal_companion]]
         }
-        self.printer = CombatPrint()
+        self.printer = NullPrint()
         self._weapon: Weapon = None
         self._armor: Armor = None
         self._accessory: Accessory = None
-        self._def_modifiers = LimitedDict(self.damage_types, default_value=100)
-        self._dam_modifiers = LimitedDict("Physical", default_value=100)
+        self._def_modifiers = DamageVector(self.damage_types, default_value=100)
+        self._dam_modifiers = DamageVector("Physical", default_value=100)
         self._equipment_generator = RangerEquipmentGenerator()
         super().__init__(name, "Ranger", self.stats_structure,
                          self.item_compatibility)
@@ -181,7 +182,7 @@ class Ranger(Character):
     def modify_damage(self, damage) -> int:
         '''Add Variance to Damaging Events'''
         modifier: int = floor(max(0, min(damage * .24,
-                              gauss(damage * .08, damage * .04))))
+                              self.rng.gauss(damage * .08, damage * .04))))
         return modifier
 
     def attack(self) -> CombatAction:
@@ -204,7 +205,7 @@ class Ranger(Character):
         '''Calculate Lucky Strike Chance'''
         if self._special > 0:
             selection = [1, 2]
-            chance = choice(selection)
+            chance = self.rng.choice(selection)
             if chance == 1:
                 damage *= 1.5
                 self._special -= 1
@@ -302,7 +303,7 @@ class Ranger(Character):
         if summoned:
             self.printer("You already summoned a 'Wolf' companion")
             end_turn = False
-            return end_turn, CombatAction([], "")
+            return end_turn, NO_ACTION
         # Calculate Wolf Damage and Turn on Awareness
         end_turn, damage = self.summon_attack_modifier(base_modifier)
         self._companion['Wolf'][1] = damage
@@ -325,7 +326,7 @@ class Ranger(Character):
         aura = self.awareness()
         if aura is not None:
             return True, CombatAction(aura, "")
-        return True, CombatAction([], "")
+        return True, NO_ACTION
 
     def summon_bear(self) -> [bool, CombatAction]:
         '''Summon a Bear Companion. Whenever the Ranger deals damage, the \
@@ -338,7 +339,7 @@ class Ranger(Character):
         if summoned:
             self.printer("You already summoned a 'Bear' companion")
             end_turn = False
-            return end_turn, CombatAction([], "")
+            return end_turn, NO_ACTION
         # Calculate Bear Damage
         end_turn, damage = self.summon_attack_modifier(base_modifier)
         self._companion['Bear'][1] = damage
@@ -373,7 +374,7 @@ class Ranger(Character):
         # Check if the trap is deployed already
         if self._trap[0]:
             self.printer("Steel Trap has been already deployed")
-            return False, CombatAction([], "")
+            return False, NO_ACTION
         # Turn the trap flag on
         self._trap[0] = True
         self._trap[1] = int(self._attack_power * .50)
@@ -404,7 +405,7 @@ class Ranger(Character):
         if summoned:
             self.printer("You already summoned a 'Cat' companion")
             end_turn = False
-            return end_turn, CombatAction([], "")
+            return end_turn, NO_ACTION
         # Calculate Cat Damage and attack modifier
         end_turn, damage = self.summon_attack_modifier(base_modifier)
         self._companion['Cat'][1] = damage
@@ -535,12 +536,12 @@ class Ranger(Character):
             return "None"
 
     @property
-    def damage_modifiers(self) -> LimitedDict:
+    def damage_modifiers(self) -> DamageVector:
         '''Getter for Damage Modifiers'''
         return self._dam_modifiers
 
     @property
-    def defense_modifiers(self) -> LimitedDict:
+    def defense_modifiers(self) -> DamageVector:
         '''Getter for Defense Modifiers'''
         return self._def_modifiers
 
@@ -552,6 +553,7 @@ class Ranger(Character):
         damage = int(damage * self._def_modifiers[dmg_type]/100)
         if damage >= self.hit_points:
             if self._special > 0:
+                self.cheat_death()
                 message = message.replace('<value>', str(damage))
                 self.printer(message)
                 return alive
@@ -615,12 +617,12 @@ class Ranger(Character):
 
     def generate_weapon(self) -> Weapon:
         '''Generates a suitable Weapon Equipment Item based on level'''
-        return self._equipment_generator.generate_weapon(self._level)
+        return self._equipment_generator.generate_weapon(self._level, self.rng)
 
     def generate_armor(self) -> Armor:
         '''Generates a suitable Armor Equipment Item based on level'''
-        return self._equipment_generator.generate_armor(self._level)
+        return self._equipment_generator.generate_armor(self._level, self.rng)
 
     def generate_accessory(self) -> Accessory:
         '''Generates a suitable Armor Equipment Item based on level'''
-        return self._equipment_generator.generate_accessory(self._level)
+        return self._equipment_generator.generate_accessory(self._level, self.rng)
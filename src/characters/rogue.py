@@ -1,12 +1,12 @@
 '''Module for the Dungeon Dudes Rogue Class'''
 from typing import Dict, Tuple, List
-from random import gauss, randint
+from random import Random
 from math import floor
 from .character_abc import Character
 from ..combatant_abc import Combatant
 from .equipment import Equipment, Weapon, Armor, Accessory
-from ..dd_data import LimitedDict, damage_types, CombatPrint
-from ..combat_action import CombatAction
+from ..dd_data import DamageVector, damage_types, NullPrint
+from ..combat_action import CombatAction, NO_HEAL
 from .rogue_src import RogueEquipmentGenerator
 
 
@@ -19,7 +19,8 @@ class Rogue(Character):
                                                    "Special": (1, 0)}
     item_compatibility: list = ["Dagger", "Medium", "Thieves Tools"]
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, rng: Random = None):
+        self.rng = rng
         self.damage_types = damage_types
 
         self.skills_dict: Dict[int, List] = {
@@ -59,12 +60,12 @@ class Rogue(Character):
             20: ["Auto-Potion", auto_potion],
             25: ["Enhanced Abilities", enhanced_abilities]
         }
-        self.printer = CombatPrint()
+        self.printer = NullPrint()
         self._weapon: Weapon = None
         self._armor: Armor = None
         self._accessory: Accessory = None
-        self._def_modifiers = LimitedDict(self.damage_types, default_value=100)
-        self._dam_modifiers = LimitedDict(("Physical", "Poision"),
+        self._def_modifiers = DamageVector(self.damage_types, default_value=100)
+        self._dam_modifiers = DamageVector(("Physical", "Poison"),
                                           default_value=100)
         self._equipment_generator = RogueEquipmentGenerator()
         super().__init__(name, "Rogue", self.stats_structure,
@@ -150,7 +151,7 @@ class Rogue(Character):
 
     def modify_damage(self, damage) -> int:
         '''Adds Variance to Damage Events'''
-        return damage + floor(max(0, min(damage * 0.24, gauss(damage * 0.08,
+        return damage + floor(max(0, min(damage * 0.24, self.rng.gauss(damage * 0.08,
                                                               damage * 0.04))))
 
     def poison_attack(self, base_damage) -> Tuple[str, int, str, str]:
@@ -236,7 +237,7 @@ class Rogue(Character):
 
     def use_healing_potion(self) -> Tuple[bool, CombatAction]:
         '''Uses a Healing Potion and Returns the Current Combat Action'''
-        printer = CombatPrint()
+        printer = self.printer
         success = True
         if self.hit_points == self.max_hit_points:
             printer("Cannot Use Healing Potion, already at Max Health")
@@ -245,7 +246,7 @@ class Rogue(Character):
             printer("Cannot Use Healing Potion, No Healing Potions Left")
             success = False
         if not success:
-            return success, CombatAction([("Heal", 0, "Holy", "")], "")
+            return success, NO_HEAL
         current = self.hit_points
         heal_amount = int(self.max_hit_points * 0.45)
         self.hit_points += heal_amount
@@ -443,12 +444,12 @@ class Rogue(Character):
             return "None"
 
     @property
-    def damage_modifiers(self) -> LimitedDict:
+    def damage_modifiers(self) -> DamageVector:
         '''Getter for Damage Modifiers'''
         return self._dam_modifiers
 
     @property
-    def defense_modifiers(self) -> LimitedDict:
+    def defense_modifiers(self) -> DamageVector:
         '''Getter for Defense Modifiers'''
         return self._def_modifiers
 
@@ -511,7 +512,7 @@ class Rogue(Character):
             damage = damage - (self._defense_power // 2)
         damage = int(damage * self._def_modifiers[dmg_type]/100)
         if damage > 1 and self._evasion_active:
-            if randint(0, 99) < self._evasion_chance:
+            if self.rng.randint(0, 99) < self._evasion_chance:
                 self.printer((f"{self.name} succssfully evaded "
                               f"incoming {damage} damage"))
                 self._evasion_count -= 1
@@ -578,7 +579,7 @@ class Rogue(Character):
             self.gain_experience(exp, combat=True)
             # Healing potion affinity passive
             if self._level >= 5:
-                random_int = randint(0, 99) * 10
+                random_int = self.rng.randint(0, 99) * 10
                 chance_for_potion = self.level * 15
                 if random_int < chance_for_potion:
                     self.printer(("Healing Potion Affinity Passive: "
@@ -587,12 +588,12 @@ class Rogue(Character):
 
     def generate_weapon(self) -> Weapon:
         '''Generates a suitable Weapon Equipment Item based on level'''
-        return self._equipment_generator.generate_weapon(self._level)
+        return self._equipment_generator.generate_weapon(self._level, self.rng)
 
     def generate_armor(self) -> Armor:
         '''Generates a suitable Armor Equipment Item based on level'''
-        return self._equipment_generator.generate_armor(self._level)
+        return self._equipment_generator.generate_armor(self._level, self.rng)
 
     def generate_accessory(self) -> Accessory:
         '''Generates a suitable Armor Equipment Item based on level'''
-        return self._equipment_generator.generate_accessory(self._level)
+        return self._equipment_generator.generate_accessory(self._level, self.rng)
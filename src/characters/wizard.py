@@ -1,11 +1,12 @@
 """Module for the Dungeon Dudes Wizard Class"""
+from random import Random
 from typing import Dict, Tuple, List
 from math import ceil
 from .character_abc import Character
 from ..combatant_abc import Combatant
 from .equipment import Equipment, Weapon, Armor, Accessory
-from ..dd_data import LimitedDict, damage_types, CombatPrint
-from ..combat_action import CombatAction
+from ..dd_data import DamageVector, damage_types, NullPrint
+from ..combat_action import CombatAction, NO_HEAL
 from .wizard_src import WizardEquipmentGenerator
 
 
@@ -19,7 +20,8 @@ class Wizard(Character):
 
     item_compatibility: list = ["Staff", "Wand", "Robes", "Arcane Orb"]
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, rng: Random = None):
+        self.rng = rng
         self.damage_types = damage_types
 
         self.skills_dict: Dict[int, List[str, 'function']] = {
@@ -47,12 +49,12 @@ class Wizard(Character):
             25: ["Elemental Master", elemental_master]
         }
 
-        self.printer = CombatPrint()
+        self.printer = NullPrint()
         self._weapon: Weapon = None
         self._armor: Armor = None
         self._accessory: Accessory = None
-        self._def_modifiers = LimitedDict(self.damage_types, default_value=100)
-        self._dam_modifiers = LimitedDict(("Fire", "Lightning", "Ice"),
+        self._def_modifiers = DamageVector(self.damage_types, default_value=100)
+        self._dam_modifiers = DamageVector(("Fire", "Lightning", "Ice"),
                                           default_value=100)
         self._equipment_generator = WizardEquipmentGenerator()
         super().__init__(name, "Wizard", self.stats_structure,
@@ -130,12 +132,12 @@ class Wizard(Character):
             return "None"
 
     @property
-    def damage_modifiers(self) -> LimitedDict:
+    def damage_modifiers(self) -> DamageVector:
         '''Getter for Damage Modifiers'''
         return self._dam_modifiers
 
     @property
-    def defense_modifiers(self) -> LimitedDict:
+    def defense_modifiers(self) -> DamageVector:
         '''Getter for Defense Modifiers'''
         return self._def_modifiers
 
@@ -492,19 +494,19 @@ class Wizard(Character):
 
     def generate_weapon(self) -> Weapon:
         '''Generates a suitable Weapon Equipment Item based on level'''
-        return self._equipment_generator.generate_weapon(self._level)
+        return self._equipment_generator.generate_weapon(self._level, self.rng)
 
     def generate_armor(self) -> Armor:
         '''Generates a suitable Armor Equipment Item based on level'''
-        return self._equipment_generator.generate_armor(self._level)
+        return self._equipment_generator.generate_armor(self._level, self.rng)
 
     def generate_accessory(self) -> Accessory:
         '''Generates a suitable Armor Equipment Item based on level'''
-        return self._equipment_generator.generate_accessory(self._level)
+        return self._equipment_generator.generate_accessory(self._level, self.rng)
 
     def use_healing_potion(self) -> Tuple[bool, CombatAction]:
         '''Uses a Healing Potion and Returns the Current Combat Action'''
-        printer = CombatPrint()
+        printer = self.printer
         success = True
         if self.hit_points == self.max_hit_points:
             printer("Cannot Use Healing Potion, already at Max Health")
@@ -513,7 +515,7 @@ class Wizard(Character):
             printer("Cannot Use Healing Potion, No Healing Potions Left")
             success = False
         if not success:
-            return success, CombatAction([("Heal", 0, "Holy", "")], "")
+            return success, NO_HEAL
         current = self.hit_points
         heal_amount = int(self.max_hit_points * 0.45)
         self.hit_points += heal_amount
@@ -1,19 +1,29 @@
-'''Combat Action Class for Dungeon Dudes'''
-from typing import Tuple, List
+'''
+Combat Action Class for Dungeon Dudes
+Actions are built on every attack, heal and skill, millions of times in a
+simulation run, so a CombatAction is a slotted record that keeps the action
+sequence it was given whenever every action in it is supported, and the
+common empty results are shared instances.  Actions are read only once built.
+'''
+from typing import FrozenSet, Optional, Sequence, Tuple
 from .dd_data.meta_data import supported_actions
 
+Action = Tuple[str, int, str, str]
+
+SUPPORTED : FrozenSet[str] = frozenset(supported_actions)
+
 class CombatAction:
     '''Combat Action Class'''
-    def __init__(self, actions : List[Tuple[str, int, str, str]],
-                 message : str, special : str =None):
-        self._actions : list = [action for action in actions
-                         if action[0] in supported_actions]
-        print(self._actions)
+    __slots__ = ("_actions", "_message", "_special")
+
+    def __init__(self, actions : Sequence[Action], message : str, special : Optional[str] = None):
+        for action in actions:
+            if action[0] not in SUPPORTED:
+                actions = tuple(action for action in actions if action[0] in SUPPORTED)
+                break
+        self._actions : Sequence[Action] = actions
         self._message : str = message
-        if not special:
-            self._special = ""
-        else:
-            self._special = special
+        self._special : str = special or ""
 
     @property
     def message(self) -> str:
@@ -26,6 +36,13 @@ class CombatAction:
         return self._special
 
     @property
-    def actions(self) -> list:
+    def actions(self) -> Sequence[Action]:
         '''Getter for Actions List'''
         return self._actions
+
+    def __repr__(self) -> str:
+        return f"CombatAction({list(self._actions)!r}, {self._message!r})"
+
+# Shared Results for Turns that do Nothing
+NO_ACTION : CombatAction = CombatAction((), "")
+NO_HEAL : CombatAction = CombatAction((("Heal", 0, "Holy", ""),), "")
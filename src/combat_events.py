@@ -0,0 +1,111 @@
+'''
+Combat Event Bus for Dungeon Dudes
+Encounters emit typed events as a fight is resolved: turn boundaries, every
+attack with the modifier applied to it, the damage each take_damage call
+actually took and how much was resisted, heals, and the Auras, Hexes and
+Battle Cries applied.  Metrics, replay recording and balance analytics
+subscribe at runtime instead of scraping CombatPrint text.
+
+Emitting costs one attribute check when nobody is subscribed: Encounters
+test EventBus.active before building an event.  Handlers are kept in tuples
+that are replaced, never changed, so subscribing from another thread or from
+inside a handler is safe.  Every Encounter emits to combat_events unless it
+is given its own bus.
+'''
+import threading
+from typing import Callable, Dict, NamedTuple, Tuple, Type, Union
+
+class TurnStarted(NamedTuple):
+    '''A Combatant Begins Acting'''
+    encounter: object
+    turn: int
+    com_num: int
+
+class AttackResolved(NamedTuple):
+    '''An Attack from com_num after its Aura and Battle Cry Modifier'''
+    encounter: object
+    com_num: int
+    damage_type: str
+    base: int
+    modifier: float
+    damage: int
+
+class DamageTaken(NamedTuple):
+    '''
+    Damage Sent to com_num and the Hit Points it Took
+    resisted is what a surviving target shrugged off; the part of a killing
+    blow past the hit points left is overkill instead; a hit a skill such as
+    Heroism survived (saved) counts neither
+    '''
+    encounter: object
+    com_num: int
+    damage_type: str
+    damage: int
+    taken: int
+    resisted: int
+    overkill: int
+    hit_points: int
+    alive: bool
+    saved: bool
+
+class Healed(NamedTuple):
+    '''Healing com_num did to itself'''
+    encounter: object
+    com_num: int
+    amount: int
+
+class ModifierApplied(NamedTuple):
+    '''An Aura, Battle Cry or Hex from com_num changing target's Modifier'''
+    encounter: object
+    com_num: int
+    target: int
+    kind: str
+    damage_type: str
+    amount: int
+
+class Identified(NamedTuple):
+    '''com_num Identified its Opponent'''
+    encounter: object
+    com_num: int
+
+CombatEvent = Union[TurnStarted, AttackResolved, DamageTaken, Healed, ModifierApplied, Identified]
+Handler = Callable[[CombatEvent], None]
+
+class EventBus:
+    '''Runtime Subscribers to Combat Events, by Event Type or for Every Event'''
+    __slots__ = ("active", "_handlers", "_every", "_lock")
+
+    def __init__(self):
+        self.active : bool = False
+        self._handlers : Dict[Type, Tuple[Handler, ...]] = {}
+        self._every : Tuple[Handler, ...] = ()
+        self._lock : threading.Lock = threading.Lock()
+
+    def subscribe(self, handler : Handler, *event_types : Type) -> Callable[[], None]:
+        '''Calls handler with Events of event_types, every Event when none are Given'''
+        with self._lock:
+            if event_types:
+                for event_type in event_types:
+                    self._handlers[event_type] = self._handlers.get(event_type, ()) + (handler,)
+            else:
+                self._every += (handler,)
+            self.active = True
+        return lambda: self.unsubscribe(handler)
+
+    def unsubscribe(self, handler : Handler):
+        '''Stops Calling handler'''
+        with self._lock:
+            self._every = tuple(every for every in self._every if every is not handler)
+            self._handlers = {event_type: kept for event_type, handlers in self._handlers.items()
+                              if (kept := tuple(other for other in handlers
+                                                if other is not handler))}
+            self.active = bool(self._every or self._handlers)
+
+    def emit(self, event : CombatEvent):
+        '''Hands event to its Subscribers'''
+        for handler in self._handlers.get(type(event), ()):
+            handler(event)
+        for handler in self._every:
+            handler(event)
+
+combat_events : EventBus = EventBus()
@@ -0,0 +1,257 @@
+'''
+Compact Binary Combat Log for Dungeon Dudes
+Encounters optionally record their seed, turn order and every CombatAction
+tuple with the Hit Point and Special changes it caused.
+CombatReplay fast-forwards through a recorded fight without rendering.
+
+Layout: a header (magic, version, seed, both Combatants and their starting
+Hit Points / Special) followed by one record per event.  Numbers are zigzag
+varints, so most actions cost a handful of bytes, and strings are interned:
+an index equal to the table size defines the next string inline.
+'''
+import struct
+from typing import Dict, Iterator, List, NamedTuple, Tuple, Union
+
+MAGIC : bytes = b"DDCL"
+VERSION : int = 1
+OP_TURN_ORDER : int = 0
+OP_ACTION_1 : int = 1
+OP_ACTION_2 : int = 2
+OP_FLAGS_SEED : int = 1
+
+Number = Union[int, float]
+
+class CombatantState(NamedTuple):
+    '''Snapshot of the Values a Replay tracks for one Combatant'''
+    name: str
+    com_class: str
+    level: int
+    hit_points: Number
+    special: Number
+
+class ReplayEvent(NamedTuple):
+    '''One Recorded Action and the State of both Combatants after it'''
+    com_num: int
+    action: Tuple[str, Number, str, str]
+    hit_points: Tuple[Number, Number]
+    special: Tuple[Number, Number]
+
+def resource_value(value) -> Number:
+    '''Non numeric values, such as a Monster's empty Special, log as 0'''
+    return value if isinstance(value, (int, float)) else 0
+
+class CombatLog:
+    '''Append Only Binary Event Log for a Single Encounter'''
+    def __init__(self):
+        self._buffer : bytearray = bytearray()
+        self._strings : Dict[str, int] = {}
+
+    def write_number(self, value : Number):
+        '''Ints are zigzag varints, anything else is tagged as a double'''
+        if isinstance(value, float) and not value.is_integer():
+            self._write_varint(1)
+            self._buffer += struct.pack("<d", value)
+            return
+        value = int(value)
+        zigzag : int = value << 1 if value >= 0 else (-value << 1) - 1
+        self._write_varint(zigzag << 1)
+
+    def write_string(self, value : str):
+        '''Writes a String Table Index, defining the String on first use'''
+        value = str(value)
+        index = self._strings.get(value)
+        if index is not None:
+            self._write_varint(index)
+            return
+        index = len(self._strings)
+        self._strings[value] = index
+        encoded : bytes = value.encode("utf-8")
+        self._write_varint(index)
+        self._write_varint(len(encoded))
+        self._buffer += encoded
+
+    def _write_varint(self, value : int):
+        '''Writes a non-negative int 7 bits at a time'''
+        while value > 0x7F:
+            self._buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self._buffer.append(value)
+
+    def start(self, seed, combatant_1 : 'Combatant', combatant_2 : 'Combatant'):
+        '''Writes the Header, the seed is kept if it is an unsigned 64 bit int'''
+        self._buffer.clear()
+        self._strings.clear()
+        keep_seed : bool = isinstance(seed, int) and 0 <= seed < 2 ** 64
+        self._buffer += MAGIC
+        self._buffer += struct.pack("<BB", VERSION, OP_FLAGS_SEED if keep_seed else 0)
+        if keep_seed:
+            self._buffer += struct.pack("<Q", seed)
+        for combatant in (combatant_1, combatant_2):
+            self.write_string(combatant.name)
+            self.write_string(combatant.char_class)
+            self.write_number(combatant.level)
+            self.write_number(combatant.hit_points)
+            self.write_number(resource_value(combatant.special))
+
+    def turn_order(self, player_first : bool):
+        '''Records who Acts First'''
+        self._buffer.append(OP_TURN_ORDER)
+        self._buffer.append(1 if player_first else 0)
+
+    def action(self, com_num : int, action : tuple, deltas : Tuple[Number, ...]):
+        '''
+        Records one Action tuple and the (hp_1, hp_2, sp_1, sp_2) it changed
+        Short tuples such as Potion Heals are padded with empty fields
+        '''
+        action_type, value, dmg_type, message = (tuple(action) + ("", "", ""))[:4]
+        self._buffer.append(OP_ACTION_1 if com_num == 1 else OP_ACTION_2)
+        self.write_string(action_type)
+        self.write_number(resource_value(value))
+        self.write_string(dmg_type)
+        self.write_string(message)
+        for delta in deltas:
+            self.write_number(delta)
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __bytes__(self) -> bytes:
+        return bytes(self._buffer)
+
+    def save(self, file_name : str):
+        '''Writes the Log to file_name'''
+        with open(file_name, "wb") as file:
+            file.write(self._buffer)
+
+
+class LogReader:
+    '''Cursor over a Log's Bytes with the String Table read so far'''
+    def __init__(self, data : bytes, pos : int = 0, strings : List[str] = None):
+        self._data : bytes = data
+        self.pos : int = pos
+        self.strings : List[str] = strings if strings is not None else []
+
+    def at_end(self) -> bool:
+        '''True once every byte has been read'''
+        return self.pos >= len(self._data)
+
+    def read_byte(self) -> int:
+        '''Reads one raw byte'''
+        byte : int = self._data[self.pos]
+        self.pos += 1
+        return byte
+
+    def read_struct(self, layout : str) -> tuple:
+        '''Reads the fixed size fields layout describes'''
+        values : tuple = struct.unpack_from(layout, self._data, self.pos)
+        self.pos += struct.calcsize(layout)
+        return values
+
+    def read_varint(self) -> int:
+        '''Reads an unsigned varint'''
+        result = shift = 0
+        while True:
+            byte = self.read_byte()
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def read_number(self) -> Number:
+        '''Reads a zigzag varint, or a double when its low bit is set'''
+        raw : int = self.read_varint()
+        if raw & 1:
+            return self.read_struct("<d")[0]
+        raw >>= 1
+        return (raw >> 1) ^ -(raw & 1)
+
+    def read_string(self) -> str:
+        '''Reads an interned string, adding it to the table when defined inline'''
+        index : int = self.read_varint()
+        if index == len(self.strings):
+            length : int = self.read_varint()
+            self.strings.append(self._data[self.pos:self.pos + length].decode("utf-8"))
+            self.pos += length
+        return self.strings[index]
+
+    def read_combatant(self) -> CombatantState:
+        '''Reads one Combatant's header entry'''
+        return CombatantState(self.read_string(), self.read_string(),
+                              self.read_number(), self.read_number(),
+                              self.read_number())
+
+
+class CombatReplay:
+    '''
+    Reads a CombatLog and steps through it without any Combatants
+    Every pass over the events gets its own LogReader, so iterations can
+    interleave, such as checking player_first in the middle of a replay
+    '''
+    def __init__(self, data : bytes):
+        if data[:4] != MAGIC:
+            raise ValueError("Not a Dungeon Dudes combat log")
+        self._data : bytes = bytes(data)
+        header = LogReader(self._data, 4)
+        self.version, flags = header.read_struct("<BB")
+        if self.version != VERSION:
+            raise ValueError(f"Unsupported combat log version {self.version}")
+        self.seed : [int, None] = None
+        if flags & OP_FLAGS_SEED:
+            self.seed = header.read_struct("<Q")[0]
+        self.combatants : Tuple[CombatantState, CombatantState] = (
+            header.read_combatant(), header.read_combatant())
+        self._events_start : int = header.pos
+        self._header_strings : Tuple[str, ...] = tuple(header.strings)
+
+    @classmethod
+    def load(cls, file_name : str) -> 'CombatReplay':
+        '''Reads a Log saved with CombatLog.save'''
+        with open(file_name, "rb") as file:
+            return cls(file.read())
+
+    @property
+    def player_first(self) -> [bool, None]:
+        '''Turn Order Result, None if the Encounter never rolled it'''
+        for op, value in self._records():
+            if op == OP_TURN_ORDER:
+                return value
+        return None
+
+    def _records(self) -> Iterator[tuple]:
+        '''Decodes raw records from the start of the event stream'''
+        reader = LogReader(self._data, self._events_start, list(self._header_strings))
+        while not reader.at_end():
+            op : int = reader.read_byte()
+            if op == OP_TURN_ORDER:
+                yield op, bool(reader.read_byte())
+                continue
+            action = (reader.read_string(), reader.read_number(),
+                      reader.read_string(), reader.read_string())
+            yield op, (action, tuple(reader.read_number() for _ in range(4)))
+
+    def __iter__(self) -> Iterator[ReplayEvent]:
+        '''Yields every Action with the running Hit Points and Special'''
+        hit_points : List[Number] = [state.hit_points for state in self.combatants]
+        special : List[Number] = [state.special for state in self.combatants]
+        for op, value in self._records():
+            if op == OP_TURN_ORDER:
+                continue
+            action, deltas = value
+            hit_points[0] += deltas[0]
+            hit_points[1] += deltas[1]
+            special[0] += deltas[2]
+            special[1] += deltas[3]
+            yield ReplayEvent(op, action, tuple(hit_points), tuple(special))
+
+    def fast_forward(self, actions : int = None) -> Tuple[CombatantState, CombatantState]:
+        '''State of both Combatants after actions events, or the end of the fight'''
+        event : [ReplayEvent, None] = None
+        if actions != 0:
+            for count, event in enumerate(self, 1):
+                if count == actions:
+                    break
+        if event is None:
+            return self.combatants
+        return tuple(state._replace(hit_points=event.hit_points[index],
+                                    special=event.special[index])
+                     for index, state in enumerate(self.combatants))
@@ -4,17 +4,28 @@ Both Characters and Monsters are Combatants.
 Encounters are designed to interact with Combatant Objects
 '''
 from abc import ABC, abstractmethod
+from random import Random
 from typing import List, Tuple, Dict
 from .stats import Stats
-from .dd_data import LimitedDict, damage_types
+from .dd_data import DamageVector, damage_types
+from .profiling import profile_methods
 
 class Combatant(ABC):
     '''Combatant Class'''
+    deaths_cheated : int = 0
+
+    def __init_subclass__(cls, **kwargs):
+        '''Counts every take_damage and take_turn when Profiling is On'''
+        super().__init_subclass__(**kwargs)
+        profile_methods(cls, "take_damage", "take_turn")
+
     def __init__(self, name : str, com_class: str, stat_structure: dict):
         self._name : str = name
         self._class : str = com_class
         self._stats = Stats(stat_structure)
         self.damage_types = damage_types
+        if not hasattr(self, '_rng'):
+            self._rng : Random = Random()
         if not hasattr(self, '_level'):
             self._level : int = 1
         if not hasattr(self, '_hit_points'):
@@ -28,6 +39,16 @@ class Combatant(ABC):
         if not hasattr(self, '_experience_points'):
             self._experience_points : int = 0
 
+    @property
+    def rng(self) -> Random:
+        '''Getter for the Combatant's Random Stream'''
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng : Random):
+        '''Setter for the Combatant's Random Stream, None for an unseeded one'''
+        self._rng = rng if rng is not None else Random()
+
     @property
     def gold(self) -> int:
         '''Getter for Combatant Gold'''
@@ -103,12 +124,12 @@ class Combatant(ABC):
 
     @property
     @abstractmethod
-    def damage_modifiers(self) -> LimitedDict:
+    def damage_modifiers(self) -> DamageVector:
         '''Getter for Damage Modifiers'''
 
     @property
     @abstractmethod
-    def defense_modifiers(self) -> LimitedDict:
+    def defense_modifiers(self) -> DamageVector:
         '''Getter for Defense Modifiers'''
 
     @property
@@ -145,6 +166,10 @@ class Combatant(ABC):
     def take_damage(self, damage: int, dmg_type : str, message : str):
         '''Adjusts Hit Points in a Class Specific Way in Response to Damage Events'''
 
+    def cheat_death(self):
+        '''Counts a Lethal Hit a Skill let this Combatant Survive'''
+        self.deaths_cheated += 1
+
     def level_up(self):
         '''Level up a Combatant'''
         self._stats.level_up()
@@ -0,0 +1,94 @@
+'''
+Per Thread Console Routing for Dungeon Dudes
+The game reads with input() and writes with print().  When routing is
+installed, sys.stdin and sys.stdout become routers that send each call to the
+streams bound to the calling thread, so every server session thread gets its
+own console.  Threads with nothing bound use the real streams.
+'''
+import io
+import sys
+import threading
+from contextlib import contextmanager, redirect_stdout
+from typing import Iterator, Optional, TextIO
+
+_bound = threading.local()
+
+class StreamRouter(io.TextIOBase):
+    '''Text Stream that Forwards to the Calling Thread's Bound Stream'''
+    def __init__(self, name : str, fallback : TextIO):
+        super().__init__()
+        self._name : str = name
+        self._fallback : TextIO = fallback
+
+    @property
+    def fallback(self) -> TextIO:
+        '''Stream used by Threads without a Bound Stream'''
+        return self._fallback
+
+    def target(self) -> TextIO:
+        '''Stream for the Calling Thread'''
+        stream : Optional[TextIO] = getattr(_bound, self._name, None)
+        return stream if stream is not None else self._fallback
+
+    @property
+    def encoding(self) -> str:
+        return getattr(self.target(), "encoding", "utf-8")
+
+    def write(self, text : str) -> int:
+        return self.target().write(text)
+
+    def flush(self):
+        self.target().flush()
+
+    def readline(self, size : int = -1) -> str:
+        return self.target().readline(size)
+
+    def isatty(self) -> bool:
+        return self.target().isatty()
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return True
+
+def install():
+    '''Replaces sys.stdin and sys.stdout with Routers, safe to call more than once'''
+    if not isinstance(sys.stdin, StreamRouter):
+        sys.stdin = StreamRouter("stdin", sys.stdin)
+    if not isinstance(sys.stdout, StreamRouter):
+        sys.stdout = StreamRouter("stdout", sys.stdout)
+
+def uninstall():
+    '''Restores the Real Streams'''
+    if isinstance(sys.stdin, StreamRouter):
+        sys.stdin = sys.stdin.fallback
+    if isinstance(sys.stdout, StreamRouter):
+        sys.stdout = sys.stdout.fallback
+
+@contextmanager
+def bind(stdin : TextIO, stdout : TextIO) -> Iterator[None]:
+    '''Routes the Calling Thread's input() and print() to stdin and stdout'''
+    previous = (getattr(_bound, "stdin", None), getattr(_bound, "stdout", None))
+    _bound.stdin, _bound.stdout = stdin, stdout
+    try:
+        yield
+    finally:
+        _bound.stdin, _bound.stdout = previous
+
+@contextmanager
+def redirect_output(stream : TextIO) -> Iterator[TextIO]:
+    '''
+    redirect_stdout for the Calling Thread only when Routing is Installed,
+    other sessions keep printing to their own consoles meanwhile
+    '''
+    if not isinstance(sys.stdout, StreamRouter):
+        with redirect_stdout(stream):
+            yield stream
+        return
+    previous : Optional[TextIO] = getattr(_bound, "stdout", None)
+    _bound.stdout = stream
+    try:
+        yield stream
+    finally:
+        _bound.stdout = previous
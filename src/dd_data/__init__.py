@@ -1,3 +1,4 @@
 from .limited_dict import LimitedDict
+from .damage_vector import DamageVector
 from .meta_data import *
-from .combat_print import CombatPrint
\ No newline at end of file
+from .combat_print import PrintSink, CombatPrint, SocketPrint, MemoryPrint, NullPrint
\ No newline at end of file
@@ -1,18 +1,21 @@
-'''Combat Terminal Print Function for Dungeon Dudes'''
-from ..menu_helpers import line_brackets, clear
-
-def singleton(cls):
-    '''Singleton Decorator for CombatPrint Class'''
-    instances = {}
-    def get_instance(*args, **kwargs):
-        if cls not in instances:
-            instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
-    return get_instance
-
-@singleton
-class CombatPrint:
-    '''Combat Print Class for Dungeon Dudes'''
+'''
+Combat Print Sinks for Dungeon Dudes
+Encounters are given a sink and hand it to both Combatants, so every
+Encounter keeps its own history and output.  CombatPrint draws to a terminal
+Screen, SocketPrint to a socket, MemoryPrint keeps every message for tests and
+replays, and NullPrint discards everything.
+'''
+import socket
+from typing import List
+from ..menu_helpers import line_brackets
+from ..screen import Screen
+from ..profiling import profiled
+from .frame_renderer import FrameRenderer
+
+class PrintSink:
+    '''Base Sink: keeps the last limit lines of Combat Text and the Encounter they belong to'''
+    interactive : bool = False
+
     def __init__(self,
                  limit : int =8, line_size : int =87):
         self._limit = limit
@@ -21,50 +24,141 @@ class CombatPrint:
         self._encounter = None
         self._format_line = "*" * (line_size + 4)
 
+    def add_message(self, *args) -> List[str]:
+        '''Splits a Message into line_size Chunks, adds them to History and Returns them'''
+        full_message = " ".join(map(str, args))
+        chunks = [full_message[i:i+self._line_size]
+                  for i in range(0, len(full_message), self._line_size)]
+        for message in chunks:
+            self._history.append(message)
+            if len(self._history) > self._limit:
+                self._history.pop(0)
+        return chunks
+
     def format_combat_log(self) -> str:
         '''Ensures Combat Log takes up self._limit lines'''
         return "\n".join([line_brackets(message) for message
                      in self._history] + [line_brackets('')]
                      * (self._limit - len(self._history)))
 
-    def __call__(self, *args, menu=None, **kwargs):
-        '''
-        Clears Screen
-        Prints Encounter Title Pane,
-        Prints Message in Line_Size Chucks up to Max Lines and saves history
-        Prints Encounter Menu Pane
-        '''
+    def frame(self, menu : str = None) -> str:
+        '''The Encounter Title Pane, Combat Log and Menu Pane as one String'''
+        return "\n".join(map(str, (self._encounter, self.format_combat_log(),
+                                   self._format_line,
+                                   menu if menu else self._encounter.menu(),
+                                   self._format_line)))
 
+    def __call__(self, *args, menu=None, **kwargs): # pylint: disable=unused-argument
+        '''Records a Message, Sinks that Draw Redraw the Panes'''
         if args:
-            full_message = " ".join(map(str, args))
-            chunks = [full_message[i:i+self._line_size]
-                    for i in range(0, len(full_message), self._line_size)]
-
-            for message in chunks:
-                self._history.append(message)
-                if len(self._history) > self._limit:
-                    self._history.pop(0)
-        clear()
-        original_print = print
-        if not menu:
-            original_print(self._encounter, self.format_combat_log(), self._format_line,
-                    self._encounter.menu(), self._format_line, sep="\n", **kwargs)
-        else:
-            original_print(self._encounter, self.format_combat_log(), self._format_line,
-                    menu, self._format_line, sep="\n", **kwargs)
+            self.add_message(*args)
 
     def clear_history(self):
         '''
-        Clears History so Subsequent Encounters 
+        Clears History so Subsequent Encounters
         don't have the same combat text
         '''
         self._history = []
+        self.invalidate()
 
     def set_encounter(self, encounter: 'Encounter'):
-        '''Sets Current Encounter'''
+        '''Sets Current Encounter, the next call repaints the whole screen'''
         self._encounter = encounter
+        self.invalidate()
+
+    def invalidate(self):
+        '''Forces a full repaint after other output has been drawn'''
+
+    @property
+    def encounter(self) -> 'Encounter':
+        '''Encounter this Sink is Showing'''
+        return self._encounter
 
     @property
     def get_history(self):
         '''Getter for History'''
         return self._history
+
+
+class CombatPrint(PrintSink):
+    '''Terminal Sink, draws the Encounter Panes on a Screen'''
+    interactive : bool = True
+
+    def __init__(self,
+                 limit : int =8, line_size : int =87, screen : Screen = None):
+        super().__init__(limit, line_size)
+        self._renderer = FrameRenderer(screen)
+
+    @profiled
+    def __call__(self, *args, menu=None, **kwargs): # pylint: disable=unused-argument
+        '''
+        Prints Message in Line_Size Chucks up to Max Lines and saves history
+        Redraws the Encounter Title Pane, Combat Log and Menu Pane,
+        only the lines that changed since the last call are rewritten
+        '''
+        if args:
+            self.add_message(*args)
+        self._renderer.render(self.frame(menu))
+
+    def invalidate(self):
+        '''Forces a full repaint after other output has been drawn'''
+        self._renderer.invalidate()
+
+
+class SocketStream:
+    '''Minimal Text Stream that sends everything Written over a Connected Socket'''
+    def __init__(self, sock : socket.socket, encoding : str = "utf-8"):
+        self._socket : socket.socket = sock
+        self.encoding : str = encoding
+
+    def write(self, text : str) -> int:
+        '''Sends text, blocking until the Socket takes all of it'''
+        self._socket.sendall(text.replace("\n", "\r\n").encode(self.encoding))
+        return len(text)
+
+    def flush(self):
+        '''Writes are sent Immediately'''
+
+    def isatty(self) -> bool:
+        '''Remote Clients are Terminals'''
+        return True
+
+
+class SocketPrint(CombatPrint):
+    '''Sink that Draws the Encounter Panes to a Remote Terminal over a Socket'''
+    def __init__(self, sock : socket.socket,
+                 limit : int =8, line_size : int =87):
+        super().__init__(limit, line_size, screen=Screen(SocketStream(sock)))
+
+
+class MemoryPrint(PrintSink):
+    '''Sink that Keeps every Message, for Tests, Replays and Headless Sessions'''
+    def __init__(self,
+                 limit : int =8, line_size : int =87):
+        super().__init__(limit, line_size)
+        self.messages : List[str] = []
+
+    def __call__(self, *args, menu=None, **kwargs): # pylint: disable=unused-argument
+        '''Records the Message in History and the Full Message List'''
+        if args:
+            self.messages.extend(self.add_message(*args))
+
+
+class NullPrint(PrintSink):
+    '''
+    Combat Print Sink for Headless Encounters
+    Accepts the same calls as CombatPrint and discards all output
+    '''
+    def __call__(self, *args, menu=None, **kwargs):
+        '''Discards Combat Messages'''
+
+    def clear_history(self):
+        '''Nothing to Clear, No History is Kept'''
+
+    def set_encounter(self, encounter: 'Encounter'):
+        '''Headless Sinks do not Render the Encounter'''
+
+    @property
+    def get_history(self):
+        '''Getter for History, always Empty'''
+        return []
@@ -0,0 +1,107 @@
+'''Fixed Key Damage Vector for Dungeon Dudes'''
+from typing import Dict, Iterator, List, Tuple
+from .meta_data import damage_types
+
+damage_index : Dict[str, int] = {dmg_type: index for index, dmg_type
+                                 in enumerate(damage_types)}
+ALL_TYPES : int = (1 << len(damage_types)) - 1
+
+class DamageVector:
+    '''
+    One value per damage type, stored in a list indexed by meta_data.damage_types
+    Drop in replacement for the LimitedDict modifier tables: a vector may be
+    restricted to some damage types, reads of the others return None (or the
+    get default) and writes to them raise KeyError
+    '''
+    __slots__ = ("_values", "_active")
+
+    def __init__(self, allowed_keys : [tuple, str] = damage_types,
+                 default_value : int = 0):
+        if isinstance(allowed_keys, str):
+            allowed_keys = (allowed_keys,)
+        active : int = 0
+        for key in allowed_keys:
+            active |= 1 << damage_index[key]
+        self._active : int = active
+        self._values : List[int] = [default_value] * len(damage_types)
+
+    @classmethod
+    def from_values(cls, values : List[int], active : int = ALL_TYPES) -> 'DamageVector':
+        '''Builds a Vector directly from values in damage_types order'''
+        vector = cls.__new__(cls)
+        vector._values = list(values)
+        vector._active = active
+        return vector
+
+    @property
+    def active(self) -> int:
+        '''Bitmask of the Damage Types this Vector holds, bit i is damage_types[i]'''
+        return self._active
+
+    def __getitem__(self, key : str):
+        index : int = damage_index.get(key, -1)
+        if index < 0 or not self._active >> index & 1:
+            return None
+        return self._values[index]
+
+    def __setitem__(self, key : str, value : int):
+        index : int = damage_index.get(key, -1)
+        if index < 0 or not self._active >> index & 1:
+            raise KeyError(f"Key {key} is not allowed. "
+                           f"Allowed keys are: {', '.join(self.keys())}")
+        self._values[index] = value
+
+    def __delitem__(self, key : str):
+        self._active &= ~(1 << damage_index[key])
+
+    def __contains__(self, key : str) -> bool:
+        index : int = damage_index.get(key, -1)
+        return index >= 0 and bool(self._active >> index & 1)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return bin(self._active).count("1")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DamageVector):
+            return NotImplemented
+        return self._active == other._active and self._values == other._values
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def get(self, key : str, default=None):
+        '''Get Function Set to Mimic Builtin Dictionary'''
+        index : int = damage_index.get(key, -1)
+        if index < 0 or not self._active >> index & 1:
+            return default
+        return self._values[index]
+
+    def keys(self) -> Tuple[str, ...]:
+        '''Damage Types this Vector holds values for'''
+        return tuple(dmg_type for index, dmg_type in enumerate(damage_types)
+                     if self._active >> index & 1)
+
+    def items(self) -> List[Tuple[str, int]]:
+        '''Items Function to Mimic Builtin Dictionary'''
+        return [(dmg_type, self._values[index]) for index, dmg_type
+                in enumerate(damage_types) if self._active >> index & 1]
+
+    def values(self) -> Tuple[int, ...]:
+        '''All values in damage_types order'''
+        return tuple(self._values)
+
+    def __add__(self, other : 'DamageVector') -> 'DamageVector':
+        return DamageVector.from_values([a + b for a, b in zip(self._values, other._values)],
+                                        self._active | other._active)
+
+    def __sub__(self, other : 'DamageVector') -> 'DamageVector':
+        return DamageVector.from_values([a - b for a, b in zip(self._values, other._values)],
+                                        self._active | other._active)
+
+    def clamp(self, low : int, high : int) -> 'DamageVector':
+        '''New Vector with every value limited to low..high'''
+        return DamageVector.from_values([max(low, min(value, high)) for value in self._values],
+                                        self._active)
@@ -0,0 +1,51 @@
+'''Incremental Terminal Renderer for Dungeon Dudes Combat Panes'''
+from typing import List, Optional
+from ..screen import Screen, get_screen
+
+CSI : str = "\033["
+
+class FrameRenderer:
+    '''
+    Keeps the last frame drawn and rewrites only the lines that changed
+    using ANSI cursor addressing.  The first frame after invalidate()
+    clears the screen and draws everything, as does any frame too tall for
+    the terminal, since scrolling moves the rows the cursor addresses.  The
+    height is the Screen's own, and a Screen of unknown height is diffed.
+    '''
+    def __init__(self, screen : Screen = None):
+        self._screen : Screen = screen
+        self._frame : List[str] = []
+        self._full_repaint : bool = True
+
+    @property
+    def screen(self) -> Screen:
+        '''Screen to draw on, the active Screen unless one was given'''
+        return self._screen if self._screen is not None else get_screen()
+
+    def invalidate(self):
+        '''Forces a full repaint, used when something else drew on the screen'''
+        self._full_repaint = True
+
+    def render(self, frame : str) -> int:
+        '''Draws frame with a single write, Returns the number of lines written'''
+        lines : List[str] = frame.split("\n")
+        screen : Screen = self.screen
+        rows : Optional[int] = screen.rows
+        if (self._full_repaint or not screen.isatty()
+                or (rows is not None and len(lines) >= rows)):
+            output : str = screen.clear_prefix() + "\n".join(lines) + "\n"
+            written : int = len(lines)
+        else:
+            previous : List[str] = self._frame
+            parts : List[str] = [f"{CSI}{row};1H{line}{CSI}K"
+                                 for row, line in enumerate(lines, 1)
+                                 if row > len(previous) or previous[row - 1] != line]
+            written : int = len(parts)
+            # Drops lines left by a taller frame and the prompt typed under it
+            parts.append(f"{CSI}{len(lines) + 1};1H{CSI}J")
+            output : str = "".join(parts)
+        screen.write(output)
+        screen.flush()
+        self._frame = lines
+        self._full_repaint = False
+        return written
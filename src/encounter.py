@@ -1,33 +1,74 @@
 '''Module for the Encounter Class for Dungeon Dudes'''
-from typing import Dict
+from typing import Dict, List, Tuple
 from math import ceil
-from random import randint
+from random import Random
 from .combatant_abc import Combatant
 from .characters import Character
 from .combat_action import CombatAction
-from .dd_data import LimitedDict, CombatPrint 
+from .combat_log import CombatLog, resource_value
+from .combat_events import (EventBus, combat_events, TurnStarted, AttackResolved, DamageTaken,
+                            Healed, ModifierApplied, Identified)
+from .dd_data import DamageVector, PrintSink, NullPrint
 from .dd_data.meta_data import damage_types
 from .menu_helpers import line_brackets
+from .profiling import profiled
 
 
 class Encounter:
     '''Encounter Class for Dungeon Dudes'''
-    def __init__(self, combatant_1: Combatant, combatant_2: Combatant):
+    def __init__(self, combatant_1: Combatant, combatant_2: Combatant, seed: int = None,
+                 log: CombatLog = None, printer: PrintSink = None, events: EventBus = None):
+        self._seed: int = seed
+        self._rng: Random = Random(seed)
         self._combatant_1: Character = combatant_1
         self._combatant_2: Combatant = combatant_2
-        self._combatant_1_aura: LimitedDict = LimitedDict(damage_types, default_value=100)
-        self._combatant_1_battle_cry: LimitedDict = LimitedDict(damage_types, default_value=100)
-        self._combatant_2_aura: dict = LimitedDict(damage_types, default_value=100)
-        self._combatant_2_battle_cry: dict = LimitedDict(damage_types, default_value=100)
+        self._combatant_1.rng = Random(self._rng.getrandbits(64))
+        self._combatant_2.rng = Random(self._rng.getrandbits(64))
+        self._combatant_1_aura: DamageVector = DamageVector(damage_types, default_value=100)
+        self._combatant_1_battle_cry: DamageVector = DamageVector(damage_types, default_value=100)
+        self._combatant_2_aura: DamageVector = DamageVector(damage_types, default_value=100)
+        self._combatant_2_battle_cry: DamageVector = DamageVector(damage_types, default_value=100)
         self._combatant_identified: Dict[int, bool] = {1: True, 2: True}
         self.escape_flag: bool = False
         self.combatant_1_alive: bool = True
         self.combatant_2_alive: bool = True
         self.player_spl_att_complete: bool = False
-        self._damage_com_1 = LimitedDict(damage_types, default_value=0)
-        self._damage_com_2 = LimitedDict(damage_types, default_value=0)
-        self._turn_count: int = 1
-        self.printer = CombatPrint()
+        self._damage_com_1 = DamageVector(damage_types, default_value=0)
+        self._damage_com_2 = DamageVector(damage_types, default_value=0)
+        self._turn_count: int = 0
+        self.events: EventBus = events if events is not None else combat_events
+        self._version: int = 0
+        self._section_versions: Dict[str, int] = dict.fromkeys(
+            ("status", "modifiers", "combat_modifiers"), 0)
+        self._render_cache: Dict[str, Tuple[tuple, List[str]]] = {}
+        self.printer = printer if printer is not None else NullPrint()
+        self.log: CombatLog = log
+        if log is not None:
+            log.start(seed, combatant_1, combatant_2)
+            self._logged_state: tuple = self.combat_state()
+
+    @property
+    def printer(self) -> PrintSink:
+        '''Getter for the Sink this Encounter and its Combatants Print to'''
+        return self._printer
+
+    @printer.setter
+    def printer(self, printer: PrintSink):
+        '''Hands the Sink to both Combatants and Points it at this Encounter'''
+        self._printer: PrintSink = printer
+        self._combatant_1.printer = printer
+        self._combatant_2.printer = printer
+        printer.set_encounter(self)
+
+    @property
+    def seed(self) -> int:
+        '''Getter for the Seed this Encounter's Random Streams derive from'''
+        return self._seed
+
+    @property
+    def rng(self) -> Random:
+        '''Getter for the Encounter's own Random Stream'''
+        return self._rng
 
     @property
     def combatant_1(self) -> Combatant:
@@ -43,6 +84,7 @@ class Encounter:
         '''Returns if all combatants are still alive'''
         return self.combatant_1_alive and self.combatant_2_alive
 
+    @profiled
     def get_modifier(self, dm_type: str, com_num: int) -> int:
         '''Gets the modifier for com_num doing dm_type to opponent'''
         if com_num == 1:
@@ -54,6 +96,18 @@ class Encounter:
         defensive_mod: int = self.clamp_modifier(200-aura_mod)
         return defensive_mod/100 * offensive_mod/100
 
+    @property
+    def turn(self) -> int:
+        '''Number of Turns Started so far'''
+        return self._turn_count
+
+    def next_turn(self, com_num: int):
+        '''Marks the Start of a Turn for com_num'''
+        self._turn_count += 1
+        if self.events.active:
+            self.events.emit(TurnStarted(self, self._turn_count, com_num))
+
+    @profiled
     def parse_attack(self, action: CombatAction, com_num: int):
         '''Parses Attack Actions'''
         damage: int = action[1]
@@ -61,21 +115,42 @@ class Encounter:
         dm_message: str = action[3]
         if com_num == 1:
             mod: float = self.get_modifier(dm_type, 1)
-            self.send_attacks(int(damage*mod), dm_type, dm_message, 1)
         else:
             mod: float = self.get_modifier(dm_type, 2)
-            self.send_attacks(int(damage*mod), dm_type, dm_message, 2)
+        if self.events.active:
+            self.events.emit(AttackResolved(self, com_num, dm_type, damage, mod, int(damage*mod)))
+        self.send_attacks(int(damage*mod), dm_type, dm_message, com_num)
 
     def send_attacks(self, damage: int, dm_type: str, dm_message: str, com_num: int):
         '''Sends attacks to combatant and checks if they're alive'''
-        if com_num == 1:
-            alive: bool = self._combatant_2.take_damage(damage, dm_type, dm_message)
-            if not alive:
+        target: Combatant = self._combatant_2 if com_num == 1 else self._combatant_1
+        observed: bool = self.events.active
+        if observed:
+            before: int = target.hit_points
+            cheated: int = target.deaths_cheated
+        alive: bool = target.take_damage(damage, dm_type, dm_message)
+        if not alive:
+            if com_num == 1:
                 self.combatant_2_alive = False
-        else:
-            alive: bool = self._combatant_1.take_damage(damage, dm_type, dm_message)
-            if not alive:
+            else:
                 self.combatant_1_alive = False
+        self.bump_version("status")
+        if observed:
+            self.emit_damage(target, 3 - com_num, dm_type, damage, before,
+                             alive, target.deaths_cheated > cheated)
+
+    def emit_damage(self, target: Combatant, com_num: int, dm_type: str, damage: int,
+                    before: int, alive: bool, saved: bool):
+        '''Emits DamageTaken, telling Resistance from Overkill and Skills that Saved target'''
+        taken: int = max(0, before - target.hit_points)
+        resisted: int = 0
+        overkill: int = 0
+        if not alive:
+            overkill = max(0, damage - taken)
+        elif not saved:
+            resisted = max(0, damage - taken)
+        self.events.emit(DamageTaken(self, com_num, dm_type, damage, taken, resisted, overkill,
+                                     target.hit_points, alive, saved and alive))
 
     @staticmethod
     def clamp_modifier(mod: float) -> float:
@@ -86,12 +161,36 @@ class Encounter:
         '''Determines Turn Order from Agility Scores'''
         agility_1 = self.combatant_1.defense_power
         agility_2 = self.combatant_2.agility
-        initiative_1: int = agility_1 + randint(1, max(agility_1, agility_2))
-        initiative_2: int = agility_2 + randint(1, max(agility_1, agility_2))
+        initiative_1: int = agility_1 + self._rng.randint(1, max(agility_1, agility_2))
+        initiative_2: int = agility_2 + self._rng.randint(1, max(agility_1, agility_2))
+        if self.log is not None:
+            self.log.turn_order(initiative_1 >= initiative_2)
         return initiative_1 >= initiative_2
 
+    def combat_state(self) -> tuple:
+        '''Hit Points and Special of both Combatants, in CombatLog order'''
+        return (self._combatant_1.hit_points, self._combatant_2.hit_points,
+                resource_value(self._combatant_1.special),
+                resource_value(self._combatant_2.special))
+
+    def record_action(self, action: tuple, com_num: int):
+        '''Logs an applied Action with the changes since the last record'''
+        if self.log is None:
+            return
+        state: tuple = self.combat_state()
+        self.log.action(com_num, action, tuple(new - old for new, old
+                                               in zip(state, self._logged_state)))
+        self._logged_state = state
+
     def parse_heal(self, action: tuple, com_num: int):
-        '''Parses Heal Actions'''
+        '''Parses Heal Actions, the Healing itself is done by the Combatant'''
+        if self.events.active and action[1]:
+            self.events.emit(Healed(self, com_num, action[1]))
+
+    def modifier_applied(self, kind: str, action: tuple, com_num: int, target: int):
+        '''Emits a ModifierApplied Event if anyone is Listening'''
+        if self.events.active:
+            self.events.emit(ModifierApplied(self, com_num, target, kind, action[2], action[1]))
 
     def parse_aura(self, action: tuple, com_num: int):
         '''Parses Aura Actions'''
@@ -99,6 +198,8 @@ class Encounter:
             self._combatant_1_aura[action[2]] += action[1]
         else:
             self._combatant_2_aura[action[2]] += action[1]
+        self.bump_version("combat_modifiers")
+        self.modifier_applied("Aura", action, com_num, com_num)
         self.printer()
 
     def parse_battle_cry(self, action: tuple, com_num: int):
@@ -107,6 +208,8 @@ class Encounter:
             self._combatant_1_battle_cry[action[2]] += action[1]
         else:
             self._combatant_2_battle_cry[action[2]] += action[1]
+        self.bump_version("combat_modifiers")
+        self.modifier_applied("Battle Cry", action, com_num, com_num)
         self.printer()
 
     def parse_hex(self, action: tuple, com_num: int):
@@ -115,6 +218,8 @@ class Encounter:
             self._combatant_2_aura[action[2]] -= action[1]
         else:
             self._combatant_1_aura[action[2]] -= action[1]
+        self.bump_version("combat_modifiers")
+        self.modifier_applied("Hex", action, com_num, 3 - com_num)
         self.printer()
 
     def parse_identify(self, action: tuple, com_num: int):  # pylint: disable=unused-argument
@@ -123,6 +228,9 @@ class Encounter:
             self._combatant_identified[2]: bool = True
         else:
             self._combatant_identified[1]: bool = True
+        self.bump_version()
+        if self.events.active:
+            self.events.emit(Identified(self, com_num))
 
     def identified(self, value, com_num):
         '''Obscures Value on Character Pane if target not identified'''
@@ -147,18 +255,18 @@ class Encounter:
 
     def combat_modifier_lines(self):
         '''Formats all Aura and Battle Cry Information'''
-        clamp = self.clamp_modifier
         dam_types: tuple = self._combatant_1.damage_types
-        dam_modifiers: dict = self._combatant_1_battle_cry
-        def_modifiers: dict = self._combatant_1_aura
-        dam_modifiers2: dict = self._combatant_2_battle_cry
-        def_modifiers2: dict = self._combatant_2_aura
+        full_aura: DamageVector = DamageVector(default_value=200)
+        dam_modifiers: DamageVector = self._combatant_1_battle_cry.clamp(10, 200)
+        def_modifiers: DamageVector = (full_aura - self._combatant_1_aura).clamp(10, 200)
+        dam_modifiers2: DamageVector = self._combatant_2_battle_cry.clamp(10, 200)
+        def_modifiers2: DamageVector = (full_aura - self._combatant_2_aura).clamp(10, 200)
         modifiers = []
         for _, dam_type in enumerate(dam_types):
-            modifiers.append((f'{dam_type}: {clamp(dam_modifiers.get(dam_type, 100))}',
-                            f'{dam_type}: {clamp(200 -def_modifiers.get(dam_type, 100))}',
-                            f'{dam_type}: {clamp(dam_modifiers2.get(dam_type, 100))}',
-                            f'{dam_type}: {clamp(200 -def_modifiers2.get(dam_type, 100))}'))
+            modifiers.append((f'{dam_type}: {dam_modifiers[dam_type]}',
+                            f'{dam_type}: {def_modifiers[dam_type]}',
+                            f'{dam_type}: {dam_modifiers2[dam_type]}',
+                            f'{dam_type}: {def_modifiers2[dam_type]}'))
         return modifiers
 
     def menu(self):
@@ -170,16 +278,50 @@ class Encounter:
         line_3 = line_brackets(f"{'':43}|{'':43}")
         return "\n".join([line_1, line_2, line_3])
 
-    def __str__(self):
-        '''Prints out Character Panes in Combat'''
+    def bump_version(self, *sections: str):
+        '''
+        Marks Encounter owned state as changed so the panes showing it are rebuilt
+        Damage dirties only the status pane and Auras, Hexes and Battle Cries
+        only the combat modifier pane; naming no section dirties them all
+        '''
+        self._version += 1
+        for section in sections or tuple(self._section_versions):
+            self._section_versions[section] += 1
+
+    @property
+    def version(self) -> int:
+        '''Counter bumped by every damage, Aura, Hex, Battle Cry and Identify event'''
+        return self._version
+
+    def cached_section(self, section: str, key: tuple, build) -> List[str]:
+        '''Returns the lines for section, rebuilding them only if key changed'''
+        cached: Tuple[tuple, List[str]] = self._render_cache.get(section)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        lines: List[str] = build()
+        self._render_cache[section] = (key, lines)
+        return lines
+
+    @staticmethod
+    def modifier_key(combatant: Combatant) -> tuple:
+        '''Snapshot of a Combatant's Equipment and Skill Modifiers'''
+        return (tuple(combatant.damage_modifiers.items()),
+                tuple(combatant.defense_modifiers.items()))
+
+    def title_lines(self) -> List[str]:
+        '''Formats the Name, Class and Level Title Pane'''
         char_1 = self._combatant_1
         char_2 = self._combatant_2
         format_line = "*" * 91
-        lines = [format_line]
         title_1 = f"{f'{char_1.name}':30}{f'{char_1.char_class}: {char_1.level} ':>13}"
         title_2 = f"{f'{char_2.name}':30}{f'{char_2.char_class}: {char_2.level} ':>13}"
-        lines.extend([line_brackets(f"{title_1}| {title_2}"), format_line])
+        return [format_line, line_brackets(f"{title_1}| {title_2}"), format_line]
 
+    def status_lines(self) -> List[str]:
+        '''Formats the HP and SP Bars, their Values and Attack/Defense Power'''
+        char_1 = self._combatant_1
+        char_2 = self._combatant_2
+        lines = []
         RED = "\033[0;31m"
         BLUE = "\033[0;34m"
         GREEN = "\033[0;32m"
@@ -252,24 +394,63 @@ class Encounter:
         def_1 = f"{'Defense Power:' + str(self.identified(char_1.defense_power, 1)) + ' ':>22}"
         att_2 = f"{'Attack Power: ' + str(self.identified(char_2.attack_power, 2)):21}"
         def_2 = f"{'Defense Power:' + str(self.identified(char_2.defense_power, 2)) + ' ':>22}"
-        modifier_title = f"{f'Offensive':21}{f'| Defensive':22}{f'| Offensive':23}{f'| Defensive':21}"
-        lines.extend([line_brackets(f"{hp_sp_1}| {hp_sp_2}"), 
-                      line_brackets(f"{att_1}{def_1}| {att_2}{def_2}"),
-                      format_line, f"|{'-' * 38}  Modifiers  {'-' * 38}|",
-                      format_line, line_brackets(modifier_title), format_line])
+        lines.extend([line_brackets(f"{hp_sp_1}| {hp_sp_2}"),
+                      line_brackets(f"{att_1}{def_1}| {att_2}{def_2}")])
+        return lines
 
+    def modifier_table_lines(self) -> List[str]:
+        '''Formats the Offensive and Defensive Modifier Table'''
+        format_line = "*" * 91
+        modifier_title = f"{f'Offensive':21}{f'| Defensive':22}{f'| Offensive':23}{f'| Defensive':21}"
+        lines = [format_line, f"|{'-' * 38}  Modifiers  {'-' * 38}|",
+                 format_line, line_brackets(modifier_title), format_line]
         modifiers = self.modifier_lines()
         for _, mod in enumerate(modifiers):
             line_pt1 = f"{f'{self.identified(mod[0], 1):21}'f'| {self.identified(mod[1], 1):20}'}"
             line_pt2 = f"{f'| {self.identified(mod[2], 2):21}'f'| {self.identified(mod[3], 2)}'}"
             lines.append(line_brackets(f"{line_pt1}{line_pt2}"))
+        return lines
+
+    def combat_modifier_table_lines(self) -> List[str]:
+        '''Formats the Battle Cry and Aura Table'''
+        format_line = "*" * 91
         combat_mod_title = f"{f'Battle Cry':21}{f'| Aura':22}{f'| Battle Cry':23}{f'| Aura':21}"
-        lines.extend([format_line, line_brackets(combat_mod_title), format_line])
+        lines = [format_line, line_brackets(combat_mod_title), format_line]
         combat_mods = self.combat_modifier_lines()
         for _, mod in enumerate(combat_mods):
             line_pt1 = f"{f'{self.identified(mod[0], 1):21}'f'| {self.identified(mod[1], 1):20}'}"
             line_pt2 = f"{f'| {self.identified(mod[2], 2):21}'f'| {self.identified(mod[3], 2)}'}"
             lines.append(line_brackets(f"{line_pt1}{line_pt2}"))
         lines.append(format_line)
+        return lines
 
+    @profiled
+    def __str__(self):
+        '''
+        Prints out Character Panes in Combat
+        Each section is cached and only rebuilt when its own version counter or
+        the Combatant values it shows have changed since the last print
+        '''
+        char_1 = self._combatant_1
+        char_2 = self._combatant_2
+        versions = self._section_versions
+        lines = []
+        lines.extend(self.cached_section(
+            "title", (char_1.name, char_1.char_class, char_1.level,
+                      char_2.name, char_2.char_class, char_2.level),
+            self.title_lines))
+        lines.extend(self.cached_section(
+            "status", (versions["status"], char_1.level, char_2.level,
+                       char_1.hit_points, char_1.max_hit_points, char_1.special,
+                       char_2.hit_points, char_2.max_hit_points, char_2.special,
+                       char_1.attack_power, char_1.defense_power,
+                       char_2.attack_power, char_2.defense_power),
+            self.status_lines))
+        lines.extend(self.cached_section(
+            "modifiers", (versions["modifiers"], self.modifier_key(char_1),
+                          self.modifier_key(char_2)),
+            self.modifier_table_lines))
+        lines.extend(self.cached_section(
+            "combat_modifiers", (versions["combat_modifiers"],),
+            self.combat_modifier_table_lines))
         return "\n".join(lines)
@@ -1,5 +1,5 @@
 '''Random Encounter Constructor for Dungeon Dudes'''
-from random import choice
+from random import Random
 from .characters import Character
 from .monsters.beast_src import Drake, Griffon, Chimera
 from .monsters.elemental_src import FireElemental, FrostElemental, StormElemental
@@ -8,14 +8,20 @@ from .monsters.golem_src import StoneGolem, TreasureGolem, MetallicGolem
 from .monsters.undead_src import Zombie, Vampire, Banshee
 from .monsters import Monster
 from .encounter import Encounter
+from .dd_data import PrintSink
 
-def encounter_generator(character : Character) -> Encounter:
-    '''Returns Sample Encounter'''
-    possible_monsters = [Drake, Griffon, Chimera,
-                         FireElemental, FrostElemental, StormElemental,
-                         Bandit, Ogre, Murloc,
-                         StoneGolem, TreasureGolem, MetallicGolem,
-                         Banshee, Vampire, Zombie]
+possible_monsters : list = [Drake, Griffon, Chimera,
+                            FireElemental, FrostElemental, StormElemental,
+                            Bandit, Ogre, Murloc,
+                            StoneGolem, TreasureGolem, MetallicGolem,
+                            Banshee, Vampire, Zombie]
+
+def encounter_generator(character : Character, rng : Random = None,
+                        printer : PrintSink = None) -> Encounter:
+    '''Returns Sample Encounter, drawing the Monster and Encounter seed from rng'''
+    rng = rng if rng is not None else Random()
     implemented_monsters = [monster for monster in possible_monsters
                             if issubclass(monster, Monster)]
-    return Encounter(character, choice(implemented_monsters)(character.level))
+    monster_class = rng.choice(implemented_monsters)
+    monster = monster_class(character.level, Random(rng.getrandbits(64)))
+    return Encounter(character, monster, seed=rng.getrandbits(64), printer=printer)
@@ -1,9 +1,18 @@
-'''Module for Loading Saved Games'''
-import pickle
-import os
-import sys
+'''
+Module for Loading Saved Games
+Every function takes the SaveWriter to use; the module level one, over the
+shared save directory, serves the local game, and each server session
+passes its player's own
+'''
+from typing import Optional
 from .characters import Character
-from .dd_data import LimitedDict, CombatPrint
+from .dd_data import LimitedDict
+from .save_store import SaveStore
+from .save_writer import SaveWriter
+from .profiling import profiled
+
+save_store : SaveStore = SaveStore()
+save_writer : SaveWriter = SaveWriter(save_store)
 
 def override():
     '''Prompts User to Verify an Action'''
@@ -13,47 +22,29 @@ def override():
             return True
     return False
 
-def load_file(file_name) -> [dict, str]:
-    '''Loads Pickle File to Dictionary'''
-    allowed_keys = ("autosave", "save_1", "save_2", "save_3")
-    if os.path.exists(file_name):
-        with open(file_name, "rb") as file:
-            try:
-                saved_games = pickle.load(file)
-                if not isinstance(saved_games, LimitedDict):
-                    return (LimitedDict(allowed_keys),
-                            f"\nError: Invalid file for {file_name}", False)
-                return (saved_games, "\n", True)
-            except pickle.UnpicklingError:
-                return (LimitedDict(allowed_keys),
-                        f"\nError: Failed to load saved games from {file_name}", False)
-    else:
-        default_data = LimitedDict(allowed_keys)
-        try:
-            with open(file_name, 'wb') as file:
-                pickle.dump(default_data, file)
-            return (default_data,
-                "\nSave File Didn't Exist.  Creating New. - ", True)
-        except FileNotFoundError:
-            print("Path to directory incurred a File Not Found Error. Check Directory Path.")
-            print("Exiting")
-            sys.exit()
+@profiled
+def save(character: Character, slot = "autosave", writer : SaveWriter = None):
+    '''Saves Character to a Single Slot, Autosave by Default, and Waits for the Write'''
+    writer = writer if writer is not None else save_writer
+    writer.submit(slot, character)
+    error : Optional[Exception] = writer.flush()
+    if error is not None:
+        return f"\nError: Failed to save {slot}: {error}"
+    return "\nAutosave complete."
+
+def autosave(character: Character, writer : SaveWriter = None):
+    '''Queues an Autosave in the Background'''
+    writer = writer if writer is not None else save_writer
+    writer.submit("autosave", character)
 
-def save(character: Character, slot = "autosave"):
-    '''Auto Saves Character on Keyboard Interrupt'''
-    file_name = "src/dd_data/saved_games.pkl"
-    saved_games, message, should_continue = load_file(file_name)
-    character.printer = None
-    if should_continue:
-        character.printer = None
-        saved_games[slot] = character
-        with open(file_name, "wb") as file:
-            pickle.dump(saved_games, file)
-            character.printer = CombatPrint()
-        return f"{message}Autosave complete."
-    return message
+def load_saves(writer : SaveWriter = None) -> LimitedDict:
+    '''Slot Summaries for the Save and Load Menus, without Loading Characters'''
+    writer = writer if writer is not None else save_writer
+    writer.flush()
+    return writer.store.slots()
 
-def load_saves() -> LimitedDict:
-    '''Loads the Saved Games for the Load Game Menu'''
-    file_name = "src/dd_data/saved_games.pkl"
-    return load_file(file_name)[0]
+def load_character(slot : str, writer : SaveWriter = None) -> Optional[Character]:
+    '''Loads the Character Saved in a Slot'''
+    writer = writer if writer is not None else save_writer
+    writer.flush()
+    return writer.store.load(slot)
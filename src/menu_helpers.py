@@ -1,5 +1,5 @@
 '''Menu Helper Functions for Dungeon Dudes'''
-import os
+from .screen import get_screen
 
 format_line : str  = "*" * 91
 
@@ -26,7 +26,11 @@ ________                                             ________            .___
 
 def clear():
     '''Clear the screen'''
-    os.system('cls' if os.name == 'nt' else 'clear')
+    get_screen().clear()
+
+def screen_frame():
+    '''Clears the screen and buffers the prints in a with block into one write'''
+    return get_screen().frame()
 
 def line_brackets(line: str) -> str:
     '''Puts brackets on a line and makes it 91 characters wide'''
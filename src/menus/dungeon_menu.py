@@ -1,11 +1,11 @@
 '''Module for Dungeon Dudes Town Menu'''
 import cmd
-from ..menu_helpers import banner, clear, line_brackets, format_line
+from ..menu_helpers import banner, screen_frame, line_brackets, format_line
 from ..encounter import Encounter
 from ..characters import Character
 from .encounter_menu import EncounterMenu
 from ..encounter_helpers import encounter_generator
-from ..dd_data import CombatPrint
+from ..load_game import autosave
 
 class DungeonMenu(cmd.Cmd):
     '''Encounter Menu for Dungeon Dudes'''
@@ -38,21 +38,27 @@ class DungeonMenu(cmd.Cmd):
     def display_menu(self):
         '''Prints the Adventure Menu for Dungeon Dudes'''
         name = self._session.character.name
-        clear()
-        print(banner())
-        print(format_line)
-        print(line_brackets(f"Welcome to Town {name} - Prepare for Your Adventure Here"))
-        print(format_line)
-        print(line_brackets("Start     - Begin your Dungeon Crawl, Gain xp/Gold"))
-        print(line_brackets("Back      - Return to Town"))
-        print(format_line)
+        with screen_frame():
+            print(banner())
+            print(format_line)
+            print(line_brackets(f"Welcome to Town {name} - Prepare for Your Adventure Here"))
+            print(format_line)
+            print(line_brackets("Start     - Begin your Dungeon Crawl, Gain xp/Gold"))
+            print(line_brackets("Back      - Return to Town"))
+            print(format_line)
 
     def do_start(self, arg): # pylint: disable=unused-argument
         '''Launches Dungeon Crawl with 4 Monster Gauntlet'''
-        printer = CombatPrint()
-        encounter : Encounter = encounter_generator(self._session.character)
+        encounter : Encounter = encounter_generator(self._session.character,
+                                                    self._session.rng,
+                                                    self._session.printer)
         self._session.active_encounter = True
-        EncounterMenu(self._session, encounter).cmdloop()
+        return self._session.scheduler.open(EncounterMenu(self._session, encounter),
+                                            lambda: self.end_encounter(encounter))
+
+    def end_encounter(self, encounter : Encounter) -> bool:
+        '''Runs after an Encounter Menu Closes, True Returns to Town'''
+        printer = encounter.printer
         if encounter.combatant_1_alive and encounter.combatant_2_alive:
             printer("Teleported Back to Town...")
             self._session.active_encounter = False
@@ -62,6 +68,8 @@ class DungeonMenu(cmd.Cmd):
             printer(f"{encounter.combatant_1.name} is victorious against"
                   f" {encounter.combatant_2.name}!")
             self._character.win_battle(encounter.combatant_2)
+            self._session.prefetch_shop()
+            autosave(self._character, self._session.saves)
             self._encounter_count += 1
             if self._encounter_count < self._amount_before_town:
                 input("Press Enter to Continue...")
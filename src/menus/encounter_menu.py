@@ -3,7 +3,7 @@ import cmd
 from ..encounter import Encounter
 from ..characters import Character
 from ..monsters import Monster
-from ..dd_data import CombatPrint
+from ..dd_data import PrintSink
 from ..combat_action import CombatAction
 from .special_attack_menu import SpecialAttackMenu
 
@@ -12,9 +12,8 @@ class EncounterMenu(cmd.Cmd):
 
     def __init__(self, adventure, encounter):
         super().__init__()
-        self.printer : CombatPrint = CombatPrint()
+        self.printer : PrintSink = encounter.printer
         self.printer.clear_history()
-        self.printer.set_encounter(encounter)
         self._session = adventure
         self._encounter : Encounter = encounter
         self.player_1_turn : bool = True
@@ -26,26 +25,24 @@ class EncounterMenu(cmd.Cmd):
         self.prompt = f'{self.player_1.name}: {self.player_1.level} {self.player_1.char_class} > '
         if not self._encounter.turn_order():
             self.printer(f"{self.player_2.name} acts before you are ready!")
-            self.ai_turn()
+            self.player_1_turn : bool = False
 
-    def ai_turn(self):
-        '''Calls Monster to Preform their turn'''
+    def ai_turn(self) -> bool:
+        '''Calls Monster to Preform their turn, True if Combat Ended'''
         actions : CombatAction = self.player_2.take_turn().actions
         result = self.send_actions(actions, 2)
         if result:
             return True
         self.player_1_turn : bool = True
-        self.loop_back()
         return False
 
-    def loop_back(self):
-        '''Menu if Player Turn, AI if not'''
-        if self.player_1_turn:
-            self.display_menu()
-        else:
-            result = self.ai_turn()
-            if result:
+    def loop_back(self) -> bool:
+        '''Runs the Monster's Turn if Due, then the Menu, True if Combat Ended'''
+        while not self.player_1_turn:
+            if self.ai_turn():
                 return True
+        self.display_menu()
+        return False
 
     def send_actions(self, actions, num):
         '''Parses Actions'''
@@ -53,17 +50,24 @@ class EncounterMenu(cmd.Cmd):
                            "Hex": self._encounter.parse_hex,
                            "Battle Cry" : self._encounter.parse_battle_cry,
                            "Identify" : self._encounter.parse_identify}
+        self._encounter.next_turn(num)
         action_types = [action[0] for action in actions]
         if "Escape" in action_types:
+            for action in actions:
+                self._encounter.record_action(action, num)
             self.non_scroll_escape(num)
             return True
         for action in actions:
             if action[0] == "Heal": # healing logic done within character locally
+                self._encounter.parse_heal(action, num)
+                self._encounter.record_action(action, num)
                 continue
             if action[0] != "Attack":
                 func_map[action[0]](action, num)
+                self._encounter.record_action(action, num)
             else:
                 self._encounter.parse_attack(action, num)
+                self._encounter.record_action(action, num)
                 if not self._encounter.combatants_alive():
                     return True
         return False
@@ -78,11 +82,15 @@ class EncounterMenu(cmd.Cmd):
         if self.player_2.hit_points == 0:
             self.player_2_alive : bool = False
             return True
-        self.loop_back()
+        return self.loop_back()
 
     def do_special_attack(self, arg):
         '''Launches Special Attack Menu for active player'''
-        SpecialAttackMenu(self._session, self._encounter).cmdloop()
+        return self._session.scheduler.open(SpecialAttackMenu(self._session, self._encounter),
+                                            self.end_special_attack)
+
+    def end_special_attack(self) -> bool:
+        '''Runs after the Special Attack Menu Closes, True if Combat Ended'''
         if self._encounter.escape_flag:
             self.non_scroll_escape(1)
             return True
@@ -92,8 +100,7 @@ class EncounterMenu(cmd.Cmd):
         if self.player_2.hit_points == 0:
             self.player_2_alive : bool = False
             return True
-        self.loop_back()
-
+        return self.loop_back()
 
     def do_healing_potion(self, arg):
         '''Uses Healing Potion for active player'''
@@ -106,7 +113,7 @@ class EncounterMenu(cmd.Cmd):
         if self.player_2.hit_points == 0:
             self.player_2_alive : bool = False
             return True
-        self.loop_back()
+        return self.loop_back()
 
     def non_scroll_escape(self, num):
         '''Escapes to Town when triggered by something other than scroll'''
@@ -126,11 +133,11 @@ class EncounterMenu(cmd.Cmd):
             self.player_1.scroll_of_escape -= 1
             self.printer(f"{self.player_1.name} escapes to town with a scroll of escape")
             return True
-        self.loop_back()
+        return self.loop_back()
 
     def preloop(self):
-        '''Displays Menu When Class __init__ is called'''
-        self.display_menu()
+        '''Runs the Monster's Opening Turn if it Acts First and Displays the Menu'''
+        return self.loop_back()
 
     def parseline(self, line):
         '''Parse Input to allow more human friendly input options'''
@@ -1,9 +1,10 @@
 '''Module for Dungeon Dudes Load Saved Game Menu'''
 import cmd
-from ..menu_helpers import banner, clear, line_brackets, format_line
-from ..load_game import load_saves
+from ..menu_helpers import banner, screen_frame, line_brackets, format_line
+from ..load_game import load_saves, load_character
 from ..characters import Character
-from ..dd_data import LimitedDict, CombatPrint
+from ..save_store import SlotInfo
+from ..dd_data import LimitedDict
 from .town_menu import TownMenu
 
 class LoadMenu(cmd.Cmd):
@@ -12,7 +13,7 @@ class LoadMenu(cmd.Cmd):
     def __init__(self, adventure):
         super().__init__()
         self._session = adventure
-        self._saves : LimitedDict = load_saves()
+        self._saves : LimitedDict = load_saves(self._session.saves)
         self._formatted_saves : list = ([self.format_saves(key, value )
                                   for key, value in self._saves.items()])
 
@@ -22,10 +23,11 @@ class LoadMenu(cmd.Cmd):
 
     def attempt_load(self, key: str):
         '''Loads Saved File if it's not EMPTY'''
-        if isinstance(self._saves[key], Character):
-            self._session.character = self._saves[key]
-            self._session.character.printer = CombatPrint()
-            TownMenu(self._session).cmdloop()
+        character : Character = load_character(key, self._session.saves)
+        if isinstance(character, Character):
+            self._session.character = character
+            self._session.character.printer = self._session.printer
+            self._session.scheduler.open(TownMenu(self._session))
         else:
             print(f"Error Loading {key}.  Not a Valid Character")
             input("Press Enter to Continue....")
@@ -41,9 +43,9 @@ class LoadMenu(cmd.Cmd):
         return command, arg, line
 
     @staticmethod
-    def format_saves(slot : str, character : [Character, str]) -> str:
+    def format_saves(slot : str, character : [SlotInfo, str]) -> str:
         '''Formats Saved Characters in Readable String'''
-        if isinstance(character, Character):
+        if isinstance(character, SlotInfo):
             formatted_save = (f'{slot.capitalize()} - {character.name}: Level {character.level}'
                             f' {character.char_class}, {character.battles_won} Battles Won')
             return line_brackets(formatted_save)
@@ -52,19 +54,19 @@ class LoadMenu(cmd.Cmd):
 
     def get_saves(self):
         '''Ensures self._saves is up to date'''
-        self._saves : LimitedDict = load_saves()
+        self._saves : LimitedDict = load_saves(self._session.saves)
         self._formatted_saves = ([self.format_saves(key, value )
                                   for key, value in self._saves.items()])
 
     def display_menu(self):
         '''Prints the Load Menu for Dungeon Dudes'''
-        clear()
-        self.get_saves()
-        print(banner())
-        print(format_line)
-        print(*self._formatted_saves, sep="\n")
-        print(line_brackets('Back - Go Back'))
-        print(format_line)
+        with screen_frame():
+            self.get_saves()
+            print(banner())
+            print(format_line)
+            print(*self._formatted_saves, sep="\n")
+            print(line_brackets('Back - Go Back'))
+            print(format_line)
 
     def do_autosave(self, arg): # pylint: disable=unused-argument
         '''Attempts to Load Autosave'''
@@ -2,7 +2,7 @@
 import cmd
 from .new_game_menu import NewGameMenu
 from .load_menu import LoadMenu
-from ..menu_helpers import banner, clear, line_brackets, format_line
+from ..menu_helpers import banner, screen_frame, line_brackets, format_line
 
 class MainMenu(cmd.Cmd):
     '''Main Menu for Dungeon Dudes'''
@@ -26,23 +26,21 @@ class MainMenu(cmd.Cmd):
 
     def display_menu(self):
         '''Prints the Main Menu for Dungeon Dudes'''
-        clear()
-        print(banner())
-        print(format_line)
-        print(line_brackets("New  - Start a New Game"))
-        print(line_brackets("Load - Load a Saved Game"))
-        print(line_brackets("Exit - Exit Game"))
-        print(format_line)
+        with screen_frame():
+            print(banner())
+            print(format_line)
+            print(line_brackets("New  - Start a New Game"))
+            print(line_brackets("Load - Load a Saved Game"))
+            print(line_brackets("Exit - Exit Game"))
+            print(format_line)
 
     def do_new(self, arg): # pylint: disable=unused-argument
         '''Launches New Game Menu'''
-        NewGameMenu(self._session).cmdloop()
-        self.display_menu()
+        self._session.scheduler.open(NewGameMenu(self._session), self.display_menu)
 
     def do_load(self, arg): # pylint: disable=unused-argument
         """Launches Load Game Menu"""
-        LoadMenu(self._session).cmdloop()
-        self.display_menu()
+        self._session.scheduler.open(LoadMenu(self._session), self.display_menu)
 
     def do_exit(self, arg): # pylint: disable=unused-argument
         """Exit the program."""
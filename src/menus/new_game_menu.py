@@ -1,6 +1,6 @@
 '''Module for Dungeon Dudes New Game Menu'''
 import cmd
-from ..menu_helpers import banner, clear, line_brackets, format_line
+from ..menu_helpers import banner, screen_frame, line_brackets, format_line
 from ..characters import Character, Fighter, Rogue, Wizard, Cleric, Ranger
 from .town_menu import TownMenu
 
@@ -48,8 +48,7 @@ class NewGameMenu(cmd.Cmd):
         '''Checks if an Object is a Valid Character'''
         if isinstance(character, Character):
             self._session.character : Character = character
-            TownMenu(self._session).cmdloop()
-            self.display_menu()
+            self._session.scheduler.open(TownMenu(self._session), self.display_menu)
         else:
             print(f"Error: {class_name} Class has not been Implemented")
             input("Press Enter to go back....")
@@ -57,17 +56,17 @@ class NewGameMenu(cmd.Cmd):
 
     def display_menu(self):
         '''Prints the New Game Menu for Dungeon Dudes'''
-        clear()
-        print(banner())
-        print(format_line)
-        print(line_brackets("Choose Your Class to Start Your Adventure!"))
-        print(line_brackets("Fighter   - Brave Warrior, Skill in Combat Arts"))
-        print(line_brackets("Rogue     - Agile Assassin, Master of Poisons and Deception"))
-        print(line_brackets("Wizard    - Elemental Spell Caster, Harnessing Powerful Magic"))
-        print(line_brackets("Cleric    - Divine Healer, Channeling the Gods to Mend and Smite."))
-        print(line_brackets("Ranger    - Nature's Warden, Blending Archery and Animal Companions."))
-        print(line_brackets("Back      - Return to Main Menu"))
-        print(format_line)
+        with screen_frame():
+            print(banner())
+            print(format_line)
+            print(line_brackets("Choose Your Class to Start Your Adventure!"))
+            print(line_brackets("Fighter   - Brave Warrior, Skill in Combat Arts"))
+            print(line_brackets("Rogue     - Agile Assassin, Master of Poisons and Deception"))
+            print(line_brackets("Wizard    - Elemental Spell Caster, Harnessing Powerful Magic"))
+            print(line_brackets("Cleric    - Divine Healer, Channeling the Gods to Mend and Smite."))
+            print(line_brackets("Ranger    - Nature's Warden, Blending Archery and Animal Companions."))
+            print(line_brackets("Back      - Return to Main Menu"))
+            print(format_line)
 
     def do_fighter(self, arg): # pylint: disable=unused-argument
         '''Launches New Game with Fighter Class'''
@@ -1,8 +1,8 @@
 '''Module for Dungeon Dudes Save Game Menu'''
 import cmd
-from ..menu_helpers import banner, clear, line_brackets, format_line
+from ..menu_helpers import banner, screen_frame, line_brackets, format_line
 from ..load_game import load_saves, save, override
-from ..characters import Character
+from ..save_store import SlotInfo
 from ..dd_data import LimitedDict
 
 class SaveMenu(cmd.Cmd):
@@ -11,7 +11,7 @@ class SaveMenu(cmd.Cmd):
     def __init__(self, adventure):
         super().__init__()
         self._session = adventure
-        self._saves : LimitedDict = load_saves()
+        self._saves : LimitedDict = load_saves(self._session.saves)
         self._formatted_saves : list = ([self.format_saves(key, value )
                                   for key, value in self._saves.items()])
 
@@ -22,18 +22,20 @@ class SaveMenu(cmd.Cmd):
     def attempt_save(self, key: str):
         '''Saves Character and Prompts if Slot not EMPTY'''
         if isinstance(self._saves[key], str):
-            save(self._session.character, key)
+            if not self.write_save(key):
+                return False
             input(f"Save to {key.capitalize()} Successful Press Enter to go back to Town...")
             return True
-        elif isinstance(self._saves[key], Character):
-            rep_char : Character = self._saves[key]
+        elif isinstance(self._saves[key], SlotInfo):
+            rep_char : SlotInfo = self._saves[key]
             name : str = rep_char.name
             char_class : str= rep_char.char_class
             level : int = rep_char.level
             warning = f"This would save over {name}, Level: {level} {char_class}!"
             print(warning)
             if override():
-                save(self._session.character, key)
+                if not self.write_save(key):
+                    return False
                 input("Saved Successfully Press Enter to Continue")
                 return True
             else:
@@ -45,6 +47,15 @@ class SaveMenu(cmd.Cmd):
             input("Press Enter to Continue....")
             self.display_menu()
 
+    def write_save(self, key: str) -> bool:
+        '''Saves Character to a Slot, Reports a Failed Write and Returns False'''
+        result : str = save(self._session.character, key, self._session.saves)
+        if result.lstrip().startswith("Error"):
+            print(result)
+            input("Save Failed Press Enter to Continue...")
+            return False
+        return True
+
     def parseline(self, line : str) -> [str, str, str]:
         '''Parse Input to allow more human friendly input options'''
         command, arg, line = super().parseline(line)
@@ -55,9 +66,9 @@ class SaveMenu(cmd.Cmd):
         return command, arg, line
 
     @staticmethod
-    def format_saves(slot : str, character : [Character, str]) -> str:
+    def format_saves(slot : str, character : [SlotInfo, str]) -> str:
         '''Formats Saved Characters in Readable String'''
-        if isinstance(character, Character):
+        if isinstance(character, SlotInfo):
             formatted_save = (f'{slot.capitalize()} - {character.name}: Level {character.level}'
                             f' {character.char_class}, {character.battles_won} Battles Won')
             return line_brackets(formatted_save)
@@ -66,19 +77,19 @@ class SaveMenu(cmd.Cmd):
 
     def get_saves(self):
         '''Ensures self._saves is up to date'''
-        self._saves : LimitedDict = load_saves()
+        self._saves : LimitedDict = load_saves(self._session.saves)
         self._formatted_saves = ([self.format_saves(key, value )
                                   for key, value in self._saves.items()])
 
     def display_menu(self):
         '''Prints the Save Menu for Dungeon Dudes'''
-        clear()
-        self.get_saves()
-        print(banner())
-        print(format_line)
-        print(*self._formatted_saves[1:], sep="\n")
-        print(line_brackets('Back - Go Back'))
-        print(format_line)
+        with screen_frame():
+            self.get_saves()
+            print(banner())
+            print(format_line)
+            print(*self._formatted_saves[1:], sep="\n")
+            print(line_brackets('Back - Go Back'))
+            print(format_line)
 
     def do_save_1(self, arg): # pylint: disable=unused-argument
         '''Attempts to Save Slot 1'''
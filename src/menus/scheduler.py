@@ -0,0 +1,84 @@
+'''
+Menu Scheduler for Dungeon Dudes
+Every cmd.Cmd menu runs from one loop.  Opening a submenu pushes it on a
+stack instead of nesting another cmdloop, and when it closes the opener's
+on_close continuation runs.  A menu, and any Encounter it holds, is released
+as soon as it closes, however long the session runs.
+'''
+import cmd
+from typing import Callable, List, Optional, Tuple
+
+OnClose = Optional[Callable[[], Optional[bool]]]
+
+class MenuScheduler:
+    '''Stack of Open Menus driven by a Single Input Loop'''
+    def __init__(self, read_line : Callable[[str], str] = None):
+        self._read_line : Callable[[str], str] = read_line if read_line is not None else input
+        self._stack : List[Tuple[cmd.Cmd, OnClose]] = []
+        self._running : bool = False
+
+    @property
+    def running(self) -> bool:
+        '''True while run is Driving Menus'''
+        return self._running
+
+    @property
+    def depth(self) -> int:
+        '''Number of Open Menus'''
+        return len(self._stack)
+
+    @property
+    def current(self) -> Optional[cmd.Cmd]:
+        '''Menu Receiving Input'''
+        return self._stack[-1][0] if self._stack else None
+
+    def open(self, menu : cmd.Cmd, on_close : OnClose = None) -> Optional[bool]:
+        '''
+        Opens menu over the current one.  While running this returns None at
+        once and on_close runs when menu closes; a True from on_close closes
+        the opener too.  When idle, menu runs to completion here and the
+        result of on_close is returned for the caller's do_ method
+        '''
+        if self._running:
+            self._push(menu, on_close)
+            return None
+        self.run(menu)
+        return on_close() if on_close is not None else None
+
+    def run(self, menu : cmd.Cmd):
+        '''Runs menu, and everything opened from it, until it closes'''
+        base : int = len(self._stack)
+        was_running : bool = self._running
+        self._running = True
+        try:
+            self._push(menu, None)
+            while len(self._stack) > base:
+                self.step()
+        finally:
+            self._running = was_running
+
+    def step(self):
+        '''Reads and Executes one Command for the Current Menu'''
+        menu : cmd.Cmd = self._stack[-1][0]
+        try:
+            line : str = self._read_line(menu.prompt)
+        except EOFError:
+            line = "EOF"
+        line = menu.precmd(line)
+        stop = menu.postcmd(menu.onecmd(line), line)
+        if stop and self.current is menu:
+            self._close()
+
+    def _push(self, menu : cmd.Cmd, on_close : OnClose):
+        '''Adds a Menu, a True from its preloop closes it before any Input'''
+        self._stack.append((menu, on_close))
+        if menu.preloop():
+            self._close()
+
+    def _close(self):
+        '''Pops the Current Menu and Runs Continuations until one keeps its Menu Open'''
+        while self._stack:
+            menu, on_close = self._stack.pop()
+            menu.postloop()
+            if on_close is None or not on_close():
+                return
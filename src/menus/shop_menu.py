@@ -1,6 +1,6 @@
 '''Module for Dungeon Dudes Shop Game Menu'''
 import cmd
-from ..menu_helpers import banner, clear, line_brackets, format_line
+from ..menu_helpers import banner, screen_frame, line_brackets, format_line
 from ..characters import Character
 from ..characters.equipment import Equipment
 
@@ -71,23 +71,23 @@ class ShopMenu(cmd.Cmd):
 
     def display_menu(self):
         '''Prints the Shop Menu for Dungeon Dudes'''
-        clear()
-        print(banner())
-        healing_line, escape_line = self.format_consumables()
-        print(format_line)
-        print(self.make_greeting())
-        print(format_line)
-        if self._inventory["Weapon"]:
-            self.format_item("Weapon", self._inventory["Weapon"])
-        if self._inventory["Armor"]:
-            self.format_item("Armor", self._inventory["Armor"])
-        if self._inventory["Accessory"]:
-            self.format_item("Accessory", self._inventory["Accessory"])
-        print(format_line)
-        print(healing_line)
-        print(format_line)
-        print(escape_line)
-        print(format_line)
+        with screen_frame():
+            print(banner())
+            healing_line, escape_line = self.format_consumables()
+            print(format_line)
+            print(self.make_greeting())
+            print(format_line)
+            if self._inventory["Weapon"]:
+                self.format_item("Weapon", self._inventory["Weapon"])
+            if self._inventory["Armor"]:
+                self.format_item("Armor", self._inventory["Armor"])
+            if self._inventory["Accessory"]:
+                self.format_item("Accessory", self._inventory["Accessory"])
+            print(format_line)
+            print(healing_line)
+            print(format_line)
+            print(escape_line)
+            print(format_line)
 
     def do_weapon(self, arg): # pylint: disable=unused-argument
         '''Attempts to Buy Weapon'''
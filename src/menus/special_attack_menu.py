@@ -3,7 +3,7 @@ import cmd
 from ..characters import Character
 from ..combatant_abc import Combatant
 from ..encounter import Encounter
-from ..dd_data import CombatPrint
+from ..dd_data import PrintSink
 from ..menu_helpers import line_brackets
 
 class SpecialAttackMenu(cmd.Cmd):
@@ -11,7 +11,7 @@ class SpecialAttackMenu(cmd.Cmd):
 
     def __init__(self, adventure, encounter):
         super().__init__()
-        self.printer : CombatPrint = CombatPrint()
+        self.printer : PrintSink = encounter.printer
         self._session = adventure
         self._encounter : Encounter = encounter
         self.player_1 : Character = encounter.combatant_1
@@ -66,17 +66,24 @@ class SpecialAttackMenu(cmd.Cmd):
                            "Identify" : self._encounter.parse_identify}
         turn_over, actions = list(self._command_dict[number].values())[0]()
         actions = actions.actions
+        self._encounter.next_turn(1)
         action_types = [action[0] for action in actions]
         if "Escape" in action_types:
+            for action in actions:
+                self._encounter.record_action(action, 1)
             self._encounter.escape_flag = True
             return True
         for action in actions:
             if action[0] == "Heal": # healing logic done within character locally
+                self._encounter.parse_heal(action, 1)
+                self._encounter.record_action(action, 1)
                 continue
             if action[0] != "Attack":
                 func_map[action[0]](action, 1)
+                self._encounter.record_action(action, 1)
             else:
                 self._encounter.parse_attack(action, 1)
+                self._encounter.record_action(action, 1)
                 if not self._encounter.combatants_alive:
                     break
         if turn_over:
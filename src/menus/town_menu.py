@@ -1,6 +1,6 @@
 '''Module for Dungeon Dudes Town Menu'''
 import cmd
-from ..menu_helpers import banner, clear, line_brackets, format_line
+from ..menu_helpers import banner, screen_frame, line_brackets, format_line
 from .save_menu import SaveMenu
 from .shop_menu import ShopMenu, check_cost, confirm_purchase
 from .dungeon_menu import DungeonMenu
@@ -33,28 +33,26 @@ class TownMenu(cmd.Cmd):
     def display_menu(self):
         '''Prints the Town Menu for Dungeon Dudes'''
         name = self._session.character.name
-        clear()
-        print(banner())
-        print(format_line)
-        print(line_brackets(f"Welcome to Town {name} - Prepare for Your Adventure Here"))
-        print(format_line)
-        print(line_brackets("Adventure - Explore the Dungeon, Fight Monsters, Gain xp/Gold"))
-        print(line_brackets("Shop      - Visit the Shop"))
-        print(line_brackets("Heal      - Restore HP and Class Resources - (3 Gold plus 2/Level)"))
-        print(line_brackets("Character - View Character Sheet"))
-        print(line_brackets("Save      - Save Your Game"))
-        print(line_brackets("Back      - Return to New Game Menu"))
-        print(format_line)
+        with screen_frame():
+            print(banner())
+            print(format_line)
+            print(line_brackets(f"Welcome to Town {name} - Prepare for Your Adventure Here"))
+            print(format_line)
+            print(line_brackets("Adventure - Explore the Dungeon, Fight Monsters, Gain xp/Gold"))
+            print(line_brackets("Shop      - Visit the Shop"))
+            print(line_brackets("Heal      - Restore HP and Class Resources - (3 Gold plus 2/Level)"))
+            print(line_brackets("Character - View Character Sheet"))
+            print(line_brackets("Save      - Save Your Game"))
+            print(line_brackets("Back      - Return to New Game Menu"))
+            print(format_line)
 
     def do_adventure(self, arg): # pylint: disable=unused-argument
         '''Launches Dungeon Crawl with 5 Monster Gauntlet'''
-        DungeonMenu(self._session).cmdloop()
-        self.display_menu()
+        self._session.scheduler.open(DungeonMenu(self._session), self.display_menu)
 
     def do_shop(self, arg): # pylint: disable=unused-argument
         '''Launches Shop Menu'''
-        ShopMenu(self._session).cmdloop()
-        self.display_menu()
+        self._session.scheduler.open(ShopMenu(self._session), self.display_menu)
 
     def do_heal(self, arg): # pylint: disable=unused-argument
         '''Prompts user to heal in exchange for Gold'''
@@ -76,14 +74,13 @@ class TownMenu(cmd.Cmd):
 
     def do_character(self, arg):  # pylint: disable=unused-argument
         '''Prints Character Sheet'''
-        clear()
-        print(self._session.character)
+        with screen_frame():
+            print(self._session.character)
         self.loop_back()
 
     def do_save(self, arg): # pylint: disable=unused-argument
         '''Launches Save Game Menu'''
-        SaveMenu(self._session).cmdloop()
-        self.display_menu()
+        self._session.scheduler.open(SaveMenu(self._session), self.display_menu)
 
     def do_back(self, arg): # pylint: disable=unused-argument
         """Back to New Game Menu."""
@@ -1,8 +1,7 @@
 '''Module for the Dungeon Dudes Beast Monster'''
-from random import randint
 from .monsters_abc import Monster
 from ..combat_action import CombatAction
-from ..dd_data import CombatPrint, LimitedDict, damage_types
+from ..dd_data import NullPrint, DamageVector, damage_types
 
 class Beast(Monster):
     '''Beast Monster Class'''
@@ -10,15 +9,15 @@ class Beast(Monster):
     def __init__(self, name: str, level_mod : int, stat_structure: dict):
         self._gold = level_mod * 5
         super().__init__(name, level_mod, "Beast", stat_structure)
-        self.printer = CombatPrint()
-        self._def_modifiers = LimitedDict(damage_types, default_value=100)
-        self._dam_modifiers = LimitedDict("Physical", default_value=100)
+        self.printer = NullPrint()
+        self._def_modifiers = DamageVector(damage_types, default_value=100)
+        self._dam_modifiers = DamageVector("Physical", default_value=100)
 
     def modify_damage(self, damage) -> int:
         '''Adds Variance to Damage Events and Calculates Critical Chance'''
         damage_min = int(damage * 0.75)
         damage_max = int(damage*1.25)
-        modified : int = randint(damage_min, damage_max)
+        modified : int = self.rng.randint(damage_min, damage_max)
         return modified
 
     def attack(self) -> CombatAction:
@@ -1,8 +1,8 @@
 '''Module for the Dungeon Dudes Chimera Beast'''
 from typing import Dict, Tuple
-from random import choice, randint
+from random import Random
 from ..beast import Beast
-from ...dd_data import LimitedDict
+from ...dd_data import DamageVector
 from ...combat_action import CombatAction
 
 class Chimera(Beast):
@@ -11,20 +11,21 @@ class Chimera(Beast):
                     "Agility" : (15, 3), "Intelligence" : (15, 3), "Special" : (0,0)}
     heads = ["Snake", "Eagle", "Lion"]
 
-    def __init__(self, level_mod : int):
+    def __init__(self, level_mod : int, rng: Random = None):
+        self.rng = rng
         self._hit_points : int = self.stats_structure["Hit Points"][0]
         super().__init__('Chimera', level_mod,
                          self.stats_structure)
         self._sub_type : str = "Chimera"
-        self._dam_modifiers = LimitedDict(("Physical", "Poison", "Lightning"), default_value=100)
+        self._dam_modifiers = DamageVector(("Physical", "Poison", "Lightning"), default_value=100)
 
     @property
-    def damage_modifiers(self) -> LimitedDict:
+    def damage_modifiers(self) -> DamageVector:
         '''Getter for Damage Modifiers'''
         return self._dam_modifiers
 
     @property
-    def defense_modifiers(self) -> LimitedDict:
+    def defense_modifiers(self) -> DamageVector:
         '''Getter for Defense Modifiers'''
         return self._def_modifiers
 
@@ -49,11 +50,11 @@ class Chimera(Beast):
         '''Additional Attack for Chimera Heads'''
         heads = ["Snake", "Eagle", "Lion"]
         heads.remove(current_head)
-        head = choice(heads)
+        head = self.rng.choice(heads)
         msg = f'{head} attacks in conjunction for <value> physical damage'
         dmg = self.beast_damage(self.modify_damage(self.attack_power))
-        com_action.actions.append(("Attack", dmg, "Physical", msg))
-        return com_action
+        return CombatAction([*com_action.actions, ("Attack", dmg, "Physical", msg)],
+                            com_action.message, com_action.special)
 
     def poison_breath(self) -> CombatAction:
         '''Poison Breath Attack for Snake Head'''
@@ -78,7 +79,7 @@ class Chimera(Beast):
 
     def snake_turn(self) -> CombatAction:
         '''Actions for turns where Snake is primary head'''
-        turn_choice = randint(1,2)
+        turn_choice = self.rng.randint(1,2)
         if turn_choice == 1:
             action = self.attack(current_head="Snake")
         else:
@@ -89,7 +90,7 @@ class Chimera(Beast):
 
     def eagle_turn(self) -> CombatAction:
         '''Actions for turns where Eagle is primary head'''
-        turn_choice = randint(1,2)
+        turn_choice = self.rng.randint(1,2)
         if turn_choice == 1:
             action = self.attack(current_head="Eagle")
         else:
@@ -100,7 +101,7 @@ class Chimera(Beast):
 
     def lion_turn(self) -> CombatAction:
         '''Actions for turns where Lion is primary head'''
-        turn_choice = randint(1,2)
+        turn_choice = self.rng.randint(1,2)
         if turn_choice == 1:
             action = self.attack(current_head="Lion")
         else:
@@ -112,4 +113,4 @@ class Chimera(Beast):
     def take_turn(self) -> CombatAction:
         '''Determines which Head is Taking the turn and takes turn'''
         turns = [self.snake_turn, self.eagle_turn, self.lion_turn]
-        return choice(turns)()
+        return self.rng.choice(turns)()
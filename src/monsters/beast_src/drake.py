@@ -1,8 +1,8 @@
 '''Module for the Dungeon Dudes Drake Monster'''
 from typing import Dict, Tuple
-from random import choice
+from random import Random
 from ..beast import Beast
-from ...dd_data import LimitedDict
+from ...dd_data import DamageVector
 from ...combat_action import CombatAction
 
 class Drake(Beast):
@@ -11,24 +11,25 @@ class Drake(Beast):
                         "Agility" : (12, 3), "Intelligence" : (5, 1), "Special" : (0,0)}
     drake_types = [("Storm", "Lightning"), ("Green", "Fire"), ("Swamp", "Poison")]
 
-    def __init__(self, level_mod : int):
-        drake_type : tuple = choice(self.drake_types)
+    def __init__(self, level_mod : int, rng: Random = None):
+        self.rng = rng
+        drake_type : tuple = self.rng.choice(self.drake_types)
         self._hit_points : int = self.stats_structure["Hit Points"][0]
         self._drake_type : str = drake_type[0]
         self._damage_type : str = drake_type[1]
         super().__init__(f'{self._drake_type} Drake',
                          level_mod, self.stats_structure)
         self._sub_type : str = "Drake"
-        self._dam_modifiers = LimitedDict(("Physical", (self._damage_type)), default_value=100)
+        self._dam_modifiers = DamageVector(("Physical", (self._damage_type)), default_value=100)
         self._def_modifiers[self._damage_type] -= 40
 
     @property
-    def damage_modifiers(self) -> LimitedDict:
+    def damage_modifiers(self) -> DamageVector:
         '''Getter for Damage Modifiers'''
         return self._dam_modifiers
 
     @property
-    def defense_modifiers(self) -> LimitedDict:
+    def defense_modifiers(self) -> DamageVector:
         '''Getter for Defense Modifiers'''
         return self._def_modifiers
 
@@ -98,4 +99,4 @@ class Drake(Beast):
     def take_turn(self) -> CombatAction:
         '''Takes turn and returns the action'''
         options = [self.attack, self.breath, self.special_skill]
-        return choice(options)()
+        return self.rng.choice(options)()
@@ -1,8 +1,8 @@
 '''Module for the Dungeon Dudes Griffon Beast'''
 from typing import Dict, Tuple
-from random import choice
+from random import Random
 from ..beast import Beast
-from ...dd_data import LimitedDict
+from ...dd_data import DamageVector
 from ...combat_action import CombatAction
 
 class Griffon(Beast):
@@ -11,25 +11,26 @@ class Griffon(Beast):
                         "Agility" : (12, 4), "Intelligence" : (5, 1), "Special" : (0,0)}
     griffon_types = [("Sunfire", "Fire"), ("Anointed", "Holy")]
 
-    def __init__(self, level_mod : int):
-        griffon_type : tuple = choice(self.griffon_types)
+    def __init__(self, level_mod : int, rng: Random = None):
+        self.rng = rng
+        griffon_type : tuple = self.rng.choice(self.griffon_types)
         self._hit_points : int = self.stats_structure["Hit Points"][0]
         self._griffon_type : str = griffon_type[0]
         self._damage_type : str = griffon_type[1]
         super().__init__(f'{self._griffon_type} Griffon', level_mod,
                          self.stats_structure)
         self._sub_type : str = "Griffon"
-        self._dam_modifiers = LimitedDict(("Physical", (self._damage_type)), default_value=100)
+        self._dam_modifiers = DamageVector(("Physical", (self._damage_type)), default_value=100)
         self._empowered = False
         self._special_count = 0
 
     @property
-    def damage_modifiers(self) -> LimitedDict:
+    def damage_modifiers(self) -> DamageVector:
         '''Getter for Damage Modifiers'''
         return self._dam_modifiers
 
     @property
-    def defense_modifiers(self) -> LimitedDict:
+    def defense_modifiers(self) -> DamageVector:
         '''Getter for Defense Modifiers'''
         return self._def_modifiers
 
@@ -106,4 +107,4 @@ class Griffon(Beast):
             options = [self.attack, self.empowerment, self.special_skill]
         else:
             options = [self.attack, self.special_skill]
-        return choice(options)()
+        return self.rng.choice(options)()
@@ -1,8 +1,7 @@
 ''' Module for the Dungeon Dudes Elemental Monster '''
-from random import gauss
 from .monsters_abc import Monster
 from ..combat_action import CombatAction
-from ..dd_data import CombatPrint, LimitedDict, damage_types
+from ..dd_data import NullPrint, DamageVector, damage_types
 
 
 class Elemental(Monster):
@@ -16,9 +15,9 @@ class Elemental(Monster):
     def __init__(self, name: str, level_mod: int, stat_structure: dict):
         self._gold = level_mod * 5
         super().__init__(name, level_mod, "Elemental", stat_structure)
-        self.printer = CombatPrint()
-        self._def_modifiers = LimitedDict(damage_types, default_value=100)
-        self._dam_modifiers = LimitedDict(damage_types, default_value=100)
+        self.printer = NullPrint()
+        self._def_modifiers = DamageVector(damage_types, default_value=100)
+        self._dam_modifiers = DamageVector(damage_types, default_value=100)
 
     def base_att_def_power(self):
         self._attack_power = self.strength
@@ -31,7 +30,7 @@ class Elemental(Monster):
 
     def damage_modify(self, damage) -> int:
         ''' Adds Variance to Damage Events '''
-        modified: int = gauss(damage, .1)
+        modified: int = self.rng.gauss(damage, .1)
         return modified
 
     @property
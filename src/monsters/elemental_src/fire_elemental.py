@@ -1,9 +1,9 @@
 '''Fire Elemental Module for Dungeon Dudes'''
 from typing import Dict, Tuple
-from random import choice, randint
+from random import Random
 from ..elemental import Elemental
 from ...combat_action import CombatAction
-from ...dd_data import LimitedDict
+from ...dd_data import DamageVector
 
 
 class FireElemental(Elemental):
@@ -18,7 +18,8 @@ class FireElemental(Elemental):
                        ("Greater Fire Elemental", "Fire"),
                        ("Fire Elemental Lord", "Fire")]
 
-    def __init__(self, level_mod: int):
+    def __init__(self, level_mod: int, rng: Random = None):
+        self.rng = rng
         elemental_type: tuple = self.spawn_elemental(
             level_mod, self.elemental_types)
         self._hit_points: int = self.stats_structure["Hit Points"][0]
@@ -26,7 +27,7 @@ class FireElemental(Elemental):
         self._damage_type: str = elemental_type[1]
         super().__init__(self._elemental_type, level_mod, self.stats_structure)
         self._sub_type: str = "Fire"
-        self._dam_modifiers = LimitedDict(
+        self._dam_modifiers = DamageVector(
             ("Fire", (self._damage_type)), default_value=100)
         self._reconstitute_count = 0.0
         self._burning_strike_count = 0
@@ -43,7 +44,6 @@ class FireElemental(Elemental):
     def spawn_elemental(self, level_mod: int, elemental_types: list):
         ''' Spawns elemental based on character level '''
         if level_mod <= 5:
-            print(f'{elemental_types[0]}')
             return elemental_types[0]
         if level_mod in range(6, 11):
             tier_2 = {6: 20,
@@ -51,7 +51,7 @@ class FireElemental(Elemental):
                       8: 60,
                       9: 80,
                       10: 100}
-            if randint(1, 100) <= tier_2.get(level_mod):
+            if self.rng.randint(1, 100) <= tier_2.get(level_mod):
                 return elemental_types[1]
             return elemental_types[0]
         if level_mod in range(11, 21):
@@ -66,23 +66,23 @@ class FireElemental(Elemental):
                 18: 80,
                 19: 90,
                 20: 100}
-            if randint(1, 100) <= tier_3.get(level_mod):
+            if self.rng.randint(1, 100) <= tier_3.get(level_mod):
                 return elemental_types[2]
             else:
                 return elemental_types[1]
         if level_mod >= 20:
             return elemental_types[2]
         if level_mod >= 25:
-            if randint(1, 100) <= 1:
+            if self.rng.randint(1, 100) <= 1:
                 return elemental_types[3]
 
     @property
-    def damage_modifiers(self) -> LimitedDict:
+    def damage_modifiers(self) -> DamageVector:
         '''Getter for Damage Modifiers'''
         return self._dam_modifiers
 
     @property
-    def defense_modifiers(self) -> LimitedDict:
+    def defense_modifiers(self) -> DamageVector:
         '''Getter for Defense Modifiers'''
         return self._def_modifiers
 
@@ -1,9 +1,9 @@
 '''Storm Elemental Module for Dungeon Dudes'''
 from typing import Dict, Tuple
-from random import choice, randint, random
+from random import Random
 from ..elemental import Elemental
 from ...combat_action import CombatAction
-from ...dd_data import LimitedDict
+from ...dd_data import DamageVector
 
 
 class StormElemental(Elemental):
@@ -16,7 +16,8 @@ class StormElemental(Elemental):
     elemental_types = [("Storm Elemental", "Lightning"),
                        ("Storm Elemental Lord", "Lightning")]
 
-    def __init__(self, level_mod: int):
+    def __init__(self, level_mod: int, rng: Random = None):
+        self.rng = rng
         elemental_type: tuple = self.spawn_elemental(
             level_mod, self.elemental_types)
         self._hit_points: int = self.stats_structure["Hit Points"][0]
@@ -25,7 +26,7 @@ class StormElemental(Elemental):
         self._damage_type: str = elemental_type[1]
         super().__init__(self._elemental_type, level_mod, self.stats_structure)
         self._sub_type: str = "Lightning"
-        self._dam_modifiers = LimitedDict(
+        self._dam_modifiers = DamageVector(
             ("Lightning", (self._damage_type)), default_value=100)
         self._options = [self.static_shock, self.double_shock]
         self._static_shock_count = 0
@@ -38,7 +39,7 @@ class StormElemental(Elemental):
             lord_chance = .01
             for _ in range(increased_odds):
                 base_value += lord_chance
-            if random() <= lord_chance:
+            if self.rng.random() <= lord_chance:
                 return elemental_types[1]
         return elemental_types[0]
 
@@ -47,12 +48,12 @@ class StormElemental(Elemental):
         self._defense_power = self.agility
 
     @property
-    def damage_modifiers(self) -> LimitedDict:
+    def damage_modifiers(self) -> DamageVector:
         '''Getter for Damage Modifiers'''
         return self._dam_modifiers
 
     @property
-    def defense_modifiers(self) -> LimitedDict:
+    def defense_modifiers(self) -> DamageVector:
         '''Getter for Defense Modifiers'''
         return self._def_modifiers
 
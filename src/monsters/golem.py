@@ -1,8 +1,7 @@
 '''Module for Dungeon Dudes Golem Monster'''
-from random import gauss
 from .monsters_abc import Monster
 from ..combat_action import CombatAction
-from ..dd_data import CombatPrint, LimitedDict, damage_types
+from ..dd_data import NullPrint, DamageVector, damage_types
 
 
 class Golem(Monster):
@@ -11,14 +10,14 @@ class Golem(Monster):
         self._gold = level_mod * 6
         self._experience_points = 10 * (20 * level_mod - 1)
         super().__init__(name, level_mod, "Golem", stat_structure)
-        self.printer = CombatPrint()
-        self._def_modifiers = LimitedDict(damage_types, default_value=100)
-        self._dam_modifiers = LimitedDict("Physical", default_value=100)
+        self.printer = NullPrint()
+        self._def_modifiers = DamageVector(damage_types, default_value=100)
+        self._dam_modifiers = DamageVector("Physical", default_value=100)
 
     def modify_damage(self, damage) -> int:
         '''Add variance to damage events'''
         std_deviation = damage * 0.03
-        modified = int(gauss(damage, std_deviation))
+        modified = int(self.rng.gauss(damage, std_deviation))
         return modified
 
     def attack(self) -> CombatAction:
@@ -1,9 +1,9 @@
 '''Metallic Golem Module for Dungeon Dudes'''
 from typing import Dict, Tuple
-from random import choice, choices
-from src.dd_data import LimitedDict
+from random import Random
+from src.dd_data import DamageVector
 from ..golem import Golem
-from ...dd_data import LimitedDict
+from ...dd_data import DamageVector
 from ...combat_action import CombatAction
 
 
@@ -17,14 +17,15 @@ class MetallicGolem(Golem):
     metal_types = [("Iron", "Physical"), ("Chromatic", "Physical"),
                    ("Mithril", "Physical")]
 
-    def __init__(self, level_mod: int):
+    def __init__(self, level_mod: int, rng: Random = None):
+        self.rng = rng
         if level_mod <= 10:
             comp = [("Iron", 0.75), ("Chromatic", 0.25)]
         else:
             comp = [("Iron", 0.55), ("Chromatic", 0.25), ("Mithril", 0.2)]
 
         metal_types, probabilities = zip(*comp)
-        metal_type = choices(metal_types, probabilities)[0]
+        metal_type = self.rng.choices(metal_types, probabilities)[0]
 
         if metal_type == "Mithril":
             self.stats_structure = {"Hit Points": (3, 0),
@@ -46,19 +47,19 @@ class MetallicGolem(Golem):
         super().__init__(f'{self._metal_type} Golem',
                          level_mod, self.stats_structure)
         self._sub_type: float = metal_type
-        self._dam_modifiers = LimitedDict("Physical", default_value=100)
+        self._dam_modifiers = DamageVector("Physical", default_value=100)
         self._prev_phys_dmg = 0 if self._metal_type == 'Iron' else None
         self._spiked_body_used = False
         self._exploded = False
         self._immune = False
 
     @property
-    def damage_modifiers(self) -> LimitedDict:
+    def damage_modifiers(self) -> DamageVector:
         '''Getter for damage modifiers'''
         return self._dam_modifiers
 
     @property
-    def defense_modifiers(self) -> LimitedDict:
+    def defense_modifiers(self) -> DamageVector:
         '''getter for defense modifiers'''
         return self._def_modifiers
 
@@ -95,7 +96,7 @@ class MetallicGolem(Golem):
         if not self._exploded:
             hp_percent: int = (self._hit_points / self.max_hit_points) * 100
             if hp_percent <= 50 or hp_percent <= 25:
-                if choice([True, False]):
+                if self.rng.choice([True, False]):
                     self.explode()
 
     # iron golem skills
@@ -158,7 +159,7 @@ class MetallicGolem(Golem):
                 dam = damage
 
         if self._metal_type == "Mithril":
-            if choice[True, False]:
+            if self.rng.choice[True, False]:
                 dam = 1
             self.immune = True
         return super().take_damage(dam, dmg_type, message)
@@ -190,5 +191,5 @@ class MetallicGolem(Golem):
                 weight = [0.25, 0.75]
             else:
                 weight = [0.75, 0.25]
-        selection = choices(options, weight)[0]
+        selection = self.rng.choices(options, weight)[0]
         return selection
@@ -1,9 +1,9 @@
 '''Stone Golem Module for Dungeon Dudes'''
 from typing import Dict, Tuple
-from random import choice, choices
-from src.dd_data import LimitedDict
+from random import Random
+from src.dd_data import DamageVector
 from ..golem import Golem
-from ...dd_data import LimitedDict
+from ...dd_data import DamageVector
 from ...combat_action import CombatAction
 
 
@@ -17,8 +17,9 @@ class StoneGolem(Golem):
     stone_types = [("Granite", "Physical"), ("Obsidian", "Physical")]
     weight = [0.75, 0.25]
 
-    def __init__(self, level_mod: int):
-        stone_type = choices(self.stone_types, self.weight, k=1)[0]
+    def __init__(self, level_mod: int, rng: Random = None):
+        self.rng = rng
+        stone_type = self.rng.choices(self.stone_types, self.weight, k=1)[0]
         self._stone_type = stone_type
         self._hit_points: int = self.stats_structure["Hit Points"][0]
         self._stone_type: str = stone_type[0]
@@ -26,7 +27,7 @@ class StoneGolem(Golem):
         super().__init__(f'{self._stone_type} Golem',
                          level_mod, self.stats_structure)
         self._sub_type: float = stone_type[1]
-        self._dam_modifiers = LimitedDict("Physical", default_value=100)
+        self._dam_modifiers = DamageVector("Physical", default_value=100)
         self.splintered = False
         self.absorbed_heat = False
         self.hardened = False
@@ -35,12 +36,12 @@ class StoneGolem(Golem):
         self.ignited = False
 
     @property
-    def damage_modifiers(self) -> LimitedDict:
+    def damage_modifiers(self) -> DamageVector:
         '''Getter for damage modifiers'''
         return self._dam_modifiers
 
     @property
-    def defense_modifiers(self) -> LimitedDict:
+    def defense_modifiers(self) -> DamageVector:
         '''getter for defense modifiers'''
         return self._def_modifiers
 
@@ -207,4 +208,4 @@ class StoneGolem(Golem):
         # if self._stone_type == "Obsidian":
         #     if self.level >= 15:
         #         options.append(self.thermal_core)
-        return choice(options)()
+        return self.rng.choice(options)()
@@ -1,9 +1,9 @@
 '''Treasure Golem Module for Dungeon Dudes'''
 from typing import Dict, Tuple
-from random import choice
-from src.dd_data import LimitedDict
+from random import Random
+from src.dd_data import DamageVector
 from ..golem import Golem
-from ...dd_data import LimitedDict
+from ...dd_data import DamageVector
 from ...combat_action import CombatAction
 
 
@@ -15,25 +15,26 @@ class TreasureGolem(Golem):
                                               "Intelligence": (0, 0),
                                               "Special": (0, 0)}
 
-    def __init__(self, level_mod: int):
+    def __init__(self, level_mod: int, rng: Random = None):
+        self.rng = rng
         self._hit_points: int = self.stats_structure["Hit Points"][0]
         super().__init__('Treasure Golem',
                          level_mod, self.stats_structure)
         self._sub_type: str = "Treasure Golem"
         self._gold = level_mod * 20
-        self._dam_modifiers = LimitedDict("Physical", default_value=100)
+        self._dam_modifiers = DamageVector("Physical", default_value=100)
         self._gem_rain_active = False
         self._gold_to_iron_flag = False
         self._next_attack_bonus = self._attack_power
         self._experience_points = 5 * (10 * (level_mod - 1))
 
     @property
-    def damage_modifiers(self) -> LimitedDict:
+    def damage_modifiers(self) -> DamageVector:
         '''Getter for damage modifiers'''
         return self._dam_modifiers
 
     @property
-    def defense_modifiers(self) -> LimitedDict:
+    def defense_modifiers(self) -> DamageVector:
         '''getter for defense modifiers'''
         return self._def_modifiers
 
@@ -52,7 +53,7 @@ class TreasureGolem(Golem):
 
     def special_skill(self) -> CombatAction:
         '''return special skill'''
-        skill = choice([self.molten_gold, self.gem_rain, self.gold_to_iron])
+        skill = self.rng.choice([self.molten_gold, self.gem_rain, self.gold_to_iron])
         return skill()
 
     def molten_gold(self, dmg_type):
@@ -127,4 +128,4 @@ class TreasureGolem(Golem):
             options.append(self.gem_rain)
         if self.level >= 10:
             options.append(self.gold_to_iron)
-        return choice(options)()
+        return self.rng.choice(options)()
@@ -1,10 +1,10 @@
 '''Bandit Module for Dungeon Dudes'''
 from typing import Dict, Tuple
-from random import randint, randrange, choices
+from random import Random
 
-from src.dd_data import LimitedDict
+from src.dd_data import DamageVector
 from ..humanoid import Humanoid
-from ...dd_data import LimitedDict
+from ...dd_data import DamageVector
 from ...combat_action import CombatAction
 
 
@@ -16,13 +16,14 @@ class Bandit(Humanoid):
                                               "Intelligence": (7, 1),
                                               "Special": (0, 0)}
 
-    def __init__(self, level_mod: int):
+    def __init__(self, level_mod: int, rng: Random = None):
+        self.rng = rng
         self._hit_points: int = self.stats_structure["Hit Points"][0]
         self._damage_type = "Physical"
         super().__init__("Pack of Bandits",
                          level_mod,
                          self.stats_structure)
-        self._dam_modifiers = LimitedDict(("Physical", "Fire"),
+        self._dam_modifiers = DamageVector(("Physical", "Fire"),
                                           default_value=100)
         self._num_bandits = 3
         if self.level > 7:
@@ -34,11 +35,11 @@ class Bandit(Humanoid):
             self._healing_potions += 1
 
     @property
-    def damage_modifiers(self) -> LimitedDict:
+    def damage_modifiers(self) -> DamageVector:
         return self._dam_modifiers
 
     @property
-    def defense_modifiers(self) -> LimitedDict:
+    def defense_modifiers(self) -> DamageVector:
         return self._def_modifiers
 
     @property
@@ -98,7 +99,7 @@ class Bandit(Humanoid):
         if self.level > 14:
             actions.append(self.bless)
 
-        index = randint(0, (len(actions) - 1))
+        index = self.rng.randint(0, (len(actions) - 1))
         option = actions.pop(index)
         return option()
 
@@ -129,20 +130,20 @@ class Bandit(Humanoid):
         action_list = []
 
         if self.hit_points < (self.max_hit_points / 2):
-            if randrange(2):
+            if self.rng.randrange(2):
                 self.healing_potion()
 
         option_list = [self.escape, self.turn_options]
         if self.hit_points <= int(self.max_hit_points * .10):
             if self.healing_potions:
                 option_list.append(self.healing_potion)
-                option = choices(option_list, weights=(25, 25, 50), k=1)
+                option = self.rng.choices(option_list, weights=(25, 25, 50), k=1)
                 if option.__name__ != "turn_options":
                     action_list.append(option())
                 else:
                     action_list = option()
             else:
-                option = choices(option_list, weights=(25, 75), k=1)
+                option = self.rng.choices(option_list, weights=(25, 75), k=1)
                 if option.__name__ != "turn_options":
                     action_list.append(option())
                 else:
@@ -1,8 +1,8 @@
 '''Murloc Module for Dungeon Dudes'''
 from typing import Dict, Tuple
-from random import randint
+from random import Random
 
-from src.dd_data import LimitedDict
+from src.dd_data import DamageVector
 from ..humanoid import Humanoid
 from ...combat_action import CombatAction
 
@@ -15,7 +15,8 @@ class Murloc(Humanoid):
                                               "Intelligence": (6, 2),
                                               "Special": (0, 0)}
 
-    def __init__(self, level_mod: int):
+    def __init__(self, level_mod: int, rng: Random = None):
+        self.rng = rng
 
         self._poisoned = False
         self._hit_points: int = self.stats_structure["Hit Points"][0]
@@ -23,7 +24,7 @@ class Murloc(Humanoid):
         super().__init__("Murloc Tribe",
                          level_mod,
                          self.stats_structure)
-        self._dam_modifiers = LimitedDict(("Physical",
+        self._dam_modifiers = DamageVector(("Physical",
                                            "Ice",
                                            "Poison",
                                            "Holy"), default_value=100)
@@ -90,7 +91,7 @@ class Murloc(Humanoid):
         poisoned. 30 percent chance of increased Poison damage.
         '''
         if self.poisoned:
-            if randint(0, 9) < 3:
+            if self.rng.randint(0, 9) < 3:
                 msg: str = "Murloc attacks, dealing <value> Poison damage"
                 self._base_attack = ("Attack",
                                      int(self.damage * 1.3),
@@ -140,7 +141,7 @@ class Murloc(Humanoid):
             actions.append(self.poisons)
         if self.level > 9:
             actions.append(self.holy_nova)
-        index = randint(0, (len(actions) - 1))
+        index = self.rng.randint(0, (len(actions) - 1))
         option = actions.pop(index)
         return option()
 
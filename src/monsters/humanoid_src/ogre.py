@@ -1,8 +1,8 @@
 '''Ogre Module for Dungeon Dudes'''
 from typing import Dict, Tuple
-from random import choice, randint
+from random import Random
 from ..humanoid import Humanoid
-from ...dd_data import LimitedDict
+from ...dd_data import DamageVector
 from ...combat_action import CombatAction
 
 
@@ -13,8 +13,9 @@ class Ogre(Humanoid):
                                               "Special": (0, 0)}
     ogre_types = [("Blood-Thirster", "Physical"), ("Ogre-Magi", "Physical")]
 
-    def __init__(self, level_mod: int):
-        ogre_type = choice(self.ogre_types)
+    def __init__(self, level_mod: int, rng: Random = None):
+        self.rng = rng
+        ogre_type = self.rng.choice(self.ogre_types)
         self._ogre_type: str = ogre_type[0]
         if self._ogre_type == "Blood-Thirster":
             self.stats_structure["Hit Points"] = (90, 22)
@@ -28,9 +29,9 @@ class Ogre(Humanoid):
                          level_mod,
                          self.stats_structure)
         self._sub_type: str = "Ogre"
-        # self._dam_modifiers = LimitedDict(("Physical", (self._damage_type)),
+        # self._dam_modifiers = DamageVector(("Physical", (self._damage_type)),
         #                                   default_value=100)
-        self._dam_modifiers = LimitedDict(
+        self._dam_modifiers = DamageVector(
             ("Physical", "Ice", "Lightning", "Fire"), default_value=100)
         self._two_minds = False
         self._damage = self.humanoid_damage(self.modify_damage(self.strength))
@@ -73,7 +74,7 @@ class Ogre(Humanoid):
         '''
         msg: str = ("Blood-Thirster Ogre performs a risky blow, dealing "
                     "<value> physical damage")
-        risky_chance = randint(0, 10)
+        risky_chance = self.rng.randint(0, 10)
         if risky_chance % 2 == 0:
             damage = int(2 * self.damage)
             return ("Attack", damage, "Physical", msg)
@@ -84,7 +85,7 @@ class Ogre(Humanoid):
         '''Return tuple for Wild Magics Attack.'''
         self._two_minds = True
         options = ["Lightning", "Ice", "Fire"]
-        damage_type = choice(options)
+        damage_type = self.rng.choice(options)
         damage_amt = self.intelligence
         msg: str = (f"{self.name} casts wild magics, dealing <value> "
                     f"{damage_type} damage and attacking again")
@@ -121,10 +122,10 @@ class Ogre(Humanoid):
         '''
         actions = []
         actions.append(self.risky_blow())
-        if randint(0, 100) < 25:
+        if self.rng.randint(0, 100) < 25:
             actions.append(self.frenzy())
             if self.level > 9:
-                if randint(0, 100) < 25:
+                if self.rng.randint(0, 100) < 25:
                     actions.append(self.improved_frenzy())
                 else:
                     self.printer("Blood-Thirster Ogre's Improved Frenzy was "
@@ -169,13 +170,13 @@ class Ogre(Humanoid):
             self.unspike_attacks()
         action_list = []
         if self.hit_points < int(self.max_hit_points / 2):
-            if randint(0, 100) < 75:
+            if self.rng.randint(0, 100) < 75:
                 if self.healing_potions:
                     self.healing_potion()
                     self.spike_attacks()
         if self.ogre_type == "Blood-Thirster":
             actions = [self.attack, self.blood_thirster_attack]
-            option = choice(actions)
+            option = self.rng.choice(actions)
             if option.__name__ == "attack":
                 action_list.append(option())
                 self._spiked_attack -= 1
@@ -184,7 +185,7 @@ class Ogre(Humanoid):
             return CombatAction(option(), "")
 
         actions = [self.attack, self.wild_magics]
-        option = choice(actions)
+        option = self.rng.choice(actions)
         if option.__name__ == "attack":
             action_list.append(option())
             if self.level > 4:
@@ -8,6 +8,8 @@ class Monster(Combatant):
 
     def __init__(self, name: str, level_mod : int, mon_type : str, stat_structure : dict):
         super().__init__(name, mon_type, stat_structure)
+        if type(self).level_up is Monster.level_up:
+            self.set_level(level_mod)
         while self._level < level_mod:
             self.level_up()
         self._experience_base : int = (20 * self._level) - 8
@@ -19,6 +21,20 @@ class Monster(Combatant):
         super().level_up()
         self.base_att_def_power()
 
+    def set_level(self, level: int):
+        '''
+        Raises the Monster straight to level in constant time
+        Only equivalent to repeated level_up calls for Monsters that do not
+        add per level effects in their own level_up
+        '''
+        levels: int = level - self._level
+        if levels <= 0:
+            return
+        self._stats.level_up(levels)
+        self._hit_points += self._stats.hp_growth * levels
+        self._level = level
+        self.base_att_def_power()
+
     @Combatant.experience_points.setter
     def experience_points(self):
         self._experience_points : int = self._experience_base
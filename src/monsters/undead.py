@@ -1,9 +1,8 @@
 '''Module for the Dungeon Dudes Beast Monster'''
-from random import randint
 from typing import Tuple
 from .monsters_abc import Monster
 from ..combat_action import CombatAction
-from ..dd_data import CombatPrint, LimitedDict, damage_types
+from ..dd_data import NullPrint, DamageVector, damage_types
 
 
 class Undead(Monster):
@@ -12,20 +11,19 @@ class Undead(Monster):
     def __init__(self, name: str, level_mod: int, stat_structure: dict):
         self.gold = level_mod * 4
         super().__init__(name, level_mod, "Undead", stat_structure)
-        self.printer = CombatPrint()
-        self._def_modifiers = LimitedDict(damage_types, default_value=100)
+        self.printer = NullPrint()
+        self._def_modifiers = DamageVector(damage_types, default_value=100)
         self._def_modifiers["Holy"] += 50
-        self._dam_modifiers = LimitedDict(("Physical", "Ice"),
+        self._dam_modifiers = DamageVector(("Physical", "Ice"),
                                           default_value=100)
         self._resist = True
         self._haunting = 0
 
-    @staticmethod
-    def modify_damage(damage) -> int:
+    def modify_damage(self, damage) -> int:
         '''Adds Variance to Damage Events and Calculates Critical Chance'''
         damage_min = int(damage * 0.01)
         damage_max = int(damage * 1.75)
-        modified: int = randint(damage_min, damage_max)
+        modified: int = self.rng.randint(damage_min, damage_max)
         return modified
 
     @property
@@ -43,6 +41,7 @@ class Undead(Monster):
 
     def resist_death(self, damage: int, message: str):
         '''First time an event would kill, reduce HP to 1'''
+        self.cheat_death()
         message = message.replace('<value>', str(damage))
         resist_message = f"Resist Death saves {self.name}! HP reset to 1."
         self.printer(message)
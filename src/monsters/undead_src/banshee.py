@@ -1,9 +1,9 @@
 '''Module for the Dungeon Dudes Banshee Undead'''
 from typing import Dict, Tuple
-from random import randint
-from src.dd_data import LimitedDict
+from random import Random
+from src.dd_data import DamageVector
 from ..undead import Undead
-from ...dd_data import LimitedDict
+from ...dd_data import DamageVector
 from ...combat_action import CombatAction
 
 
@@ -15,11 +15,12 @@ class Banshee(Undead):
                                                    "Intelligence": (16, 4),
                                                    "Special": (0, 0)}
 
-    def __init__(self, level_mod: int):
+    def __init__(self, level_mod: int, rng: Random = None):
+        self.rng = rng
         self._hit_points: int = self.stats_structure["Hit Points"][0]
         super().__init__('Banshee', level_mod, self.stats_structure)
         self._sub_type: str = "Banshee"
-        self._dam_modifiers = LimitedDict(("Ice"), default_value=100)
+        self._dam_modifiers = DamageVector(("Ice"), default_value=100)
         self._damage_event_counter = 5
         self._chilling_aura_counter = 10
         self._was_blizzard = False
@@ -29,12 +30,12 @@ class Banshee(Undead):
         self._defense_power = self.agility
 
     @property
-    def damage_modifiers(self) -> LimitedDict:
+    def damage_modifiers(self) -> DamageVector:
         '''Getter for Damage Modifiers'''
         return self._dam_modifiers
 
     @property
-    def defense_modifiers(self) -> LimitedDict:
+    def defense_modifiers(self) -> DamageVector:
         '''Getter for Defense Modifiers'''
         return self._def_modifiers
 
@@ -55,12 +56,12 @@ class Banshee(Undead):
             damage = 0
 
         if self.level < 15:
-            random_num = randint(1, 10)
+            random_num = self.rng.randint(1, 10)
             if random_num == 1:
                 self.printer("Banshee reduces damage to ZERO")
                 damage = 0
         else:
-            random_num = randint(1, 20)
+            random_num = self.rng.randint(1, 20)
             if random_num <= 3:
                 self.printer("Banshee reduces damage to ZERO")
 
@@ -1,9 +1,9 @@
 '''Module for the Dungeon Dudes Zombie Undead'''
 from typing import Dict, Tuple
-from random import randint
-from src.dd_data import LimitedDict
+from random import Random
+from src.dd_data import DamageVector
 from ..undead import Undead
-from ...dd_data import LimitedDict
+from ...dd_data import DamageVector
 from ...combat_action import CombatAction
 
 
@@ -16,7 +16,8 @@ class Vampire(Undead):
                                                    "Special": (0, 0)}
     vampire_types = ["Vampire", "Elder Vampire"]
 
-    def __init__(self, level_mod: int):
+    def __init__(self, level_mod: int, rng: Random = None):
+        self.rng = rng
         vampire_type: str = "Vampire"
         self._hit_points: int = self.stats_structure["Hit Points"][0]
         self._vampire_type: str = vampire_type
@@ -35,12 +36,12 @@ class Vampire(Undead):
         self._defense_power = self.agility
 
     @property
-    def damage_modifiers(self) -> LimitedDict:
+    def damage_modifiers(self) -> DamageVector:
         '''Getter for Damage Modifiers'''
         return self._dam_modifiers
 
     @property
-    def defense_modifiers(self) -> LimitedDict:
+    def defense_modifiers(self) -> DamageVector:
         '''Getter for Defense Modifiers'''
         return self._def_modifiers
 
@@ -204,7 +205,7 @@ class Vampire(Undead):
                 self._mist_counter += 1
                 return CombatAction([("Attack", damage, "Ice", msg)], "")
 
-        rand_num = randint(1, 10)
+        rand_num = self.rng.randint(1, 10)
         if rand_num <= 7:
             option = self.icy_touch
         else:
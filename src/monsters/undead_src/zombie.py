@@ -1,7 +1,8 @@
 '''Module for the Dungeon Dudes Zombie Undead'''
+from random import Random
 from typing import Dict, List, Tuple
 from ..undead import Undead
-from ...dd_data import LimitedDict
+from ...dd_data import DamageVector
 from ...combat_action import CombatAction
 
 
@@ -13,23 +14,24 @@ class Zombie(Undead):
                                                    "Intelligence": (0, 0),
                                                    "Special": (4, 0)}
 
-    def __init__(self, level_mod: int):
+    def __init__(self, level_mod: int, rng: Random = None):
+        self.rng = rng
         self._hit_points: int = self.stats_structure["Hit Points"][0]
         super().__init__('Zombie', level_mod, self.stats_structure)
         self._hit_points += self.update_max_hp()
         self._sub_type: str = "Zombie"
-        self._dam_modifiers = LimitedDict(("Physical", "Poison"),
+        self._dam_modifiers = DamageVector(("Physical", "Poison"),
                                           default_value=100)
         self._haunting = 0
         self._horde_size = 6
 
     @property
-    def damage_modifiers(self) -> LimitedDict:
+    def damage_modifiers(self) -> DamageVector:
         '''Getter for Damage Modifiers'''
         return self._dam_modifiers
 
     @property
-    def defense_modifiers(self) -> LimitedDict:
+    def defense_modifiers(self) -> DamageVector:
         '''Getter for Defense Modifiers'''
         return self._def_modifiers
 
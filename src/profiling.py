@@ -0,0 +1,114 @@
+'''
+Hot Path Profiling Counters for Dungeon Dudes
+Set DD_PROFILE=1, or run dungeon_dudes.py with --profile, to count calls and
+add up wall time for the hot paths: modifiers, attacks, every take_damage and
+take_turn, combat printing, encounter panes, item generation and saving.
+
+The switch is read once, when src is first imported.  While it is off,
+profiled returns the function it was given and profile_methods does nothing,
+so there are no wrappers and the hot paths run as plain calls.
+
+Counts go to the Counters bound to the current thread, so each server session
+sees its own, and to the process wide totals.
+'''
+import os
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Optional
+
+ENABLED : bool = os.environ.get("DD_PROFILE", "") not in ("", "0")
+
+class Counters:
+    '''Calls and Seconds per Profiled Name'''
+    def __init__(self):
+        self._calls : Dict[str, int] = {}
+        self._seconds : Dict[str, float] = {}
+
+    def add(self, name : str, seconds : float):
+        '''Records one Call of name'''
+        self._calls[name] = self._calls.get(name, 0) + 1
+        self._seconds[name] = self._seconds.get(name, 0.0) + seconds
+
+    def calls(self, name : str) -> int:
+        '''Number of Calls Recorded for name'''
+        return self._calls.get(name, 0)
+
+    def seconds(self, name : str) -> float:
+        '''Wall Time Recorded for name, Calls made inside it Included'''
+        return self._seconds.get(name, 0.0)
+
+    @property
+    def names(self) -> List[str]:
+        '''Profiled Names, Most Time First'''
+        return sorted(self._calls, key=self.seconds, reverse=True)
+
+    def clear(self):
+        '''Forgets Everything Recorded'''
+        self._calls.clear()
+        self._seconds.clear()
+
+    def report(self, title : str = "Profile") -> str:
+        '''Table of Calls, Total and Mean Time per Name'''
+        lines : List[str] = [f"{title:50}{'calls':>10}{'total ms':>12}{'mean us':>12}"]
+        for name in self.names:
+            calls : int = self._calls[name]
+            seconds : float = self._seconds[name]
+            lines.append(f"{name[:50]:50}{calls:>10}{seconds * 1000:>12.1f}"
+                         f"{seconds / calls * 1e6:>12.1f}")
+        return "\n".join(lines)
+
+totals : Counters = Counters()
+_totals_lock : threading.Lock = threading.Lock()
+_bound : threading.local = threading.local()
+
+def current() -> Optional[Counters]:
+    '''Counters Bound to this Thread, if any'''
+    return getattr(_bound, "counters", None)
+
+@contextmanager
+def session_counters(counters : Counters = None) -> Iterator[Counters]:
+    '''Binds Counters to the Current Thread for a with Block'''
+    counters = counters if counters is not None else Counters()
+    previous : Optional[Counters] = current()
+    _bound.counters = counters
+    try:
+        yield counters
+    finally:
+        _bound.counters = previous
+
+def timed(name : str, function : Callable) -> Callable:
+    '''Wraps function to Record its Calls under name'''
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start : float = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed : float = perf_counter() - start
+            with _totals_lock:
+                totals.add(name, elapsed)
+            counters : Optional[Counters] = getattr(_bound, "counters", None)
+            if counters is not None:
+                counters.add(name, elapsed)
+    return wrapper
+
+def profiled(function : Callable = None, *, name : str = None):
+    '''Decorator Counting a Hot Path, the Function itself when Profiling is Off'''
+    def decorate(function : Callable) -> Callable:
+        if not ENABLED:
+            return function
+        return timed(name or function.__qualname__, function)
+    if function is not None:
+        return decorate(function)
+    return decorate
+
+def profile_methods(cls : type, *method_names : str):
+    '''Counts the Methods cls Defines itself, for __init_subclass__ Hooks'''
+    if not ENABLED:
+        return
+    for method_name in method_names:
+        method = cls.__dict__.get(method_name)
+        if callable(method):
+            setattr(cls, method_name, timed(f"{cls.__name__}.{method_name}", method))
@@ -0,0 +1,207 @@
+'''
+Slot Based Save Store for Dungeon Dudes
+Every save slot is its own character_codec file, and a small JSON index records the
+name, level, class and battles won of each slot so the menus can list saves
+without unpickling any characters
+'''
+import json
+import os
+import pickle
+import threading
+from typing import Dict, NamedTuple, Optional
+from .characters import Character
+from .character_codec import (encode_character, decode_character, is_encoded, upgrade_legacy,
+                              SaveFormatError)
+from .dd_data import LimitedDict
+
+SAVE_SLOTS : tuple = ("autosave", "save_1", "save_2", "save_3")
+SAVE_DIRECTORY : str = "src/dd_data/saves"
+LEGACY_FILE : str = "src/dd_data/saved_games.pkl"
+INDEX_FILE : str = "index.json"
+
+class SlotInfo(NamedTuple):
+    '''Summary of a Saved Character shown in the Save and Load Menus'''
+    name : str
+    level : int
+    char_class : str
+    battles_won : int
+
+    @classmethod
+    def from_character(cls, character : Character) -> 'SlotInfo':
+        '''Summarises a Character for the Index'''
+        return cls(character.name, character.level,
+                   character.char_class, character.battles_won)
+
+class SaveStore:
+    '''Per Slot Save Files with a Metadata Index'''
+    def __init__(self, directory : str = SAVE_DIRECTORY,
+                 legacy_file : str = LEGACY_FILE):
+        self._directory : str = directory
+        self._legacy_file : str = legacy_file
+        self._lock : threading.RLock = threading.RLock()
+        self._legacy_errors : Dict[str, str] = {}
+
+    @property
+    def directory(self) -> str:
+        '''Directory holding the Slot Files and Index'''
+        return self._directory
+
+    @property
+    def legacy_errors(self) -> Dict[str, str]:
+        '''Slots whose Legacy Save could not be Migrated, and Why'''
+        return dict(self._legacy_errors)
+
+    @property
+    def index_path(self) -> str:
+        '''Path to the Metadata Index'''
+        return os.path.join(self._directory, INDEX_FILE)
+
+    def slot_path(self, slot : str) -> str:
+        '''Path to the Save File for a Slot'''
+        self.check_slot(slot)
+        return os.path.join(self._directory, f"{slot}.sav")
+
+    def pickle_slot_path(self, slot : str) -> str:
+        '''Path a Slot was Pickled to before the Versioned Format'''
+        self.check_slot(slot)
+        return os.path.join(self._directory, f"{slot}.pkl")
+
+    @staticmethod
+    def check_slot(slot : str):
+        '''Raises KeyError for Unknown Slots, as the old LimitedDict did'''
+        if slot not in SAVE_SLOTS:
+            raise KeyError(f"Key {slot} is not allowed. "
+                           f"Allowed keys are: {', '.join(SAVE_SLOTS)}")
+
+    def read_index(self) -> Dict[str, Optional[SlotInfo]]:
+        '''Reads the Index, Building it (and Migrating Old Saves) if Missing'''
+        if not os.path.exists(self.index_path):
+            return self.rebuild_index()
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as file:
+                raw_index : dict = json.load(file)
+            return {slot: SlotInfo(*raw_index[slot]) if raw_index.get(slot) else None
+                    for slot in SAVE_SLOTS}
+        except (OSError, ValueError, TypeError):
+            return self.rebuild_index()
+
+    def write_index(self, index : Dict[str, Optional[SlotInfo]]):
+        '''Writes the Index'''
+        data : bytes = json.dumps({slot: list(info) if info else None
+                                   for slot, info in index.items()}).encode("utf-8")
+        self.write_file(self.index_path, data)
+
+    def rebuild_index(self) -> Dict[str, Optional[SlotInfo]]:
+        '''Recreates the Index from the Slot Files on Disk'''
+        os.makedirs(self._directory, exist_ok=True)
+        self.migrate_legacy()
+        index : Dict[str, Optional[SlotInfo]] = {}
+        for slot in SAVE_SLOTS:
+            character : Optional[Character] = self.load(slot)
+            index[slot] = SlotInfo.from_character(character) if character else None
+        self.write_index(index)
+        return index
+
+    def migrate_legacy(self):
+        '''
+        Splits the old single file of saves into Slot Files, once
+        Characters pickled by the old saves are upgraded to the current layout;
+        entries that can't be are skipped and reported in legacy_errors
+        '''
+        if not os.path.exists(self._legacy_file):
+            return
+        try:
+            with open(self._legacy_file, "rb") as file:
+                saved_games = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError,
+                IndexError, KeyError, TypeError, ValueError) as error:
+            self._legacy_errors = {slot: f"Unreadable {os.path.basename(self._legacy_file)}: "
+                                         f"{type(error).__name__}" for slot in SAVE_SLOTS
+                                   if not os.path.exists(self.slot_path(slot))}
+            return
+        if not isinstance(saved_games, LimitedDict):
+            return
+        for slot in SAVE_SLOTS:
+            character = saved_games[slot]
+            if isinstance(character, Character) and not os.path.exists(self.slot_path(slot)):
+                try:
+                    data : bytes = encode_character(upgrade_legacy(character))
+                except Exception as error:  # pylint: disable=broad-except
+                    self._legacy_errors[slot] = (f"Legacy save of {character.name} could not "
+                                                 f"be migrated: {type(error).__name__}")
+                    continue
+                self.write_file(self.slot_path(slot), data)
+
+    def slots(self) -> LimitedDict:
+        '''Slot Summaries for the Menus, EMPTY for Unused Slots or Why Migrating them Failed'''
+        summaries : LimitedDict = LimitedDict(SAVE_SLOTS)
+        with self._lock:
+            index : Dict[str, Optional[SlotInfo]] = self.read_index()
+        for slot, info in index.items():
+            if info is not None:
+                summaries[slot] = info
+            elif slot in self._legacy_errors:
+                summaries[slot] = self._legacy_errors[slot]
+        return summaries
+
+    def save(self, slot : str, character : Character):
+        '''Writes one Slot and its Index Entry, leaving other Slots untouched'''
+        self.check_slot(slot)
+        self.save_snapshot(slot, encode_character(character), SlotInfo.from_character(character))
+
+    def save_snapshot(self, slot : str, data : bytes, info : SlotInfo):
+        '''Writes an already Encoded Character to a Slot'''
+        path : str = self.slot_path(slot)
+        with self._lock:
+            index : Dict[str, Optional[SlotInfo]] = self.read_index()
+            self.write_file(path, data)
+            index[slot] = info
+            self.write_index(index)
+
+    def load(self, slot : str) -> Optional[Character]:
+        '''Decodes the Character in a Slot, None if Empty or Invalid'''
+        path : str = self.slot_path(slot)
+        if not os.path.exists(path):
+            path = self.pickle_slot_path(slot)
+            if not os.path.exists(path):
+                return None
+        try:
+            with open(path, "rb") as file:
+                data : bytes = file.read()
+            if is_encoded(data):
+                character = decode_character(data)
+            else:
+                character = pickle.loads(data)
+        except (OSError, SaveFormatError, pickle.UnpicklingError, EOFError, AttributeError,
+                KeyError, IndexError, TypeError):
+            return None
+        return character if isinstance(character, Character) else None
+
+    def write_file(self, path : str, data : bytes):
+        '''
+        Writes data to a temp file beside path, syncs it and renames it over path,
+        so an interrupt or full disk leaves the previous save in place
+        '''
+        os.makedirs(self._directory, exist_ok=True)
+        temp_path : str = f"{path}.tmp"
+        try:
+            with open(temp_path, "wb") as file:
+                file.write(data)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self.sync_directory()
+
+    def sync_directory(self):
+        '''Syncs the Directory Entry so the Rename itself is Durable'''
+        if os.name != "posix":
+            return
+        directory_fd : int = os.open(self._directory, os.O_RDONLY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
@@ -0,0 +1,96 @@
+'''
+Background Save Writer for Dungeon Dudes
+Characters are encoded on the calling thread, so the snapshot is consistent,
+and written by a worker thread, so autosaves never hold up the next prompt
+'''
+import threading
+from typing import Dict, Optional, Tuple
+from .characters import Character
+from .character_codec import encode_character
+from .save_store import SaveStore, SlotInfo
+
+class SaveWriter:
+    '''Queues Character Snapshots and Writes them off the Input Path'''
+    def __init__(self, store : SaveStore):
+        self._store : SaveStore = store
+        self._pending : Dict[str, Tuple[bytes, SlotInfo]] = {}
+        self._condition : threading.Condition = threading.Condition()
+        self._worker : Optional[threading.Thread] = None
+        self._writing : bool = False
+        self._error : Optional[Exception] = None
+
+    @property
+    def store(self) -> SaveStore:
+        '''Save Store the Writer Writes to'''
+        return self._store
+
+    @staticmethod
+    def snapshot(character : Character) -> Tuple[bytes, SlotInfo]:
+        '''Encodes a Character and its Index Entry'''
+        return encode_character(character), SlotInfo.from_character(character)
+
+    def submit(self, slot : str, character : Character):
+        '''Snapshots a Character and Queues it, a newer Snapshot replaces a Queued one'''
+        self._store.check_slot(slot)
+        data, info = self.snapshot(character)
+        with self._condition:
+            self._pending[slot] = (data, info)
+            if self._worker is None:
+                # Not a daemon, so a pending save still reaches disk if the game exits
+                self._worker = threading.Thread(target=self._run, name="save-writer")
+                self._worker.start()
+
+    def flush(self, timeout : float = None) -> Optional[Exception]:
+        '''
+        Waits for Queued Saves, returns the Error of a Failed Write if any,
+        or a TimeoutError if Saves are still Queued after timeout Seconds
+        '''
+        with self._condition:
+            if not self._condition.wait_for(lambda: not self._pending and not self._writing,
+                                            timeout):
+                return TimeoutError(f"{len(self._pending) + self._writing} save(s) "
+                                    f"still pending after {timeout} seconds")
+            error, self._error = self._error, None
+            return error
+
+    @property
+    def busy(self) -> bool:
+        '''True while Saves are Queued or Being Written'''
+        with self._condition:
+            return bool(self._pending) or self._writing
+
+    def _run(self):
+        '''
+        Worker Loop, exits once the Queue is Empty
+        The worker is cleared under the same lock that finds the queue empty, so
+        a submit either lands before that check or starts a new worker.  Any
+        error a write raises is kept for flush and the loop moves on to the
+        next slot; if the loop itself dies the worker is cleared so waiting
+        flushes wake and the next submit starts a new one
+        '''
+        try:
+            while True:
+                with self._condition:
+                    if not self._pending:
+                        self._worker = None
+                        self._condition.notify_all()
+                        return
+                    slot : str = next(iter(self._pending))
+                    data, info = self._pending.pop(slot)
+                    self._writing = True
+                try:
+                    self._store.save_snapshot(slot, data, info)
+                except Exception as error:  # pylint: disable=broad-except
+                    with self._condition:
+                        self._error = error
+                finally:
+                    with self._condition:
+                        self._writing = False
+                        self._condition.notify_all()
+        except BaseException:
+            with self._condition:
+                if self._worker is threading.current_thread():
+                    self._worker = None
+                self._writing = False
+                self._condition.notify_all()
+            raise
@@ -0,0 +1,169 @@
+'''
+In Process Screen Control for Dungeon Dudes
+Emits terminal escape sequences directly instead of spawning a shell to clear,
+and buffers each frame so it reaches the terminal as one write and flush.
+On Windows the console is switched to virtual terminal mode so it understands
+the same sequences; a legacy console that refuses falls back to cls.
+'''
+import io
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, TextIO
+from .console import redirect_output
+
+CLEAR_SCREEN : str = "\033[H\033[2J"
+ENABLE_VIRTUAL_TERMINAL_PROCESSING : int = 0x0004
+STD_OUTPUT_HANDLE : int = -11
+
+def enable_virtual_terminal() -> bool:
+    '''Turns on ANSI processing for the Windows console, True if the console understands it'''
+    if os.name != "nt":
+        return True
+    try:
+        import ctypes # pylint: disable=import-outside-toplevel
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(STD_OUTPUT_HANDLE)
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(
+            handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING))
+    except (AttributeError, ImportError, OSError):
+        return False
+
+ANSI_CONSOLE : bool = enable_virtual_terminal()
+
+class Screen:
+    '''Buffered Terminal Output'''
+    def __init__(self, stream : TextIO = None, rows : Optional[int] = None):
+        self._stream : TextIO = stream
+        self._rows : Optional[int] = rows
+        self._pending : List[str] = []
+
+    @property
+    def stream(self) -> TextIO:
+        '''Output Stream, looked up at write time so redirected stdout is honoured'''
+        return self._stream if self._stream is not None else sys.stdout
+
+    @property
+    def ansi(self) -> bool:
+        '''False only for a legacy Windows console that refused virtual terminal mode'''
+        return ANSI_CONSOLE or self.stream is not sys.__stdout__
+
+    @property
+    def rows(self) -> Optional[int]:
+        '''
+        Height of the Terminal the Stream draws to, as given or read from the
+        Stream's own terminal; None when unknown, such as for a remote session
+        '''
+        if self._rows is not None:
+            return self._rows
+        try:
+            return os.get_terminal_size(self.stream.fileno()).lines
+        except (AttributeError, ValueError, OSError, io.UnsupportedOperation):
+            return None
+
+    def isatty(self) -> bool:
+        '''True if the Stream is a Terminal that understands Cursor Addressing'''
+        isatty = getattr(self.stream, "isatty", None)
+        return bool(self.ansi and isatty and isatty())
+
+    def write(self, text : str):
+        '''Buffers text until the next flush'''
+        self._pending.append(text)
+
+    def flush(self):
+        '''Sends everything buffered as a single write'''
+        if self._pending:
+            stream : TextIO = self.stream
+            stream.write("".join(self._pending))
+            stream.flush()
+            self._pending.clear()
+
+    def clear(self):
+        '''Clears the Screen and moves the Cursor Home'''
+        self.write(self.clear_prefix())
+        self.flush()
+
+    def clear_prefix(self) -> str:
+        '''
+        Text that clears the Screen when written first in a frame; a legacy
+        console is cleared with cls right away and gets an empty prefix
+        '''
+        if self.ansi:
+            return CLEAR_SCREEN
+        self.flush()
+        os.system("cls")
+        return ""
+
+    @contextmanager
+    def frame(self, clear : bool = True) -> Iterator['Screen']:
+        '''
+        Collects everything printed inside the block, optionally after
+        clearing the screen, and flushes it as one frame on exit
+        '''
+        buffer = io.StringIO()
+        if clear:
+            buffer.write(self.clear_prefix())
+        try:
+            with redirect_output(buffer):
+                yield self
+        finally:
+            self.write(buffer.getvalue())
+            self.flush()
+
+
+class NullScreen(Screen):
+    '''Screen Sink for Tests and Simulations, all output is discarded'''
+    @property
+    def rows(self) -> Optional[int]:
+        '''
+        Height of the Terminal the Stream draws to, as given or read from the
+        Stream's own terminal; None when unknown, such as for a remote session
+        '''
+        if self._rows is not None:
+            return self._rows
+        try:
+            return os.get_terminal_size(self.stream.fileno()).lines
+        except (AttributeError, ValueError, OSError, io.UnsupportedOperation):
+            return None
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, text : str):
+        '''Discards text'''
+
+    def flush(self):
+        '''Nothing is Buffered'''
+
+    def clear_prefix(self) -> str:
+        '''Nothing is Cleared'''
+        return ""
+
+
+_active_screen : Screen = Screen()
+_session_screen = threading.local()
+
+def get_screen() -> Screen:
+    '''Returns the Screen all Menus and Combat Panes draw to, per session if one is bound'''
+    screen : Optional[Screen] = getattr(_session_screen, "screen", None)
+    return screen if screen is not None else _active_screen
+
+def set_screen(screen : Screen) -> Screen:
+    '''Swaps the active Screen, Returns the previous one so it can be restored'''
+    global _active_screen # pylint: disable=global-statement
+    previous, _active_screen = _active_screen, screen
+    return previous
+
+@contextmanager
+def session_screen(screen : Screen) -> Iterator[Screen]:
+    '''Gives the Calling Thread its own Screen, as each server session has'''
+    previous : Optional[Screen] = getattr(_session_screen, "screen", None)
+    _session_screen.screen = screen
+    try:
+        yield screen
+    finally:
+        _session_screen.screen = previous
@@ -0,0 +1,316 @@
+'''
+Multi Session Game Server for Dungeon Dudes
+One asyncio event loop accepts TCP connections speaking a plain line protocol:
+every line the client sends is one line of input, and everything the game
+prints is sent back.  Each connection gets its own Adventure, CombatPrint
+sink, Screen and menu scheduler.  The menus block on input(), so every session runs
+them in a light worker thread whose console is routed to its connection,
+while the event loop does all socket I/O.
+
+A session starts by asking for a player name.  Each player's save slots are
+kept in their own directory under save_directory, with their own SaveWriter,
+so one player's autosave never lands in another's slots; a name can only be
+playing in one session at a time.  A player who disconnects is autosaved
+under the same rules as a local Ctrl+C.
+
+Output is queued on the event loop; after every OUTPUT_HIGH_WATER bytes the
+session thread waits for the connection to drain, so a stalled client holds
+up only its own session, and one that stays stalled for DRAIN_TIMEOUT
+seconds is disconnected.
+'''
+import asyncio
+import concurrent.futures
+import io
+import os
+import queue
+import re
+import threading
+from typing import Callable, Optional, Set
+from . import console
+from .screen import Screen, session_screen
+from .dd_data import CombatPrint
+from .adventure import Adventure
+from .menus import MainMenu
+from .save_store import SaveStore
+from .save_writer import SaveWriter
+from . import profiling
+
+DEFAULT_HOST : str = "127.0.0.1"
+DEFAULT_PORT : int = 4040
+PLAYER_DIRECTORY : str = "src/dd_data/players"
+PLAYER_NAME : re.Pattern = re.compile(r"[A-Za-z0-9_-]{1,24}")
+OUTPUT_HIGH_WATER : int = 64 * 1024
+DRAIN_TIMEOUT : float = 30.0
+
+class SessionClosed(SystemExit):
+    '''Raised in a Session Thread waiting for Input after its Client left'''
+
+class SessionInput(io.TextIOBase):
+    '''Lines from the Client, readline blocks the Session Thread until one Arrives'''
+    def __init__(self):
+        super().__init__()
+        self._lines : queue.Queue = queue.Queue()
+
+    def feed(self, line : Optional[str]):
+        '''Queues a Line, None Closes the Session'''
+        self._lines.put(line)
+
+    def readline(self, size : int = -1) -> str: # pylint: disable=unused-argument
+        line : Optional[str] = self._lines.get()
+        if line is None:
+            self._lines.put(None)
+            raise SessionClosed()
+        return line + "\n"
+
+    def readable(self) -> bool:
+        return True
+
+class SessionOutput(io.TextIOBase):
+    '''Hands Text from the Session Thread to the Event Loop for Sending'''
+    def __init__(self, loop : asyncio.AbstractEventLoop, writer : asyncio.StreamWriter,
+                 high_water : int = OUTPUT_HIGH_WATER, drain_timeout : float = DRAIN_TIMEOUT):
+        super().__init__()
+        self._loop : asyncio.AbstractEventLoop = loop
+        self._writer : asyncio.StreamWriter = writer
+        self._high_water : int = high_water
+        self._drain_timeout : float = drain_timeout
+        self._unsent : int = 0
+
+    def write(self, text : str) -> int:
+        data : bytes = text.replace("\n", "\r\n").encode("utf-8")
+        try:
+            self._loop.call_soon_threadsafe(self._send, data)
+        except RuntimeError:
+            return len(text) # the loop has stopped, the client is gone
+        self._unsent += len(data)
+        if self._unsent >= self._high_water:
+            self._unsent = 0
+            self.wait_for_drain()
+        return len(text)
+
+    def wait_for_drain(self):
+        '''Blocks the Session Thread until the Connection's Send Buffer has Drained'''
+        try:
+            drained = asyncio.run_coroutine_threadsafe(self._drain(), self._loop)
+        except RuntimeError:
+            return # the loop has stopped, the client is gone
+        try:
+            drained.result(self._drain_timeout)
+        except (ConnectionError, concurrent.futures.TimeoutError,
+                concurrent.futures.CancelledError) as error:
+            drained.cancel()
+            # A stalled client would hold a graceful close open, so drop the connection
+            self._loop.call_soon_threadsafe(self._writer.transport.abort)
+            raise SessionClosed() from error
+
+    def _send(self, data : bytes):
+        '''Runs on the Event Loop'''
+        if not self._writer.is_closing():
+            self._writer.write(data)
+
+    async def _drain(self):
+        '''Runs on the Event Loop, after every Send Queued before it'''
+        if not self._writer.is_closing():
+            await self._writer.drain()
+
+    def isatty(self) -> bool:
+        '''Clients are Terminals (telnet, nc), so Panes redraw only Changed Lines'''
+        return True
+
+    def writable(self) -> bool:
+        return True
+
+class GameSession:
+    '''One Connected Player: their Adventure and the Thread Running its Menus'''
+    def __init__(self, session_id : int, loop : asyncio.AbstractEventLoop,
+                 writer : asyncio.StreamWriter, save_directory : str = PLAYER_DIRECTORY,
+                 claim_player : Callable[[str], bool] = None,
+                 release_player : Callable[[str], None] = None):
+        self._id : int = session_id
+        self._save_directory : str = save_directory
+        self._claim_player : Callable[[str], bool] = claim_player or (lambda player: True)
+        self._release_player : Callable[[str], None] = release_player or (lambda player: None)
+        self.player : Optional[str] = None
+        self._loop : asyncio.AbstractEventLoop = loop
+        self._writer : asyncio.StreamWriter = writer
+        self._input : SessionInput = SessionInput()
+        self._output : SessionOutput = SessionOutput(loop, writer)
+        self._thread : threading.Thread = threading.Thread(
+            target=self.run, name=f"session-{session_id}", daemon=True)
+        self.adventure : Optional[Adventure] = None
+        self.counters : profiling.Counters = profiling.Counters()
+
+    @property
+    def session_id(self) -> int:
+        '''Number of the Connection'''
+        return self._id
+
+    @property
+    def finished(self) -> bool:
+        '''True once the Game has Ended for this Player'''
+        return not self._thread.is_alive()
+
+    def start(self):
+        '''Starts the Session Thread'''
+        self._thread.start()
+
+    def feed(self, line : str):
+        '''Passes a Line the Client Sent to the Game'''
+        self._input.feed(line)
+
+    def close(self):
+        '''Ends the Game at its Next Prompt'''
+        self._input.feed(None)
+
+    def join(self, timeout : float = None):
+        '''Waits for the Session Thread'''
+        self._thread.join(timeout)
+
+    def ask_player(self) -> str:
+        '''Prompts until the Client Names a Player not Playing Elsewhere'''
+        while True:
+            player : str = input("Player Name > ").strip()
+            if not PLAYER_NAME.fullmatch(player):
+                print("Use up to 24 letters, digits, - or _")
+            elif self._claim_player(player):
+                return player
+            else:
+                print(f"{player} is already playing")
+
+    def save_on_disconnect(self):
+        '''
+        Autosaves the Character as a local Ctrl+C does: fleeing a fight
+        spends a Scroll of Escape, and without one the Character dies
+        unsaved
+        '''
+        character = self.adventure.character
+        if character is None:
+            return
+        if self.adventure.active_encounter:
+            if character.scroll_of_escape <= 0:
+                return
+            character.scroll_of_escape -= 1
+        self.adventure.saves.submit("autosave", character)
+
+    def player_saves(self, player : str) -> SaveWriter:
+        '''A Writer over the Player's own Save Directory'''
+        directory : str = os.path.join(self._save_directory, player.lower())
+        return SaveWriter(SaveStore(directory, os.path.join(directory, "saved_games.pkl")))
+
+    def run(self):
+        '''Session Thread: Runs the Menus on this Session's Console and Screen'''
+        try:
+            with console.bind(self._input, self._output), \
+                 session_screen(Screen(self._output)) as screen, \
+                 profiling.session_counters(self.counters):
+                self.player = self.ask_player()
+                self.adventure = Adventure(printer=CombatPrint(screen=screen),
+                                           saves=self.player_saves(self.player))
+                self.adventure.scheduler.run(MainMenu(self.adventure))
+        except SystemExit:
+            pass
+        finally:
+            if self.adventure is not None:
+                self.save_on_disconnect()
+                self.adventure.saves.flush()
+            if self.player is not None:
+                self._release_player(self.player)
+            if profiling.ENABLED:
+                print(self.counters.report(f"Session {self._id}"))
+            try:
+                self._loop.call_soon_threadsafe(self._writer.close)
+            except RuntimeError:
+                pass
+
+class GameServer:
+    '''Hosts Many Concurrent Adventures on one Event Loop'''
+    def __init__(self, host : str = DEFAULT_HOST, port : int = DEFAULT_PORT,
+                 max_sessions : int = 500, save_directory : str = PLAYER_DIRECTORY):
+        self._host : str = host
+        self._port : int = port
+        self._max_sessions : int = max_sessions
+        self._save_directory : str = save_directory
+        self._players : Set[str] = set()
+        self._players_lock : threading.Lock = threading.Lock()
+        self._sessions : Set[GameSession] = set()
+        self._next_id : int = 0
+        self._server : Optional[asyncio.AbstractServer] = None
+
+    @property
+    def sessions(self) -> Set[GameSession]:
+        '''Sessions Currently Connected'''
+        return self._sessions
+
+    def claim_player(self, player : str) -> bool:
+        '''Marks a Player as Playing, False if they Already are'''
+        with self._players_lock:
+            if player.lower() in self._players:
+                return False
+            self._players.add(player.lower())
+            return True
+
+    def release_player(self, player : str):
+        '''Frees a Player Name once their Session Ends'''
+        with self._players_lock:
+            self._players.discard(player.lower())
+
+    @property
+    def port(self) -> int:
+        '''Port Listened on, the Assigned one if 0 was Requested'''
+        if self._server is not None and self._server.sockets:
+            return self._server.sockets[0].getsockname()[1]
+        return self._port
+
+    async def start(self):
+        '''Starts Listening, routing every Thread's Console through its Session'''
+        console.install()
+        self._server = await asyncio.start_server(self.handle_client, self._host, self._port)
+
+    async def serve_forever(self):
+        '''Starts the Server and Runs until Cancelled'''
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        '''Stops Listening and Ends Every Session'''
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for session in list(self._sessions):
+            session.close()
+
+    async def handle_client(self, reader : asyncio.StreamReader,
+                            writer : asyncio.StreamWriter):
+        '''Feeds one Connection's Lines to its Session until either Side Ends'''
+        if len(self._sessions) >= self._max_sessions:
+            writer.write(b"Server full, try again soon\r\n")
+            writer.close()
+            return
+        self._next_id += 1
+        session = GameSession(self._next_id, asyncio.get_running_loop(), writer,
+                              self._save_directory, self.claim_player, self.release_player)
+        self._sessions.add(session)
+        session.start()
+        try:
+            while not session.finished:
+                data : bytes = await reader.readline()
+                if not data:
+                    break
+                session.feed(data.decode("utf-8", "replace").rstrip("\r\n"))
+        except ConnectionError:
+            pass
+        finally:
+            session.close()
+            self._sessions.discard(session)
+            writer.close()
+
+def run_server(host : str = DEFAULT_HOST, port : int = DEFAULT_PORT):
+    '''Runs a GameServer until Interrupted'''
+    server = GameServer(host, port)
+    print(f"Dungeon Dudes server listening on {host}:{port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("Server stopped")
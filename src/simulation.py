@@ -0,0 +1,193 @@
+'''
+Headless Combat Simulation for Dungeon Dudes
+Runs complete Encounters without the EncounterMenu, screen clears or input
+
+The simulated player drinks a Healing Potion when low and otherwise asks a
+SkillPolicy for a Skill before falling back to a plain Attack.  The default
+OffensiveSkillPolicy is a simple stand in for a person: it tries the newest
+Skill first, uses a Skill that only buffs, heals or summons once a fight,
+and never escapes.  It does not weigh one Skill against another, so results
+approximate real play rather than reproduce it.
+'''
+from random import Random
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Type
+from .characters import Character
+from .monsters import Monster
+from .combatant_abc import Combatant
+from .encounter import Encounter
+from .combat_action import CombatAction
+from .combat_log import CombatLog
+from .dd_data import NullPrint
+
+class FightResult(NamedTuple):
+    '''Structured Result of a Single Simulated Fight'''
+    character: str
+    monster: str
+    level: int
+    winner: str
+    turns: int
+    damage_dealt: Dict[str, int]
+    damage_taken: Dict[str, int]
+    potions_used: int
+    escaped: bool
+
+def build_character(char_class: Type[Character], level: int,
+                    name: str = "Simulant", rng: Random = None) -> Character:
+    '''Creates a Character at level with level appropriate Equipment'''
+    character: Character = char_class(name, rng)
+    character.printer = NullPrint()
+    while character.level < level:
+        character.gain_experience(character.experience_to_next
+                                  - character.experience_points, combat=True)
+    if character.level > 1:
+        character.equip(character.generate_weapon())
+        character.equip(character.generate_armor())
+        character.equip(character.generate_accessory())
+    character.hit_points = character.max_hit_points
+    character.special = character.max_special
+    return character
+
+def build_monster(monster_class: Type[Monster], level: int,
+                  rng: Random = None) -> Monster:
+    '''Creates a Monster at level that does not print'''
+    monster: Monster = monster_class(level, rng)
+    monster.printer = NullPrint()
+    return monster
+
+ESCAPE_SKILLS: frozenset = frozenset({"Blink"})
+
+class SkillPolicy:
+    '''Chooses a Skill for the Simulated Character's Turn; this base Policy never uses one'''
+    description: str = "attacks only, never uses Skills"
+
+    def choose(self, character: Character, # pylint: disable=unused-argument
+               monster: Combatant) -> Optional[list]:
+        '''Actions of the Skill used this Turn, None to Attack instead'''
+        return None
+
+class OffensiveSkillPolicy(SkillPolicy):
+    '''
+    Uses the newest Skill that succeeds, as its menu would on a player's
+    turn; Skills that deal no damage are used once a Fight and escapes never
+    '''
+    description: str = ("newest affordable Skill first, buffs and heals once a fight, "
+                        "no escapes")
+
+    def __init__(self):
+        self._spent: Set[str] = set()
+
+    def choose(self, character: Character, monster: Combatant) -> Optional[list]:
+        for name, skill in reversed(list(character.get_skills().items())):
+            if name in ESCAPE_SKILLS or name in self._spent:
+                continue
+            turn_over, action = skill()
+            if not turn_over:
+                continue
+            if not any(act[0] == "Attack" and act[1] for act in action.actions):
+                self._spent.add(name)
+            return action.actions
+        return None
+
+class Simulation:
+    '''Drives a single Encounter to completion without rendering'''
+    potion_threshold: float = 0.35
+
+    def __init__(self, encounter: Encounter, max_turns: int = 200,
+                 skill_policy: SkillPolicy = None):
+        self._encounter: Encounter = encounter
+        self._skill_policy: SkillPolicy = (skill_policy if skill_policy is not None
+                                           else OffensiveSkillPolicy())
+        self._encounter.printer = NullPrint()
+        self._max_turns: int = max_turns
+        self._turns: int = 0
+        self._escaped: bool = False
+        self._damage: Dict[int, Dict[str, int]] = {1: {}, 2: {}}
+        self._func_map: dict = {"Aura": encounter.parse_aura,
+                                "Hex": encounter.parse_hex,
+                                "Battle Cry": encounter.parse_battle_cry,
+                                "Identify": encounter.parse_identify}
+
+    def character_turn(self) -> List[Tuple[str, int, str, str]]:
+        '''Drinks a Healing Potion when low on Hit Points, else uses the Policy's Skill or Attacks'''
+        character: Character = self._encounter.combatant_1
+        if (character.healing_potion > 0 and character.hit_points
+                < character.max_hit_points * self.potion_threshold):
+            success, action = character.use_healing_potion()
+            if success:
+                return action.actions
+        actions: Optional[list] = self._skill_policy.choose(character,
+                                                            self._encounter.combatant_2)
+        if actions:
+            return actions
+        return character.attack().actions
+
+    def send_actions(self, actions: list, com_num: int) -> bool:
+        '''Parses Actions, Returns True if the Encounter is Over'''
+        encounter: Encounter = self._encounter
+        target: Combatant = (encounter.combatant_2 if com_num == 1
+                             else encounter.combatant_1)
+        encounter.next_turn(com_num)
+        if "Escape" in [action[0] for action in actions]:
+            for action in actions:
+                encounter.record_action(action, com_num)
+            self._escaped = True
+            return True
+        for action in actions:
+            if action[0] == "Heal":
+                encounter.parse_heal(action, com_num)
+                encounter.record_action(action, com_num)
+                continue
+            if action[0] != "Attack":
+                self._func_map[action[0]](action, com_num)
+                encounter.record_action(action, com_num)
+                continue
+            current: int = target.hit_points
+            encounter.parse_attack(action, com_num)
+            encounter.record_action(action, com_num)
+            dealt: int = max(0, current - target.hit_points)
+            dealt_by_type: Dict[str, int] = self._damage[com_num]
+            dealt_by_type[action[2]] = dealt_by_type.get(action[2], 0) + dealt
+            if not encounter.combatants_alive():
+                return True
+        return False
+
+    def run(self) -> FightResult:
+        '''Runs the Encounter until a Combatant Dies, Escapes or max_turns'''
+        encounter: Encounter = self._encounter
+        character: Character = encounter.combatant_1
+        monster: Combatant = encounter.combatant_2
+        potions: int = character.healing_potion
+        player_turn: bool = encounter.turn_order()
+        while self._turns < self._max_turns:
+            self._turns += 1
+            if player_turn:
+                over: bool = self.send_actions(self.character_turn(), 1)
+            else:
+                over: bool = self.send_actions(monster.take_turn().actions, 2)
+            if over:
+                break
+            player_turn = not player_turn
+        winner: str = ""
+        if not encounter.combatant_2_alive:
+            winner = "Character"
+        elif not encounter.combatant_1_alive:
+            winner = "Monster"
+        return FightResult(character.char_class, type(monster).__name__,
+                           character.level, winner, self._turns,
+                           self._damage[1], self._damage[2],
+                           max(0, potions - character.healing_potion),
+                           self._escaped)
+
+def simulate_fight(char_class: Type[Character], monster_class: Type[Monster],
+                   level: int, max_turns: int = 200, seed: int = None,
+                   log: CombatLog = None, skill_policy: SkillPolicy = None) -> FightResult:
+    '''
+    Simulates one fight between char_class and monster_class at level
+    The same seed always replays the same fight, log records it when given;
+    skill_policy defaults to a fresh OffensiveSkillPolicy
+    '''
+    rng = Random(seed)
+    character = build_character(char_class, level, rng=Random(rng.getrandbits(64)))
+    monster = build_monster(monster_class, level, Random(rng.getrandbits(64)))
+    encounter = Encounter(character, monster, seed=rng.getrandbits(64), log=log)
+    return Simulation(encounter, max_turns, skill_policy).run()
@@ -11,19 +11,33 @@ class Stats:
         self._intelligence : Tuple[int] = stats_structure["Intelligence"]
         self._max_special : Tuple[int] = stats_structure["Special"]
 
-    def level_up(self):
-        '''Increases Stats on Level up'''
-        self._max_hit_points : Tuple[int] = (self._max_hit_points[0] + self._max_hit_points[1],
+    @classmethod
+    def at_level(cls, stats_structure: dict, level: int) -> 'Stats':
+        '''Builds the Stat Block for level directly from (base, growth) pairs'''
+        stats = cls(stats_structure)
+        stats.level_up(level - 1)
+        return stats
+
+    def level_up(self, levels: int = 1):
+        '''Increases Stats on Level up, by levels at once in constant time'''
+        if levels <= 0:
+            return
+        self._max_hit_points : Tuple[int] = (self._max_hit_points[0] + self._max_hit_points[1] * levels,
                                        self._max_hit_points[1])
-        self._strength : Tuple[int] = (self._strength[0] + self._strength[1],
+        self._strength : Tuple[int] = (self._strength[0] + self._strength[1] * levels,
                                        self._strength[1])
-        self._agility : Tuple[int] = (self._agility[0] + self._agility[1],
+        self._agility : Tuple[int] = (self._agility[0] + self._agility[1] * levels,
                                        self._agility[1])
-        self._intelligence : Tuple[int] = (self._intelligence[0] + self._intelligence[1],
+        self._intelligence : Tuple[int] = (self._intelligence[0] + self._intelligence[1] * levels,
                                        self._intelligence[1])
-        self._max_special : Tuple[int] = (self._max_special[0] + self._max_special[1],
+        self._max_special : Tuple[int] = (self._max_special[0] + self._max_special[1] * levels,
                                         self._max_special[1])
 
+    def structure(self) -> dict:
+        '''Current (value, growth) pairs, Stats(structure()) rebuilds this block'''
+        return {"Hit Points": self._max_hit_points, "Strength": self._strength,
+                "Agility": self._agility, "Intelligence": self._intelligence,
+                "Special": self._max_special}
 
     @property
     def max_hit_points(self) -> int: